@@ -2,15 +2,22 @@ from __future__ import annotations
 
 import json
 import os
+import tempfile
 import time
 from pathlib import Path
 from typing import Any, cast
 
 from pydantic import BaseModel, Field
 
+from eidolon_v16 import tracing
 from eidolon_v16.json_canon import dumps_bytes
+from eidolon_v16.metrics import MetricsRegistry, ns_to_ms
 from eidolon_v16.ucr.canonical import canonical_json_bytes, sha256_bytes, sha256_canonical
 
+# Timer names; the reported keys add an ``_ms`` suffix on export.
+_STORE_COST_TIMERS = ("hash", "blob_write", "manifest")
+_MANIFEST_DETAIL_TIMERS = ("prepare", "hash", "serialize", "write", "fsync", "misc")
+
 
 class ArtifactRef(BaseModel):
     hash: str
@@ -60,34 +67,31 @@ class ArtifactStore:
         self._manifest_flush_mode = (
             os.getenv("EIDOLON_STORE_MANIFEST_FLUSH_MODE", "").strip() or "per_episode"
         )
-        self._store_costs = {"hash_ms": 0, "blob_write_ms": 0, "manifest_ms": 0}
-        self._manifest_detail = {
-            "prepare_ms": 0,
-            "hash_ms": 0,
-            "serialize_ms": 0,
-            "write_ms": 0,
-            "fsync_ms": 0,
-            "misc_ms": 0,
-        }
+        self._atomic_writes = False
+        # Store and manifest timers accumulate nanoseconds; the *_ms views
+        # below round the running totals, not each call.
+        self._metrics = MetricsRegistry()
 
     def store_costs_snapshot(self) -> dict[str, int]:
-        return dict(self._store_costs)
-
-    def store_costs_delta(self, start: dict[str, int]) -> dict[str, int]:
         return {
-            key: max(0, self._store_costs.get(key, 0) - start.get(key, 0))
-            for key in self._store_costs
+            f"{name}_ms": ns_to_ms(self._metrics.timer_stat(name).ns_sum)
+            for name in _STORE_COST_TIMERS
         }
 
-    def manifest_detail_snapshot(self) -> dict[str, int]:
-        return dict(self._manifest_detail)
+    def store_costs_delta(self, start: dict[str, int]) -> dict[str, int]:
+        current = self.store_costs_snapshot()
+        return {key: max(0, value - start.get(key, 0)) for key, value in current.items()}
 
-    def manifest_detail_delta(self, start: dict[str, int]) -> dict[str, int]:
+    def manifest_detail_snapshot(self) -> dict[str, int]:
         return {
-            key: max(0, self._manifest_detail.get(key, 0) - start.get(key, 0))
-            for key in self._manifest_detail
+            f"{name}_ms": ns_to_ms(self._metrics.timer_stat(f"manifest.{name}").ns_sum)
+            for name in _MANIFEST_DETAIL_TIMERS
         }
 
+    def manifest_detail_delta(self, start: dict[str, int]) -> dict[str, int]:
+        current = self.manifest_detail_snapshot()
+        return {key: max(0, value - start.get(key, 0)) for key, value in current.items()}
+
     def set_manifest_flush_mode(self, mode: str) -> None:
         normalized = mode.strip().lower()
         if normalized not in {"per_episode", "per_suite"}:
@@ -97,11 +101,19 @@ class ArtifactStore:
     def manifest_flush_mode(self) -> str:
         return self._manifest_flush_mode
 
-    def _record_cost(self, key: str, start: float) -> None:
-        elapsed_ms = int(round((time.perf_counter() - start) * 1000))
-        if elapsed_ms < 0:
-            elapsed_ms = 0
-        self._store_costs[key] = self._store_costs.get(key, 0) + elapsed_ms
+    def set_atomic_writes(self, enabled: bool) -> None:
+        """Make ``put_bytes`` write blobs and metadata through a temp file and
+        ``os.replace``, for stores that several processes write at once."""
+        self._atomic_writes = enabled
+
+    def _write_file(self, path: Path, data: bytes) -> None:
+        if self._atomic_writes:
+            _atomic_write_bytes(path, data)
+        else:
+            path.write_bytes(data)
+
+    def _record_cost(self, name: str, start_ns: int) -> None:
+        self._metrics.record_ns(name, time.perf_counter_ns() - start_ns)
 
     def _artifact_paths(self, content_hash: str) -> tuple[Path, Path]:
         subdir = self.root / "sha256" / content_hash[:2] / content_hash[2:4]
@@ -132,42 +144,27 @@ class ArtifactStore:
         self._manifest_cache = manifest
         return manifest
 
+    @tracing.traced("store.write_manifest", cat="store")
     def write_manifest(self, manifest: ArtifactManifest) -> None:
-        start = time.perf_counter()
-        detail_start_ns = time.monotonic_ns()
-        prepare_start_ns = time.monotonic_ns()
+        start_ns = time.perf_counter_ns()
         payload = manifest.model_dump(mode="json", by_alias=True)
-        prepare_ms = int(round((time.monotonic_ns() - prepare_start_ns) / 1_000_000))
-        if prepare_ms < 0:
-            prepare_ms = 0
-        hash_ms = 0
-        serialize_start_ns = time.monotonic_ns()
+        serialize_start_ns = time.perf_counter_ns()
         serialized = canonical_json_bytes(payload)
-        serialize_ms = int(round((time.monotonic_ns() - serialize_start_ns) / 1_000_000))
-        if serialize_ms < 0:
-            serialize_ms = 0
-        write_start_ns = time.monotonic_ns()
+        write_start_ns = time.perf_counter_ns()
         self.manifest_path.write_bytes(serialized)
-        write_ms = int(round((time.monotonic_ns() - write_start_ns) / 1_000_000))
-        if write_ms < 0:
-            write_ms = 0
-        fsync_ms = 0
-        total_ms = int(round((time.monotonic_ns() - detail_start_ns) / 1_000_000))
-        if total_ms < 0:
-            total_ms = 0
-        misc_ms = total_ms - (prepare_ms + hash_ms + serialize_ms + write_ms + fsync_ms)
-        if misc_ms < 0:
-            misc_ms = 0
-        self._manifest_detail["prepare_ms"] += prepare_ms
-        self._manifest_detail["hash_ms"] += hash_ms
-        self._manifest_detail["serialize_ms"] += serialize_ms
-        self._manifest_detail["write_ms"] += write_ms
-        self._manifest_detail["fsync_ms"] += fsync_ms
-        self._manifest_detail["misc_ms"] += misc_ms
-        self._record_cost("manifest_ms", start)
+        end_ns = time.perf_counter_ns()
+        metrics = self._metrics
+        metrics.record_ns("manifest.prepare", serialize_start_ns - start_ns)
+        metrics.record_ns("manifest.hash", 0)
+        metrics.record_ns("manifest.serialize", write_start_ns - serialize_start_ns)
+        metrics.record_ns("manifest.write", end_ns - write_start_ns)
+        metrics.record_ns("manifest.fsync", 0)
+        metrics.record_ns("manifest.misc", time.perf_counter_ns() - end_ns)
+        self._record_cost("manifest", start_ns)
         self._manifest_dirty = False
         self._manifest_cache = manifest
 
+    @tracing.traced("store.flush_manifest", cat="store")
     def flush_manifest(self, *, force: bool = False) -> dict[str, object]:
         if self._manifest_flush_mode == "per_suite" and not force:
             return {"total_ms": 0, "detail_ms": {}, "flush_count": 0}
@@ -197,6 +194,7 @@ class ArtifactStore:
                 detail_ms["manifest_misc_ms"] = 1
         return {"total_ms": total_ms, "detail_ms": detail_ms, "flush_count": 1}
 
+    @tracing.traced("store.put_bytes", cat="store")
     def put_bytes(
         self,
         data: bytes,
@@ -205,14 +203,26 @@ class ArtifactStore:
         media_type: str,
         producer: str,
         created_from: list[str] | None = None,
+        content_hash: str | None = None,
     ) -> ArtifactRef:
-        hash_start = time.perf_counter()
-        content_hash = sha256_bytes(data)
-        self._record_cost("hash_ms", hash_start)
+        if content_hash is None:
+            hash_start = time.perf_counter_ns()
+            content_hash = sha256_bytes(data)
+            self._record_cost("hash", hash_start)
+        elif __debug__:
+            # A caller-supplied hash names the blob on disk; a wrong one would
+            # silently corrupt the content-addressed store.
+            hash_start = time.perf_counter_ns()
+            actual_hash = sha256_bytes(data)
+            self._record_cost("hash", hash_start)
+            if actual_hash != content_hash:
+                raise ValueError(
+                    f"content_hash {content_hash} does not match data hash {actual_hash}"
+                )
         data_path, meta_path = self._artifact_paths(content_hash)
-        write_start = time.perf_counter()
+        write_start = time.perf_counter_ns()
         if not data_path.exists():
-            data_path.write_bytes(data)
+            self._write_file(data_path, data)
         created_from = created_from or []
         relpath = self._relpath_for(data_path)
         metadata = {
@@ -225,8 +235,8 @@ class ArtifactStore:
             "relpath": relpath,
             "path": str(data_path),
         }
-        meta_path.write_bytes(canonical_json_bytes(metadata))
-        self._record_cost("blob_write_ms", write_start)
+        self._write_file(meta_path, canonical_json_bytes(metadata))
+        self._record_cost("blob_write", write_start)
 
         manifest = self.load_manifest()
         entry = ManifestEntry(
@@ -252,6 +262,52 @@ class ArtifactStore:
             size=len(data),
         )
 
+    @tracing.traced("store.write_blob", cat="store")
+    def write_blob(
+        self,
+        data: bytes,
+        *,
+        artifact_type: str,
+        media_type: str,
+        producer: str,
+        created_from: list[str] | None = None,
+    ) -> ManifestEntry:
+        """Write ``data`` and its metadata atomically, leaving the manifest alone.
+
+        For stores shared by several processes that keep their own entry index;
+        readers never observe a partially written blob or metadata file.
+        """
+        hash_start = time.perf_counter_ns()
+        content_hash = sha256_bytes(data)
+        self._record_cost("hash", hash_start)
+        data_path, meta_path = self._artifact_paths(content_hash)
+        write_start = time.perf_counter_ns()
+        if not data_path.exists():
+            _atomic_write_bytes(data_path, data)
+        created_from = created_from or []
+        relpath = self._relpath_for(data_path)
+        metadata = {
+            "hash": content_hash,
+            "type": artifact_type,
+            "media_type": media_type,
+            "producer": producer,
+            "created_from": created_from,
+            "size": len(data),
+            "relpath": relpath,
+            "path": str(data_path),
+        }
+        _atomic_write_bytes(meta_path, canonical_json_bytes(metadata))
+        self._record_cost("blob_write", write_start)
+        return ManifestEntry(
+            hash=content_hash,
+            type=artifact_type,
+            media_type=media_type,
+            producer=producer,
+            created_from=created_from,
+            size=len(data),
+            relpath=relpath,
+        )
+
     def put_json(
         self,
         payload: Any,
@@ -317,3 +373,14 @@ class ArtifactStore:
     def get_bytes(self, ref: ArtifactRef) -> bytes:
         data_path, _meta_path = self._artifact_paths(ref.hash)
         return data_path.read_bytes()
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
@@ -1,47 +1,98 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Literal
+from dataclasses import dataclass, field
+from typing import Any, ClassVar, Literal, TypeVar, cast
 
 from eidolon_v16.bvps.types import TypeName
 
 BinOpName = Literal["add", "sub", "mul", "mod", "lt", "gt", "eq"]
 
 
+@dataclass(frozen=True, slots=True)
+class NodeMeta:
+    """Facts about an interned node, computed once from its children's metadata."""
+
+    uid: int
+    depth: int
+    size: int
+    has_macro: bool
+    key: tuple[Any, ...]
+    hash: int
+    owner: object = field(repr=False, compare=False)
+
+
 class Expr:
+    __slots__ = ()
+
+    __match_args__: ClassVar[tuple[str, ...]]
+    _meta: NodeMeta | None
+
     def to_dict(self) -> dict[str, Any]:
         raise NotImplementedError
 
+    def _fields(self) -> tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self.__match_args__)
 
-@dataclass(frozen=True)
+    def _cached_hash(self) -> int:
+        meta = self._meta
+        if meta is not None:
+            return meta.hash
+        return hash((type(self), self._fields()))
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Rebuild through the constructor so interning metadata never crosses
+        # process boundaries.
+        return (type(self), self._fields())
+
+
+_E = TypeVar("_E", bound=Expr)
+
+
+def _meta_field() -> Any:
+    return field(default=None, init=False, repr=False, compare=False)
+
+
+@dataclass(frozen=True, slots=True)
 class IntConst(Expr):
     value: int
+    _meta: NodeMeta | None = _meta_field()
+
+    __hash__ = Expr._cached_hash
 
     def to_dict(self) -> dict[str, Any]:
         return {"type": "int_const", "value": self.value}
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BoolConst(Expr):
     value: bool
+    _meta: NodeMeta | None = _meta_field()
+
+    __hash__ = Expr._cached_hash
 
     def to_dict(self) -> dict[str, Any]:
         return {"type": "bool_const", "value": self.value}
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Var(Expr):
     name: str
+    _meta: NodeMeta | None = _meta_field()
+
+    __hash__ = Expr._cached_hash
 
     def to_dict(self) -> dict[str, Any]:
         return {"type": "var", "name": self.name}
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BinOp(Expr):
     op: BinOpName
     left: Expr
     right: Expr
+    _meta: NodeMeta | None = _meta_field()
+
+    __hash__ = Expr._cached_hash
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -52,11 +103,14 @@ class BinOp(Expr):
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IfThenElse(Expr):
     cond: Expr
     then_expr: Expr
     else_expr: Expr
+    _meta: NodeMeta | None = _meta_field()
+
+    __hash__ = Expr._cached_hash
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -81,10 +135,13 @@ class Program:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MacroCall(Expr):
     name: str
     args: tuple[Expr, ...] = ()
+    _meta: NodeMeta | None = _meta_field()
+
+    __hash__ = Expr._cached_hash
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -158,6 +215,9 @@ def expr_to_str(expr: Expr) -> str:
 
 
 def expr_depth(expr: Expr) -> int:
+    meta = expr._meta
+    if meta is not None:
+        return meta.depth
     if isinstance(expr, (IntConst, BoolConst, Var)):
         return 0
     if isinstance(expr, BinOp):
@@ -173,6 +233,158 @@ def expr_depth(expr: Expr) -> int:
     raise ValueError("unknown expr")
 
 
+def expr_size(expr: Expr) -> int:
+    meta = expr._meta
+    if meta is not None:
+        return meta.size
+    if isinstance(expr, (IntConst, BoolConst, Var)):
+        return 1
+    if isinstance(expr, BinOp):
+        return 1 + expr_size(expr.left) + expr_size(expr.right)
+    if isinstance(expr, IfThenElse):
+        return 1 + expr_size(expr.cond) + expr_size(expr.then_expr) + expr_size(expr.else_expr)
+    if isinstance(expr, MacroCall):
+        return 1 + sum(expr_size(arg) for arg in expr.args)
+    raise ValueError("unknown expr")
+
+
+class ExprInterner:
+    """Hash-consing factory: one shared instance per structurally equal subtree.
+
+    Interned nodes carry a ``NodeMeta`` with their depth, size, whether they
+    contain a macro call, canonical key and hash, so those are never
+    recomputed by walking the tree, and two interned nodes are equal exactly
+    when they are the same object. Depth follows ``expr_depth`` (macro calls
+    count as leaves). The interner keeps every node it has built alive; scope
+    one to a single enumeration.
+    """
+
+    def __init__(self) -> None:
+        self._table: dict[tuple[Any, ...], Expr] = {}
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def _make(
+        self,
+        key: tuple[Any, ...],
+        depth: int,
+        size: int,
+        has_macro: bool,
+        cls: type[_E],
+        *fields: Any,
+    ) -> _E:
+        cached = self._table.get(key)
+        if cached is not None:
+            return cast(_E, cached)
+        node = cls(*fields)
+        # Same formula as Expr._cached_hash, so interned and plain nodes that
+        # compare equal also hash equal; children contribute cached hashes.
+        meta = NodeMeta(
+            uid=len(self._table),
+            depth=depth,
+            size=size,
+            has_macro=has_macro,
+            key=key,
+            hash=hash((cls, fields)),
+            owner=self,
+        )
+        object.__setattr__(node, "_meta", meta)
+        self._table[key] = node
+        return node
+
+    def int_const(self, value: int) -> IntConst:
+        return self._make(("int", value), 0, 1, False, IntConst, value)
+
+    def bool_const(self, value: bool) -> BoolConst:
+        return self._make(("bool", value), 0, 1, False, BoolConst, value)
+
+    def var(self, name: str) -> Var:
+        return self._make(("var", name), 0, 1, False, Var, name)
+
+    def binop(self, op: BinOpName, left: Expr, right: Expr) -> BinOp:
+        left = self._own(left)
+        right = self._own(right)
+        left_meta = self._meta_of(left)
+        right_meta = self._meta_of(right)
+        return self._make(
+            ("binop", op, left_meta.uid, right_meta.uid),
+            1 + max(left_meta.depth, right_meta.depth),
+            1 + left_meta.size + right_meta.size,
+            left_meta.has_macro or right_meta.has_macro,
+            BinOp,
+            op,
+            left,
+            right,
+        )
+
+    def if_then_else(self, cond: Expr, then_expr: Expr, else_expr: Expr) -> IfThenElse:
+        cond = self._own(cond)
+        then_expr = self._own(then_expr)
+        else_expr = self._own(else_expr)
+        cond_meta = self._meta_of(cond)
+        then_meta = self._meta_of(then_expr)
+        else_meta = self._meta_of(else_expr)
+        return self._make(
+            ("if", cond_meta.uid, then_meta.uid, else_meta.uid),
+            1 + max(cond_meta.depth, then_meta.depth, else_meta.depth),
+            1 + cond_meta.size + then_meta.size + else_meta.size,
+            cond_meta.has_macro or then_meta.has_macro or else_meta.has_macro,
+            IfThenElse,
+            cond,
+            then_expr,
+            else_expr,
+        )
+
+    def macro_call(self, name: str, args: tuple[Expr, ...] = ()) -> MacroCall:
+        args = tuple(self._own(arg) for arg in args)
+        metas = [self._meta_of(arg) for arg in args]
+        return self._make(
+            ("macro", name, *(meta.uid for meta in metas)),
+            0,
+            1 + sum(meta.size for meta in metas),
+            True,
+            MacroCall,
+            name,
+            args,
+        )
+
+    def intern(self, expr: Expr) -> Expr:
+        """Return the shared instance structurally equal to ``expr``."""
+        meta = expr._meta
+        if meta is not None and meta.owner is self:
+            return expr
+        if isinstance(expr, IntConst):
+            return self.int_const(expr.value)
+        if isinstance(expr, BoolConst):
+            return self.bool_const(expr.value)
+        if isinstance(expr, Var):
+            return self.var(expr.name)
+        if isinstance(expr, BinOp):
+            return self.binop(expr.op, self.intern(expr.left), self.intern(expr.right))
+        if isinstance(expr, IfThenElse):
+            return self.if_then_else(
+                self.intern(expr.cond),
+                self.intern(expr.then_expr),
+                self.intern(expr.else_expr),
+            )
+        if isinstance(expr, MacroCall):
+            return self.macro_call(expr.name, tuple(self.intern(arg) for arg in expr.args))
+        raise ValueError("unknown expr")
+
+    def _own(self, expr: Expr) -> Expr:
+        meta = expr._meta
+        if meta is not None and meta.owner is self:
+            return expr
+        return self.intern(expr)
+
+    @staticmethod
+    def _meta_of(expr: Expr) -> NodeMeta:
+        meta = expr._meta
+        assert meta is not None
+        return meta
+
+
 def _parse_type(raw: Any) -> TypeName:
     text = str(raw or "").strip()
     if text in {"Int", "int"}:
@@ -4,12 +4,17 @@ import threading
 import time
 import json
 import os
-from dataclasses import dataclass
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 from eidolon_v16.artifacts.store import ArtifactStore
+from eidolon_v16.bvps.persist_index import PersistIndex
+from eidolon_v16.bvps.types import Spec
 from eidolon_v16.json_canon import dumps_bytes
+from eidolon_v16.metrics import MetricsRegistry, ns_to_us
 from eidolon_v16.ucr.canonical import sha256_canonical
 
 
@@ -18,26 +23,15 @@ class BvpsPreloadStats:
     preload_ms: int
     entries: int
     errors: int
+    snapshot_entries: int = 0
+    lazy_entries: int = 0
 
 
 @dataclass
 class BvpsPersistStats:
     enabled: bool = False
     persist_dir: str = ""
-    lookups: int = 0
-    reads: int = 0
-    writes: int = 0
-    bytes_read: int = 0
-    bytes_written: int = 0
-    errors: int = 0
-    lookup_ns_sum: int = 0
-    lookup_ns_max: int = 0
-    read_ns_sum: int = 0
-    read_ns_max: int = 0
-    write_ns_sum: int = 0
-    write_ns_max: int = 0
-    preload_ns_sum: int = 0
-    preload_ns_max: int = 0
+    metrics: MetricsRegistry = field(default_factory=MetricsRegistry)
 
 
 _TOUCHED_PERSIST_DIRS: set[str] = set()
@@ -48,6 +42,11 @@ _PERSIST_STORE: ArtifactStore | None = None
 _PERSIST_STATS = BvpsPersistStats()
 _PERSIST_DISABLE_REASON = ""
 _PERSIST_ENV_STATE: str | None = None
+_INDEX_LOCK = threading.Lock()
+SNAPSHOT_FILENAME = "preload_snapshot.json"
+_PERSIST_TIMERS = ("lookup", "read", "write", "preload")
+_SNAPSHOT_VERSION = 1
+_PERSIST_INDEXES: dict[str, PersistIndex] = {}
 
 
 def persist_dir() -> str:
@@ -112,7 +111,7 @@ def _ensure_persist_initialized() -> None:
             Path(dir_path).mkdir(parents=True, exist_ok=True)
         except OSError:
             _PERSIST_STATS.enabled = False
-            _PERSIST_STATS.errors += 1
+            _PERSIST_STATS.metrics.incr("errors")
             _PERSIST_DISABLE_REASON = "mkdir_failed"
             return
         if _PERSIST_STORE is None or _PERSIST_DIR != dir_path:
@@ -121,7 +120,7 @@ def _ensure_persist_initialized() -> None:
                 _PERSIST_STORE = ArtifactStore(Path(dir_path))
             except Exception:
                 _PERSIST_STATS.enabled = False
-                _PERSIST_STATS.errors += 1
+                _PERSIST_STATS.metrics.incr("errors")
                 _PERSIST_DISABLE_REASON = "init_failed"
                 return
         _PERSIST_STATS.enabled = True
@@ -149,57 +148,27 @@ def persist_store() -> ArtifactStore:
 def persist_stats_snapshot() -> dict[str, Any]:
     _ensure_persist_initialized()
     with _PERSIST_LOCK:
-        lookup_us_sum = int((_PERSIST_STATS.lookup_ns_sum + 999) // 1000)
-        lookup_us_max = int((_PERSIST_STATS.lookup_ns_max + 999) // 1000)
-        read_us_sum = int((_PERSIST_STATS.read_ns_sum + 999) // 1000)
-        read_us_max = int((_PERSIST_STATS.read_ns_max + 999) // 1000)
-        write_us_sum = int((_PERSIST_STATS.write_ns_sum + 999) // 1000)
-        write_us_max = int((_PERSIST_STATS.write_ns_max + 999) // 1000)
-        preload_us_sum = int((_PERSIST_STATS.preload_ns_sum + 999) // 1000)
-        preload_us_max = int((_PERSIST_STATS.preload_ns_max + 999) // 1000)
-        lookup_ms_sum = int(lookup_us_sum // 1000)
-        lookup_ms_max = int(lookup_us_max // 1000)
-        read_ms_sum = int(read_us_sum // 1000)
-        read_ms_max = int(read_us_max // 1000)
-        write_ms_sum = int(write_us_sum // 1000)
-        write_ms_max = int(write_us_max // 1000)
-        preload_ms_sum = int(preload_us_sum // 1000)
-        preload_ms_max = int(preload_us_max // 1000)
-        return {
+        metrics = _PERSIST_STATS.metrics
+        snapshot: dict[str, Any] = {
             "bvps_persist_enabled": bool(_PERSIST_STATS.enabled),
             "bvps_persist_dir": _PERSIST_STATS.persist_dir,
-            "bvps_persist_lookups": _PERSIST_STATS.lookups,
-            "bvps_persist_reads": _PERSIST_STATS.reads,
-            "bvps_persist_writes": _PERSIST_STATS.writes,
-            "bvps_persist_bytes_read": _PERSIST_STATS.bytes_read,
-            "bvps_persist_bytes_written": _PERSIST_STATS.bytes_written,
-            "bvps_persist_errors": _PERSIST_STATS.errors,
-            "bvps_persist_lookup_ns_sum": _PERSIST_STATS.lookup_ns_sum,
-            "bvps_persist_lookup_ns_max": _PERSIST_STATS.lookup_ns_max,
-            "bvps_persist_read_ns_sum": _PERSIST_STATS.read_ns_sum,
-            "bvps_persist_read_ns_max": _PERSIST_STATS.read_ns_max,
-            "bvps_persist_write_ns_sum": _PERSIST_STATS.write_ns_sum,
-            "bvps_persist_write_ns_max": _PERSIST_STATS.write_ns_max,
-            "bvps_persist_preload_ns_sum": _PERSIST_STATS.preload_ns_sum,
-            "bvps_persist_preload_ns_max": _PERSIST_STATS.preload_ns_max,
-            "bvps_persist_lookup_us_sum": lookup_us_sum,
-            "bvps_persist_lookup_us_max": lookup_us_max,
-            "bvps_persist_read_us_sum": read_us_sum,
-            "bvps_persist_read_us_max": read_us_max,
-            "bvps_persist_write_us_sum": write_us_sum,
-            "bvps_persist_write_us_max": write_us_max,
-            "bvps_persist_preload_us_sum": preload_us_sum,
-            "bvps_persist_preload_us_max": preload_us_max,
-            "bvps_persist_lookup_ms_sum": lookup_ms_sum,
-            "bvps_persist_lookup_ms_max": lookup_ms_max,
-            "bvps_persist_read_ms_sum": read_ms_sum,
-            "bvps_persist_read_ms_max": read_ms_max,
-            "bvps_persist_write_ms_sum": write_ms_sum,
-            "bvps_persist_write_ms_max": write_ms_max,
-            "bvps_persist_preload_ms": preload_ms_sum,
-            "bvps_persist_preload_ms_max": preload_ms_max,
-            "bvps_persist_disable_reason": _PERSIST_DISABLE_REASON,
         }
+        for name in ("lookups", "reads", "writes", "bytes_read", "bytes_written", "errors"):
+            snapshot[f"bvps_persist_{name}"] = metrics.counter(name)
+        timers = {name: metrics.timer_stat(name) for name in _PERSIST_TIMERS}
+        for name, stat in timers.items():
+            snapshot[f"bvps_persist_{name}_ns_sum"] = stat.ns_sum
+            snapshot[f"bvps_persist_{name}_ns_max"] = stat.ns_max
+        for name, stat in timers.items():
+            snapshot[f"bvps_persist_{name}_us_sum"] = ns_to_us(stat.ns_sum)
+            snapshot[f"bvps_persist_{name}_us_max"] = ns_to_us(stat.ns_max)
+        for name, stat in timers.items():
+            # Whole milliseconds of the microsecond-rounded value, as before.
+            sum_key = "preload_ms" if name == "preload" else f"{name}_ms_sum"
+            snapshot[f"bvps_persist_{sum_key}"] = ns_to_us(stat.ns_sum) // 1000
+            snapshot[f"bvps_persist_{name}_ms_max"] = ns_to_us(stat.ns_max) // 1000
+        snapshot["bvps_persist_disable_reason"] = _PERSIST_DISABLE_REASON
+        return snapshot
 
 
 def reset_persist_stats() -> None:
@@ -207,78 +176,65 @@ def reset_persist_stats() -> None:
     with _PERSIST_LOCK:
         _PERSIST_STATS.enabled = False
         _PERSIST_STATS.persist_dir = ""
-        _PERSIST_STATS.lookups = 0
-        _PERSIST_STATS.reads = 0
-        _PERSIST_STATS.writes = 0
-        _PERSIST_STATS.bytes_read = 0
-        _PERSIST_STATS.bytes_written = 0
-        _PERSIST_STATS.errors = 0
-        _PERSIST_STATS.lookup_ns_sum = 0
-        _PERSIST_STATS.lookup_ns_max = 0
-        _PERSIST_STATS.read_ns_sum = 0
-        _PERSIST_STATS.read_ns_max = 0
-        _PERSIST_STATS.write_ns_sum = 0
-        _PERSIST_STATS.write_ns_max = 0
-        _PERSIST_STATS.preload_ns_sum = 0
-        _PERSIST_STATS.preload_ns_max = 0
+        _PERSIST_STATS.metrics.reset()
         _PERSIST_DISABLE_REASON = ""
         _PERSIST_DIR = None
         _PERSIST_STORE = None
         _PERSIST_ENV_STATE = None
 
 
-def _record_lookup() -> None:
-    with _PERSIST_LOCK:
-        _PERSIST_STATS.lookups += 1
-
-
 def record_persist_lookup() -> None:
-    _record_lookup()
+    _PERSIST_STATS.metrics.incr("lookups")
 
 
 def record_persist_lookup_ms(ms: int) -> None:
-    _record_lookup_ns(ms * 1_000_000)
+    _PERSIST_STATS.metrics.record_ns("lookup", ms * 1_000_000)
 
 
 def record_persist_lookup_us(us: int) -> None:
-    _record_lookup_ns(us * 1000)
-
-
-def _record_lookup_ns(ns: int) -> None:
-    value = max(0, ns)
-    with _PERSIST_LOCK:
-        _PERSIST_STATS.lookup_ns_sum += value
-        if value > _PERSIST_STATS.lookup_ns_max:
-            _PERSIST_STATS.lookup_ns_max = value
+    _PERSIST_STATS.metrics.record_ns("lookup", us * 1000)
 
 
 def _record_read(size: int, ns: int) -> None:
-    with _PERSIST_LOCK:
-        _PERSIST_STATS.reads += 1
-        _PERSIST_STATS.bytes_read += max(0, size)
-        _PERSIST_STATS.read_ns_sum += max(0, ns)
-        if ns > _PERSIST_STATS.read_ns_max:
-            _PERSIST_STATS.read_ns_max = ns
+    metrics = _PERSIST_STATS.metrics
+    metrics.incr("reads")
+    metrics.incr("bytes_read", max(0, size))
+    metrics.record_ns("read", ns)
 
 
 def _record_write(size: int, ns: int) -> None:
-    with _PERSIST_LOCK:
-        _PERSIST_STATS.writes += 1
-        _PERSIST_STATS.bytes_written += max(0, size)
-        _PERSIST_STATS.write_ns_sum += max(0, ns)
-        if ns > _PERSIST_STATS.write_ns_max:
-            _PERSIST_STATS.write_ns_max = ns
+    metrics = _PERSIST_STATS.metrics
+    metrics.incr("writes")
+    metrics.incr("bytes_written", max(0, size))
+    metrics.record_ns("write", ns)
 
 
 def _record_error() -> None:
-    with _PERSIST_LOCK:
-        _PERSIST_STATS.errors += 1
+    _PERSIST_STATS.metrics.incr("errors")
 
 
 def bvps_cache_key_string(spec_hash: str, macros_hash: str, attempt: int) -> str:
     return f"{spec_hash}:{macros_hash}:{attempt}"
 
 
+def spec_semantic_key(spec: Spec) -> str | None:
+    """Input signature, output type and oracle hash; ``None`` without an oracle.
+
+    Specs that share this key ask for the same function whatever their name,
+    examples, bounds, macros or attempt, so a program or counterexample found
+    for one is worth re-checking against the other.
+    """
+    if spec.oracle is None:
+        return None
+    return sha256_canonical(
+        {
+            "inputs": [[item.name, item.type] for item in spec.inputs],
+            "output": spec.output,
+            "oracle": sha256_canonical(spec.oracle),
+        }
+    )
+
+
 def read_persistent_payload(store: ArtifactStore, content_hash: str) -> dict[str, Any]:
     try:
         start_ns = time.perf_counter_ns()
@@ -291,11 +247,18 @@ def read_persistent_payload(store: ArtifactStore, content_hash: str) -> dict[str
         raise
 
 
+def persist_index(store: ArtifactStore) -> PersistIndex:
+    root = str(store.root.resolve())
+    with _INDEX_LOCK:
+        index = _PERSIST_INDEXES.get(root)
+        if index is None or not index.db_path.exists():
+            index = PersistIndex(store.root)
+            _PERSIST_INDEXES[root] = index
+        return index
+
+
 def iter_persistent_entries(store: ArtifactStore) -> list[Any]:
-    manifest = store.load_manifest()
-    entries = [entry for entry in manifest.entries if entry.type == "bvps_program_cache"]
-    entries.sort(key=lambda entry: entry.hash)
-    return entries
+    return persist_index(store).entries("bvps_program_cache")
 
 
 def parse_bvps_cache_payload(
@@ -332,37 +295,244 @@ def parse_bvps_cache_payload(
     return (spec_hash, macros_hash, attempt), expected_key, record
 
 
+class LazyPersistCache(dict[tuple[str, str, int], dict[str, Any]]):
+    """Preloaded BVPS cache that reads a record from the store on first access.
+
+    ``pending`` maps cache keys to the entry hashes that may hold them, in
+    the order an eager preload would try them. ``snapshot`` holds the items
+    last written to the snapshot; every entry read on demand is added to it
+    by ``flush_snapshot``.
+    """
+
+    def __init__(
+        self,
+        store: ArtifactStore,
+        records: dict[tuple[str, str, int], dict[str, Any]],
+        pending: dict[tuple[str, str, int], list[str]],
+        snapshot: dict[str, _PreloadItem] | None = None,
+    ) -> None:
+        super().__init__(records)
+        self._store = store
+        self._pending = pending
+        self._snapshot = dict(snapshot or {})
+        self._hydrated: dict[str, _PreloadItem] = {}
+        self._lock = threading.Lock()
+
+    def _hydrate(self, key: object) -> None:
+        with self._lock:
+            hashes = self._pending.pop(key, None)  # type: ignore[call-overload]
+        if not hashes or dict.__contains__(self, key):
+            return
+        for entry_hash in hashes:
+            loaded = _load_persistent_record(self._store, entry_hash)
+            with self._lock:
+                self._hydrated[entry_hash] = loaded
+            if loaded is not None and loaded[0] == key:
+                dict.setdefault(self, loaded[0], loaded[1])
+                return
+
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    def flush_snapshot(self) -> int:
+        """Rewrite the snapshot with the entries read since the last flush.
+
+        Returns how many entries were added, so the next preload takes them
+        from the snapshot instead of reading their blobs again.
+        """
+        with self._lock:
+            added = {
+                entry_hash: item
+                for entry_hash, item in self._hydrated.items()
+                if entry_hash not in self._snapshot
+            }
+            self._hydrated.clear()
+            if not added:
+                return 0
+            self._snapshot.update(added)
+            items = dict(self._snapshot)
+        _write_snapshot(self._store, items)
+        return len(added)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        self._hydrate(key)
+        return super().get(key, default)
+
+    def __getitem__(self, key: tuple[str, str, int]) -> dict[str, Any]:
+        self._hydrate(key)
+        return super().__getitem__(key)
+
+    def __contains__(self, key: object) -> bool:
+        self._hydrate(key)
+        return super().__contains__(key)
+
+
+def preload_workers() -> int:
+    raw = os.getenv("EIDOLON_BVPS_PRELOAD_WORKERS", "").strip()
+    if not raw:
+        return min(8, os.cpu_count() or 1)
+    try:
+        return max(1, int(raw))
+    except ValueError as exc:
+        raise ValueError("EIDOLON_BVPS_PRELOAD_WORKERS must be an int") from exc
+
+
 def preload_persistent_cache(
     store: ArtifactStore,
+    *,
+    workers: int | None = None,
+    lazy: bool = False,
 ) -> tuple[dict[tuple[str, str, int], dict[str, Any]], BvpsPreloadStats]:
+    """Load every persisted BVPS record, keyed like the controller's memory cache.
+
+    Records already in the consolidated snapshot (``SNAPSHOT_FILENAME``) are
+    taken from it without reading or re-hashing their blobs; the rest are
+    read by ``workers`` threads and the snapshot is rewritten. With ``lazy``,
+    entries outside the snapshot are only read when their key is first
+    looked up. Either way, the first entry (by hash) that parses to a key
+    wins, as in a sequential read.
+    """
     start = time.perf_counter()
     start_ns = time.perf_counter_ns()
+    entries = iter_persistent_entries(store)
+    snapshot = _read_snapshot(store)
+    snapshot_hits = [entry for entry in entries if entry.hash in snapshot]
+    missing = [entry for entry in entries if entry.hash not in snapshot]
+    pending: dict[tuple[str, str, int], list[str]] = {}
+    if lazy:
+        unkeyed = []
+        for entry in missing:
+            key = _cache_key_from_created_from(entry.created_from)
+            if key is None:
+                unkeyed.append(entry)
+            else:
+                pending.setdefault(key, []).append(entry.hash)
+        missing = unkeyed
+    loaded = dict(
+        zip(
+            (entry.hash for entry in missing),
+            _load_records(store, missing, workers),
+            strict=True,
+        )
+    )
+    merged = {entry.hash: snapshot[entry.hash] for entry in snapshot_hits}
+    merged.update(loaded)
     errors = 0
-    cache: dict[tuple[str, str, int], dict[str, Any]] = {}
-    for entry in iter_persistent_entries(store):
-        payload = read_persistent_payload(store, entry.hash)
-        parsed = parse_bvps_cache_payload(payload)
-        if parsed is None:
+    records: dict[tuple[str, str, int], dict[str, Any]] = {}
+    winners: dict[tuple[str, str, int], str] = {}
+    for entry in entries:
+        if entry.hash not in merged:
+            continue
+        item = merged[entry.hash]
+        if item is None:
             errors += 1
             continue
-        key, _cache_key, record = parsed
-        cache.setdefault(key, record)
+        key, record = item
+        if key not in records:
+            records[key] = record
+            winners[key] = entry.hash
+    for key, winner in winners.items():
+        hashes = pending.pop(key, None)
+        earlier = [entry_hash for entry_hash in hashes or [] if entry_hash < winner]
+        if earlier:
+            # An unread entry sorts first and wins if it parses to this key;
+            # the snapshot winner is only the fallback.
+            pending[key] = earlier + [winner]
+            del records[key]
+    snapshot_items = {entry.hash: merged[entry.hash] for entry in entries if entry.hash in merged}
+    if loaded or len(snapshot_hits) != len(snapshot):
+        _write_snapshot(store, snapshot_items)
+    cache: dict[tuple[str, str, int], dict[str, Any]]
+    cache = LazyPersistCache(store, records, pending, snapshot_items) if lazy else records
     preload_ms = int((time.perf_counter() - start) * 1000)
     if preload_ms < 0:
         preload_ms = 0
     if preload_ms == 0 and cache:
         preload_ms = 1
-    stats = BvpsPreloadStats(preload_ms=preload_ms, entries=len(cache), errors=errors)
-    preload_ns_sum = time.perf_counter_ns() - start_ns
-    if preload_ns_sum < 0:
-        preload_ns_sum = 0
-    with _PERSIST_LOCK:
-        _PERSIST_STATS.preload_ns_sum += preload_ns_sum
-        if preload_ns_sum > _PERSIST_STATS.preload_ns_max:
-            _PERSIST_STATS.preload_ns_max = preload_ns_sum
+    stats = BvpsPreloadStats(
+        preload_ms=preload_ms,
+        entries=len(records) + len(pending),
+        errors=errors,
+        snapshot_entries=len(snapshot_hits),
+        lazy_entries=len(pending),
+    )
+    _PERSIST_STATS.metrics.record_ns("preload", time.perf_counter_ns() - start_ns)
     return cache, stats
 
 
+_PreloadItem = tuple[tuple[str, str, int], dict[str, Any]] | None
+
+
+def _load_persistent_record(store: ArtifactStore, entry_hash: str) -> _PreloadItem:
+    payload = read_persistent_payload(store, entry_hash)
+    parsed = parse_bvps_cache_payload(payload)
+    if parsed is None:
+        return None
+    key, _cache_key, record = parsed
+    return key, record
+
+
+def _load_records(
+    store: ArtifactStore, entries: list[Any], workers: int | None
+) -> list[_PreloadItem]:
+    hashes = [entry.hash for entry in entries]
+    workers = preload_workers() if workers is None else max(1, workers)
+    if workers == 1 or len(hashes) < 2:
+        return [_load_persistent_record(store, entry_hash) for entry_hash in hashes]
+    with ThreadPoolExecutor(max_workers=min(workers, len(hashes))) as pool:
+        return list(pool.map(lambda entry_hash: _load_persistent_record(store, entry_hash), hashes))
+
+
+def _cache_key_from_created_from(created_from: list[str]) -> tuple[str, str, int] | None:
+    for item in created_from:
+        parts = item.rsplit(":", 2)
+        if len(parts) == 3 and all(parts) and parts[2].isdigit():
+            return parts[0], parts[1], int(parts[2])
+    return None
+
+
+def _read_snapshot(store: ArtifactStore) -> dict[str, _PreloadItem]:
+    try:
+        payload = json.loads((store.root / SNAPSHOT_FILENAME).read_bytes())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(payload, dict) or payload.get("version") != _SNAPSHOT_VERSION:
+        return {}
+    snapshot: dict[str, _PreloadItem] = {}
+    for item in payload.get("records", []):
+        try:
+            if item.get("key") is None:
+                snapshot[str(item["hash"])] = None
+                continue
+            spec_hash, macros_hash, attempt = item["key"]
+            key = (str(spec_hash), str(macros_hash), int(attempt))
+            snapshot[str(item["hash"])] = (key, dict(item["record"]))
+        except (AttributeError, KeyError, TypeError, ValueError):
+            return {}
+    return snapshot
+
+
+def _write_snapshot(store: ArtifactStore, items: dict[str, _PreloadItem]) -> None:
+    records: list[dict[str, Any]] = []
+    for entry_hash, item in sorted(items.items()):
+        if item is None:
+            records.append({"hash": entry_hash, "key": None, "record": None})
+        else:
+            records.append({"hash": entry_hash, "key": list(item[0]), "record": item[1]})
+    data = dumps_bytes({"version": _SNAPSHOT_VERSION, "records": records})
+    try:
+        fd, tmp_name = tempfile.mkstemp(dir=store.root, prefix=".tmp-", suffix=".json")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(data)
+            os.replace(tmp_name, store.root / SNAPSHOT_FILENAME)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+    except OSError:
+        _record_error()
+
+
 def write_persistent_payload(
     store: ArtifactStore, payload: dict[str, Any], created_from: list[str]
 ) -> None:
@@ -373,13 +543,14 @@ def write_persistent_payload(
         if encode_ns < 0:
             encode_ns = 0
         write_start_ns = time.perf_counter_ns()
-        store.put_json_bytes(
-            payload,
+        entry = store.write_blob(
             encoded,
             artifact_type="bvps_program_cache",
+            media_type="application/json",
             producer="bvps",
             created_from=created_from,
         )
+        persist_index(store).add(entry)
         write_ns = time.perf_counter_ns() - write_start_ns
         if write_ns < 0:
             write_ns = 0
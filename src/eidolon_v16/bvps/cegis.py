@@ -6,11 +6,19 @@ import time
 from dataclasses import dataclass
 from typing import Any
 
+from eidolon_v16 import metrics, tracing
 from eidolon_v16.bvps import ast as bvps_ast
 from eidolon_v16.bvps import enumerate as bvps_enumerate
+from eidolon_v16.bvps.cex_bank import (
+    CounterexampleBank,
+    counterexample_bank_from_env,
+    counterexample_bank_key,
+    example_key,
+)
 from eidolon_v16.bvps.interp import Interpreter
+from eidolon_v16.bvps.simplify import Simplifier
 from eidolon_v16.bvps.types import Example, Spec, TypeName, Value, spec_from_dict
-from eidolon_v16.language.apply import expand_program
+from eidolon_v16.language.apply import compile_macros, expand_program
 from eidolon_v16.language.spec import MacroTemplate
 
 
@@ -44,6 +52,7 @@ class SynthesisProfile:
     cegis_iters: int
 
 
+@metrics.timed("bvps.synthesize")
 def synthesize(
     spec: Spec,
     seed: int | None = None,
@@ -53,18 +62,40 @@ def synthesize(
     total_start = time.perf_counter()
     rng_seed = _resolve_seed(spec, seed)
     interpreter = Interpreter(step_budget=spec.bounds.step_budget)
-    examples = _prepare_examples(spec, interpreter)
+    bank = counterexample_bank_from_env()
+    bank_key = counterexample_bank_key(spec) if bank is not None else None
+    banked = bank.load(bank_key) if bank is not None and bank_key is not None else []
+    examples = _prepare_examples(spec, interpreter, banked)
+    # Banked examples sit after the spec's own; count the candidates each rejects.
+    banked_start = len(spec.examples)
+    banked_end = len(examples)
+    banked_hits: dict[int, int] = {}
     oracle_expr = _parse_oracle(spec)
     counterexamples: list[Example] = []
     candidates_tried = 0
     depth_used = 0
     depth_max = 0
     macros = macros or {}
+    compiled = compile_macros(macros)
     enum_ms = 0.0
     eval_ms = 0.0
     cegis_ms = 0.0
-
-    iterator = iter(bvps_enumerate.enumerate_programs(spec, macros=macros))
+    normalize = bvps_enumerate.normalize_from_env()
+    # Candidates are screened in normal form; the enumerated program is the one
+    # returned, so it is re-checked (step budget included) before acceptance.
+    # The enumerator normalizes through the same simplifier, so its memo hits.
+    simplifier = Simplifier() if normalize else None
+
+    iterator = iter(
+        bvps_enumerate.enumerate_programs(
+            spec,
+            macros=macros,
+            order=bvps_enumerate.enum_order_from_env(),
+            limit=spec.bounds.max_programs,
+            normalize=normalize,
+            simplifier=simplifier,
+        )
+    )
     while True:
         enum_start = time.perf_counter()
         try:
@@ -76,23 +107,35 @@ def synthesize(
         depth_used = bvps_ast.expr_depth(candidate.body)
         if depth_used > depth_max:
             depth_max = depth_used
-        program = expand_program(candidate, macros)
+        program = expand_program(candidate, compiled)
+        checked = program if simplifier is None else simplifier.simplify_program(program)
         eval_start = time.perf_counter()
-        passes = _passes_examples(program, examples, interpreter, oracle_expr, spec)
+        failed = _first_failure(checked, examples, interpreter, oracle_expr, spec)
+        if failed is None and checked is not program:
+            failed = _first_failure(program, examples, interpreter, oracle_expr, spec)
         eval_ms += time.perf_counter() - eval_start
-        if not passes:
+        if failed is not None:
+            if banked_start <= failed < banked_end:
+                banked_hits[failed] = banked_hits.get(failed, 0) + 1
             if candidates_tried >= spec.bounds.max_programs:
                 break
             continue
         cegis_start = time.perf_counter()
         counterexample = fuzz_counterexample(program, spec, rng_seed, oracle_expr)
-        cegis_ms += time.perf_counter() - cegis_start
+        cegis_end = time.perf_counter()
+        cegis_ms += cegis_end - cegis_start
+        tracing.record(
+            "bvps.cegis", cegis_start, cegis_end, cat="bvps", found=counterexample is not None
+        )
         if counterexample is not None:
             examples.append(counterexample)
             counterexamples.append(counterexample)
             if candidates_tried >= spec.bounds.max_programs:
                 break
             continue
+        _update_bank(bank, bank_key, examples, banked_hits, counterexamples)
+        metrics.observe("bvps.candidates_tried", candidates_tried)
+        metrics.incr("bvps.counterexamples", len(counterexamples))
         stats = SynthesisStats(
             candidates_tried=candidates_tried,
             depth=depth_used,
@@ -100,7 +143,9 @@ def synthesize(
             seed=rng_seed,
             fuzz_trials=spec.bounds.fuzz_trials,
         )
-        total_ms = int((time.perf_counter() - total_start) * 1000)
+        total_end = time.perf_counter()
+        total_ms = int((total_end - total_start) * 1000)
+        _trace_synthesis(total_start, total_end, candidates_tried, enum_ms, eval_ms, cegis_ms)
         profile = SynthesisProfile(
             enum_ms=int(enum_ms * 1000),
             eval_ms=int(eval_ms * 1000),
@@ -118,9 +163,37 @@ def synthesize(
             profile=profile,
         )
         # unreachable
+    _update_bank(bank, bank_key, examples, banked_hits, counterexamples)
+    metrics.incr("bvps.synthesis_failures")
+    _trace_synthesis(
+        total_start, time.perf_counter(), candidates_tried, enum_ms, eval_ms, cegis_ms
+    )
     raise RuntimeError("bvps synthesis failed within budget")
 
 
+def _trace_synthesis(
+    start: float,
+    end: float,
+    candidates: int,
+    enum_s: float,
+    eval_s: float,
+    cegis_s: float,
+    name: str = "bvps.synthesize",
+) -> None:
+    # Enumeration and evaluation interleave per candidate; their totals go in
+    # the span's args rather than as millions of child spans.
+    tracing.record(
+        name,
+        start,
+        end,
+        cat="bvps",
+        candidates=candidates,
+        enum_ms=round(enum_s * 1000, 3),
+        eval_ms=round(eval_s * 1000, 3),
+        cegis_ms=round(cegis_s * 1000, 3),
+    )
+
+
 def try_fastpath(
     spec: Spec,
     seed: int | None = None,
@@ -141,6 +214,7 @@ def try_fastpath(
     candidates_tried = 0
     depth_max = 0
     macros = macros or {}
+    compiled = compile_macros(macros)
     eval_ms = 0.0
     cegis_ms = 0.0
 
@@ -149,7 +223,7 @@ def try_fastpath(
         depth_used = bvps_ast.expr_depth(template.body)
         if depth_used > depth_max:
             depth_max = depth_used
-        program = expand_program(template, macros)
+        program = expand_program(template, compiled)
         eval_start = time.perf_counter()
         passes = _passes_examples(program, examples, interpreter, oracle_expr, spec)
         eval_ms += time.perf_counter() - eval_start
@@ -169,7 +243,11 @@ def try_fastpath(
             seed=rng_seed,
             fuzz_trials=spec.bounds.fuzz_trials,
         )
-        total_ms = int((time.perf_counter() - total_start) * 1000)
+        total_end = time.perf_counter()
+        total_ms = int((total_end - total_start) * 1000)
+        _trace_synthesis(
+            total_start, total_end, candidates_tried, 0.0, eval_ms, cegis_ms, "bvps.fastpath"
+        )
         profile = SynthesisProfile(
             enum_ms=0,
             eval_ms=int(eval_ms * 1000),
@@ -228,6 +306,20 @@ def evaluate_examples(
     return results
 
 
+def revalidate(program: bvps_ast.Program, spec: Spec, seed: int) -> bool:
+    """Apply synthesis' own acceptance test (examples, then fuzzing) to ``program``."""
+    if program.params != [(item.name, item.type) for item in spec.inputs]:
+        return False
+    if program.return_type != spec.output:
+        return False
+    interpreter = Interpreter(step_budget=spec.bounds.step_budget)
+    examples = _prepare_examples(spec, interpreter)
+    oracle_expr = _parse_oracle(spec)
+    if not _passes_examples(program, examples, interpreter, oracle_expr, spec):
+        return False
+    return fuzz_counterexample(program, spec, _resolve_seed(spec, seed), oracle_expr) is None
+
+
 def fuzz_counterexample(
     program: bvps_ast.Program,
     spec: Spec,
@@ -253,7 +345,14 @@ def fuzz_counterexample(
     return None
 
 
-def _prepare_examples(spec: Spec, interpreter: Interpreter) -> list[Example]:
+def _prepare_examples(
+    spec: Spec, interpreter: Interpreter, banked: list[Example] | None = None
+) -> list[Example]:
+    """Spec examples with oracle outputs filled in, then ``banked`` inputs not already covered.
+
+    The bank is shared by specs with different bounds; banked inputs outside
+    this spec's Int range are skipped, since its oracle is only promised there.
+    """
     oracle_expr = _parse_oracle(spec)
     examples: list[Example] = []
     for example in spec.examples:
@@ -261,9 +360,46 @@ def _prepare_examples(spec: Spec, interpreter: Interpreter) -> list[Example]:
         if output is None and oracle_expr is not None:
             output = _oracle_output(example.inputs, oracle_expr, interpreter, spec, None)
         examples.append(Example(inputs=example.inputs, output=output))
+    if banked:
+        covered = {example_key(example) for example in examples}
+        for example in banked:
+            if not _within_bounds(example, spec):
+                continue
+            key = example_key(example)
+            if key not in covered:
+                covered.add(key)
+                examples.append(example)
     return examples
 
 
+def _within_bounds(example: Example, spec: Spec) -> bool:
+    for item in spec.inputs:
+        if item.type != "Int":
+            continue
+        value = example.inputs.get(item.name)
+        if not isinstance(value, int) or isinstance(value, bool):
+            return False
+        if not spec.bounds.int_min <= value <= spec.bounds.int_max:
+            return False
+    return True
+
+
+def _update_bank(
+    bank: CounterexampleBank | None,
+    key: str | None,
+    examples: list[Example],
+    hits: dict[int, int],
+    found: list[Example],
+) -> None:
+    if bank is None or key is None:
+        return
+    bank.record(
+        key,
+        hits={example_key(examples[index]): count for index, count in hits.items()},
+        found=found,
+    )
+
+
 def _passes_examples(
     program: bvps_ast.Program,
     examples: list[Example],
@@ -271,21 +407,31 @@ def _passes_examples(
     oracle_expr: bvps_ast.Expr | None,
     spec: Spec,
 ) -> bool:
-    for example in examples:
+    return _first_failure(program, examples, interpreter, oracle_expr, spec) is None
+
+
+def _first_failure(
+    program: bvps_ast.Program,
+    examples: list[Example],
+    interpreter: Interpreter,
+    oracle_expr: bvps_ast.Expr | None,
+    spec: Spec,
+) -> int | None:
+    for index, example in enumerate(examples):
         expected = example.output
         if expected is None:
             if oracle_expr is None:
-                return False
+                return index
             expected = _oracle_output(
                 example.inputs, oracle_expr, interpreter, spec, program.params
             )
         try:
             output, _trace = interpreter.evaluate(program, example.inputs, trace=False)
         except Exception:
-            return False
+            return index
         if output != expected:
-            return False
-    return True
+            return index
+    return None
 
 
 def _oracle_output(
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+
+from eidolon_v16.bvps.cache import persist_dir, spec_semantic_key
+from eidolon_v16.bvps.types import Example, Spec
+from eidolon_v16.ucr.canonical import canonical_json_bytes
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CAPACITY = 64
+
+
+@dataclass
+class BankedExample:
+    example: Example
+    hits: int
+    seen: int
+
+
+def counterexample_bank_key(spec: Spec) -> str | None:
+    return spec_semantic_key(spec)
+
+
+class CounterexampleBank:
+    """Counterexamples found by earlier CEGIS runs, one file per bank key.
+
+    Each entry counts the candidates it rejected (``hits``) and the last
+    run it was found or useful in (``seen``). When a key holds more than
+    ``capacity`` entries, the least useful are evicted: fewest hits first,
+    then least recently seen. Files are written atomically; concurrent runs
+    may lose each other's updates but never corrupt the bank.
+    """
+
+    def __init__(self, root: Path, capacity: int = DEFAULT_CAPACITY) -> None:
+        self.root = root
+        self.capacity = capacity
+
+    def _path(self, key: str) -> Path:
+        return self.root / f"{key}.json"
+
+    def _read(self, key: str) -> tuple[int, list[BankedExample]]:
+        try:
+            payload = json.loads(self._path(key).read_bytes())
+        except (OSError, ValueError):
+            return 0, []
+        if not isinstance(payload, dict) or payload.get("key") != key:
+            return 0, []
+        entries: list[BankedExample] = []
+        for raw in payload.get("entries", []):
+            try:
+                example = Example(inputs=dict(raw["in"]), output=raw["out"])
+                entries.append(BankedExample(example, int(raw["hits"]), int(raw["seen"])))
+            except (KeyError, TypeError, ValueError):
+                continue
+        return int(payload.get("generation", 0)), entries
+
+    def load(self, key: str) -> list[Example]:
+        """Banked examples, most useful first."""
+        _generation, entries = self._read(key)
+        return [entry.example for entry in _by_usefulness(entries)]
+
+    def record(
+        self,
+        key: str,
+        *,
+        hits: dict[bytes, int],
+        found: list[Example],
+    ) -> None:
+        """Merge one run's results: ``hits`` per banked input, new ``found`` examples."""
+        if not hits and not found:
+            return
+        generation, entries = self._read(key)
+        generation += 1
+        by_input = {example_key(entry.example): entry for entry in entries}
+        for input_key, count in hits.items():
+            entry = by_input.get(input_key)
+            if entry is not None and count > 0:
+                entry.hits += count
+                entry.seen = generation
+        for example in found:
+            input_key = example_key(example)
+            if input_key in by_input:
+                by_input[input_key].seen = generation
+                continue
+            by_input[input_key] = BankedExample(example, hits=1, seen=generation)
+        kept = _by_usefulness(list(by_input.values()))[: max(self.capacity, 0)]
+        self._write(key, generation, kept)
+
+    def _write(self, key: str, generation: int, entries: list[BankedExample]) -> None:
+        data = canonical_json_bytes(
+            {
+                "key": key,
+                "generation": generation,
+                "entries": [
+                    {
+                        "in": entry.example.inputs,
+                        "out": entry.example.output,
+                        "hits": entry.hits,
+                        "seen": entry.seen,
+                    }
+                    for entry in entries
+                ],
+            }
+        )
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.root, prefix=".tmp-", suffix=".json")
+            try:
+                with os.fdopen(fd, "wb") as handle:
+                    handle.write(data)
+                os.replace(tmp_name, self._path(key))
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+        except OSError as exc:
+            logger.warning("counterexample bank write failed key=%s error=%s", key, exc)
+
+
+def counterexample_bank_from_env() -> CounterexampleBank | None:
+    if os.getenv("EIDOLON_BVPS_CEX_BANK", "").strip() != "1":
+        return None
+    raw_capacity = os.getenv("EIDOLON_BVPS_CEX_BANK_SIZE", "").strip()
+    capacity = DEFAULT_CAPACITY
+    if raw_capacity:
+        try:
+            capacity = int(raw_capacity)
+        except ValueError as exc:
+            raise ValueError("EIDOLON_BVPS_CEX_BANK_SIZE must be an integer") from exc
+        if capacity < 0:
+            raise ValueError("EIDOLON_BVPS_CEX_BANK_SIZE must be >= 0")
+    return CounterexampleBank(Path(persist_dir()) / "counterexamples", capacity=capacity)
+
+
+def example_key(example: Example) -> bytes:
+    return canonical_json_bytes(example.inputs)
+
+
+def _by_usefulness(entries: list[BankedExample]) -> list[BankedExample]:
+    return sorted(entries, key=lambda entry: (-entry.hits, -entry.seen, example_key(entry.example)))
@@ -4,6 +4,7 @@ from dataclasses import dataclass
 from typing import Any, Literal
 
 TypeName = Literal["int", "bool", "list_int"]
+BinOpName = Literal["add", "sub", "mul", "lt", "lte", "gt", "eq"]
 
 
 class Expr:
@@ -45,7 +46,7 @@ class Var(Expr):
 
 @dataclass(frozen=True)
 class BinOp(Expr):
-    op: Literal["add", "sub", "mul", "lt", "lte", "gt", "eq"]
+    op: BinOpName
     left: Expr
     right: Expr
 
@@ -1,21 +1,25 @@
 from __future__ import annotations
 
+import os
 from collections.abc import Iterator
-from typing import Any
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Any, Literal
 
 from eidolon_v16.bvps.ast import (
     BinOp,
     BinOpName,
     BoolConst,
     Expr,
+    ExprInterner,
     IfThenElse,
     IntConst,
-    MacroCall,
     Program,
     Var,
     expr_depth,
     expr_to_str,
 )
+from eidolon_v16.bvps.simplify import Simplifier
 from eidolon_v16.bvps.types import Spec, TypeName
 from eidolon_v16.language.spec import MacroTemplate
 
@@ -24,17 +28,93 @@ BOOL_OP_ORDER: list[BinOpName] = ["eq", "lt", "gt"]
 COND_OP_ORDER: list[BinOpName] = ["lt", "gt", "eq"]
 INT_CONST_ORDER = [0, 1, 2, -1]
 
+EnumOrder = Literal["depth", "size"]
+ENUM_ORDERS: tuple[EnumOrder, ...] = ("depth", "size")
+
+
+@dataclass
+class _EnumState:
+    """Per-enumeration tables; every cached expression is built through ``interner``.
+
+    Sort keys are memoized by node uid, which is only meaningful because all
+    nodes come from the same interner. With a ``simplifier``, ``normal_forms``
+    holds the normal form of every expression admitted so far, per type.
+    """
+
+    interner: ExprInterner = field(default_factory=ExprInterner)
+    exprs: dict[tuple[TypeName, int], list[Expr]] = field(default_factory=dict)
+    sized: dict[tuple[TypeName, int], list[Expr]] = field(default_factory=dict)
+    ordered: dict[tuple[str, TypeName, int], list[Expr]] = field(default_factory=dict)
+    sort_keys: dict[int, tuple[Any, ...]] = field(default_factory=dict)
+    fallbacks: dict[tuple[str, TypeName, int], bool] = field(default_factory=dict)
+    simplifier: Simplifier | None = None
+    normal_forms: dict[TypeName, set[Expr]] = field(default_factory=dict)
+
+    def admit(self, target_type: TypeName, expr: Expr) -> bool:
+        """False when an earlier expression of this type has the same normal form."""
+        if self.simplifier is None:
+            return True
+        normal = self.simplifier.simplify(expr)
+        seen = self.normal_forms.setdefault(target_type, set())
+        if normal in seen:
+            return False
+        seen.add(normal)
+        return True
+
+
+def enum_order_from_env() -> EnumOrder:
+    value = os.getenv("EIDOLON_BVPS_ENUM_ORDER", "").strip().lower() or "depth"
+    for order in ENUM_ORDERS:
+        if value == order:
+            return order
+    raise ValueError(f"EIDOLON_BVPS_ENUM_ORDER must be one of {', '.join(ENUM_ORDERS)}")
+
+
+def normalize_from_env() -> bool:
+    return os.getenv("EIDOLON_BVPS_NORMALIZE", "").strip() == "1"
+
 
 def enumerate_programs(
-    spec: Spec, macros: dict[str, MacroTemplate] | None = None
+    spec: Spec,
+    macros: dict[str, MacroTemplate] | None = None,
+    *,
+    order: EnumOrder = "depth",
+    limit: int | None = None,
+    normalize: bool = False,
+    simplifier: Simplifier | None = None,
 ) -> Iterator[Program]:
+    """Yield candidate programs lazily, stopping after ``limit`` when given.
+
+    ``order="depth"`` is the historical order (all depth-d programs before
+    depth d + 1). ``order="size"`` yields programs by AST node count, macro
+    calls counting as one node: the same programs as depth order, reordered.
+
+    ``normalize=True`` skips every expression whose normal form (see
+    ``bvps.simplify``) was already produced, both as a candidate and as an
+    operand of larger candidates; ``limit`` counts the survivors. A given
+    ``simplifier`` is used for that and its interner builds every candidate,
+    so callers can reuse the normal forms it memoizes.
+    """
     var_types = {item.name: item.type for item in spec.inputs}
     params = [(item.name, item.type) for item in spec.inputs]
     max_depth = spec.bounds.max_depth
     macros = macros or {}
-    for depth in range(max_depth + 1):
-        for expr in enumerate_exprs(spec.output, var_types, depth, macros):
-            yield Program(params=params, body=expr, return_type=spec.output)
+    state = _EnumState()
+    if normalize:
+        if simplifier is not None:
+            state.interner = simplifier.interner
+        state.simplifier = simplifier or Simplifier(state.interner)
+    exprs: Iterator[Expr]
+    if order == "depth":
+        exprs = _iter_by_depth(spec.output, var_types, max_depth, state, macros)
+    elif order == "size":
+        exprs = _iter_by_size(spec.output, var_types, max_depth, state, macros)
+    else:
+        raise ValueError(f"unknown enumeration order {order}")
+    if limit is not None:
+        exprs = islice(exprs, max(limit, 0))
+    for expr in exprs:
+        yield Program(params=params, body=expr, return_type=spec.output)
 
 
 def enumerate_exprs(
@@ -43,62 +123,113 @@ def enumerate_exprs(
     depth: int,
     macros: dict[str, MacroTemplate],
 ) -> Iterator[Expr]:
-    cache: dict[tuple[TypeName, int], list[Expr]] = {}
-    yield from _exprs_at_depth(target_type, var_types, depth, cache, macros)
+    yield from _iter_exprs(target_type, var_types, depth, _EnumState(), macros, interned=True)
+
+
+def _iter_by_depth(
+    target_type: TypeName,
+    var_types: dict[str, TypeName],
+    max_depth: int,
+    state: _EnumState,
+    macros: dict[str, MacroTemplate],
+) -> Iterator[Expr]:
+    for depth in range(max_depth + 1):
+        cached = state.exprs.get((target_type, depth))
+        if cached is not None:
+            yield from cached
+        elif depth < max_depth:
+            # Shallower programs are operands of the next depth, so keep them.
+            exprs: list[Expr] = []
+            for expr in _iter_exprs(target_type, var_types, depth, state, macros, interned=True):
+                if state.admit(target_type, expr):
+                    exprs.append(expr)
+                    yield expr
+            state.exprs[(target_type, depth)] = exprs
+        else:
+            for expr in _iter_exprs(target_type, var_types, depth, state, macros, interned=False):
+                if state.admit(target_type, expr):
+                    yield expr
 
 
 def _exprs_at_depth(
     target_type: TypeName,
     var_types: dict[str, TypeName],
     depth: int,
-    cache: dict[tuple[TypeName, int], list[Expr]],
+    state: _EnumState,
     macros: dict[str, MacroTemplate],
 ) -> list[Expr]:
     key = (target_type, depth)
-    if key in cache:
-        return cache[key]
-    exprs: list[Expr] = []
+    cached = state.exprs.get(key)
+    if cached is None:
+        if state.simplifier is not None:
+            # Shallower expressions must claim their normal forms first.
+            for lower in range(depth):
+                _exprs_at_depth(target_type, var_types, lower, state, macros)
+        cached = [
+            expr
+            for expr in _iter_exprs(target_type, var_types, depth, state, macros, interned=True)
+            if state.admit(target_type, expr)
+        ]
+        state.exprs[key] = cached
+    return cached
+
+
+def _iter_exprs(
+    target_type: TypeName,
+    var_types: dict[str, TypeName],
+    depth: int,
+    state: _EnumState,
+    macros: dict[str, MacroTemplate],
+    *,
+    interned: bool,
+) -> Iterator[Expr]:
+    """Expressions of exactly ``depth``, each structure once, in enumeration order.
+
+    Operands always come from the interned per-depth tables; ``interned``
+    only controls whether the yielded nodes themselves are interned.
+    """
     if depth == 0:
-        exprs.extend(_base_exprs(target_type, var_types, macros))
-        cache[key] = exprs
-        return exprs
+        yield from _base_exprs(target_type, var_types, state, macros)
+        return
     if target_type == "Int":
-        exprs.extend(_if_exprs(target_type, var_types, depth, cache, macros))
-        exprs.extend(_binop_exprs(INT_OP_ORDER, var_types, depth, cache, macros))
+        yield from _if_exprs(target_type, var_types, depth, state, macros, interned)
+        yield from _binop_exprs(INT_OP_ORDER, var_types, depth, state, macros, interned)
     elif target_type == "Bool":
-        exprs.extend(_binop_exprs(BOOL_OP_ORDER, var_types, depth, cache, macros))
-        exprs.extend(_if_exprs(target_type, var_types, depth, cache, macros))
+        yield from _binop_exprs(BOOL_OP_ORDER, var_types, depth, state, macros, interned)
+        yield from _if_exprs(target_type, var_types, depth, state, macros, interned)
     else:
         raise ValueError(f"unknown type {target_type}")
 
-    deduped = _dedupe_exprs(exprs)
-    cache[key] = deduped
-    return deduped
-
 
 def _base_exprs(
-    target_type: TypeName, var_types: dict[str, TypeName], macros: dict[str, MacroTemplate]
+    target_type: TypeName,
+    var_types: dict[str, TypeName],
+    state: _EnumState,
+    macros: dict[str, MacroTemplate],
 ) -> list[Expr]:
+    interner = state.interner
     constants: list[Expr]
     if target_type == "Int":
-        constants = [IntConst(value) for value in INT_CONST_ORDER]
+        constants = [interner.int_const(value) for value in INT_CONST_ORDER]
     else:
-        constants = [BoolConst(True), BoolConst(False)]
+        constants = [interner.bool_const(True), interner.bool_const(False)]
     vars_sorted: list[Expr] = [
-        Var(name) for name, typ in sorted(var_types.items()) if typ == target_type
+        interner.var(name) for name, typ in sorted(var_types.items()) if typ == target_type
     ]
-    macro_calls = _macro_exprs(target_type, var_types, macros)
+    macro_calls = _macro_exprs(target_type, var_types, state, macros)
     return macro_calls + constants + vars_sorted
 
 
 def _macro_exprs(
     target_type: TypeName,
     var_types: dict[str, TypeName],
+    state: _EnumState,
     macros: dict[str, MacroTemplate],
 ) -> list[Expr]:
     exprs: list[Expr] = []
     if target_type not in {"Int", "Bool"}:
         return exprs
+    interner = state.interner
     for name, template in macros.items():
         if template.return_type != target_type:
             continue
@@ -113,10 +244,10 @@ def _macro_exprs(
             if var_type is None or var_type != expected_type:
                 ok = False
                 break
-            args.append(Var(param_name))
+            args.append(interner.var(param_name))
         if not ok:
             continue
-        exprs.append(MacroCall(name=name, args=tuple(args)))
+        exprs.append(interner.macro_call(name, tuple(args)))
     return exprs
 
 
@@ -124,58 +255,293 @@ def _binop_exprs(
     ops: list[BinOpName],
     var_types: dict[str, TypeName],
     depth: int,
-    cache: dict[tuple[TypeName, int], list[Expr]],
+    state: _EnumState,
     macros: dict[str, MacroTemplate],
-) -> list[Expr]:
-    exprs: list[Expr] = []
+    interned: bool,
+) -> Iterator[Expr]:
     left_type: TypeName = "Int"
     right_type: TypeName = "Int"
+    binop = state.interner.binop if interned else BinOp
     for op in ops:
         for left_depth, right_depth in _depth_pairs(depth):
-            left_exprs = _ordered_exprs(
-                _exprs_at_depth(left_type, var_types, left_depth, cache, macros)
-            )
-            right_exprs = _ordered_exprs(
-                _exprs_at_depth(right_type, var_types, right_depth, cache, macros)
-            )
+            left_exprs = _ordered_at_depth(left_type, var_types, left_depth, state, macros)
+            right_exprs = _ordered_at_depth(right_type, var_types, right_depth, state, macros)
             for left in left_exprs:
                 for right in right_exprs:
-                    exprs.append(BinOp(op=op, left=left, right=right))
-    return exprs
+                    yield binop(op, left, right)
 
 
 def _if_exprs(
     target_type: TypeName,
     var_types: dict[str, TypeName],
     depth: int,
-    cache: dict[tuple[TypeName, int], list[Expr]],
+    state: _EnumState,
     macros: dict[str, MacroTemplate],
-) -> list[Expr]:
-    exprs: list[Expr] = []
-    exprs.extend(_seed_if_exprs(target_type, var_types, depth))
+    interned: bool,
+) -> Iterator[Expr]:
+    seeds = _seed_if_exprs(target_type, var_types, depth, state)
+    yield from seeds
+    # Products over distinct depth triples never repeat a structure, so the
+    # seeds are the only possible duplicates.
+    seen = set(seeds)
+    if_then_else = state.interner.if_then_else if interned else IfThenElse
     for cond_depth, then_depth, else_depth in _depth_triples(depth):
-        cond_exprs = _filter_cond_exprs(
-            _ordered_cond_exprs(
-                _exprs_at_depth("Bool", var_types, cond_depth, cache, macros)
-            )
-        )
-        then_exprs = _filter_branch_exprs(
-            _ordered_exprs(
-                _exprs_at_depth(target_type, var_types, then_depth, cache, macros)
-            )
-        )
-        else_exprs = _filter_branch_exprs(
-            _ordered_exprs(
-                _exprs_at_depth(target_type, var_types, else_depth, cache, macros)
-            )
-        )
+        cond_exprs = _cond_at_depth(var_types, cond_depth, state, macros)
+        then_exprs = _branch_at_depth(target_type, var_types, then_depth, state, macros)
+        else_exprs = _branch_at_depth(target_type, var_types, else_depth, state, macros)
         for cond in cond_exprs:
             for then_expr in then_exprs:
                 for else_expr in else_exprs:
-                    exprs.append(
-                        IfThenElse(cond=cond, then_expr=then_expr, else_expr=else_expr)
-                    )
-    return exprs
+                    expr = if_then_else(cond, then_expr, else_expr)
+                    if seen and expr in seen:
+                        continue
+                    yield expr
+
+
+def _iter_by_size(
+    target_type: TypeName,
+    var_types: dict[str, TypeName],
+    max_depth: int,
+    state: _EnumState,
+    macros: dict[str, MacroTemplate],
+) -> Iterator[Expr]:
+    # A complete ternary tree is the largest expression within max_depth.
+    max_size = (3 ** (max_depth + 1) - 1) // 2
+    for size in range(1, max_size + 1):
+        key = (target_type, size)
+        cached = state.sized.get(key)
+        if cached is not None:
+            yield from cached
+            continue
+        exprs: list[Expr] = []
+        for expr in _iter_sized(target_type, var_types, size, max_depth, state, macros):
+            if state.admit(target_type, expr):
+                exprs.append(expr)
+                yield expr
+        state.sized[key] = exprs
+
+
+def _exprs_of_size(
+    target_type: TypeName,
+    var_types: dict[str, TypeName],
+    size: int,
+    max_depth: int,
+    state: _EnumState,
+    macros: dict[str, MacroTemplate],
+) -> list[Expr]:
+    key = (target_type, size)
+    cached = state.sized.get(key)
+    if cached is None:
+        if state.simplifier is not None:
+            for lower in range(1, size):
+                _exprs_of_size(target_type, var_types, lower, max_depth, state, macros)
+        cached = [
+            expr
+            for expr in _iter_sized(target_type, var_types, size, max_depth, state, macros)
+            if state.admit(target_type, expr)
+        ]
+        state.sized[key] = cached
+    return cached
+
+
+def _iter_sized(
+    target_type: TypeName,
+    var_types: dict[str, TypeName],
+    size: int,
+    max_depth: int,
+    state: _EnumState,
+    macros: dict[str, MacroTemplate],
+) -> Iterator[Expr]:
+    """Interned expressions with exactly ``size`` nodes and depth at most ``max_depth``.
+
+    Each structure has a single (node kind, operand sizes) decomposition, so
+    nothing is produced twice.
+    """
+    if size == 1:
+        yield from _base_exprs(target_type, var_types, state, macros)
+        return
+    if max_depth == 0:
+        return
+    if target_type == "Int":
+        yield from _sized_if_exprs(target_type, var_types, size, max_depth, state, macros)
+        yield from _sized_binop_exprs(INT_OP_ORDER, var_types, size, max_depth, state, macros)
+    elif target_type == "Bool":
+        yield from _sized_binop_exprs(BOOL_OP_ORDER, var_types, size, max_depth, state, macros)
+        yield from _sized_if_exprs(target_type, var_types, size, max_depth, state, macros)
+    else:
+        raise ValueError(f"unknown type {target_type}")
+
+
+def _sized_binop_exprs(
+    ops: list[BinOpName],
+    var_types: dict[str, TypeName],
+    size: int,
+    max_depth: int,
+    state: _EnumState,
+    macros: dict[str, MacroTemplate],
+) -> Iterator[Expr]:
+    binop = state.interner.binop
+    for op in ops:
+        for left_size in range(1, size - 1):
+            right_size = size - 1 - left_size
+            left_exprs = _sized_operands(
+                "operand", "Int", var_types, left_size, max_depth, state, macros
+            )
+            right_exprs = _sized_operands(
+                "operand", "Int", var_types, right_size, max_depth, state, macros
+            )
+            for left in left_exprs:
+                for right in right_exprs:
+                    yield binop(op, left, right)
+
+
+def _sized_if_exprs(
+    target_type: TypeName,
+    var_types: dict[str, TypeName],
+    size: int,
+    max_depth: int,
+    state: _EnumState,
+    macros: dict[str, MacroTemplate],
+) -> Iterator[Expr]:
+    if_then_else = state.interner.if_then_else
+    for cond_size in range(1, size - 2):
+        for then_size in range(1, size - 1 - cond_size):
+            else_size = size - 1 - cond_size - then_size
+            cond_exprs = _sized_operands(
+                "cond", "Bool", var_types, cond_size, max_depth, state, macros
+            )
+            then_exprs = _sized_operands(
+                "branch", target_type, var_types, then_size, max_depth, state, macros
+            )
+            else_exprs = _sized_operands(
+                "branch", target_type, var_types, else_size, max_depth, state, macros
+            )
+            for cond in cond_exprs:
+                for then_expr in then_exprs:
+                    for else_expr in else_exprs:
+                        yield if_then_else(cond, then_expr, else_expr)
+
+
+def _sized_operands(
+    kind: str,
+    target_type: TypeName,
+    var_types: dict[str, TypeName],
+    size: int,
+    max_depth: int,
+    state: _EnumState,
+    macros: dict[str, MacroTemplate],
+) -> list[Expr]:
+    """Operands of one size for a node at the root: shallow enough, sorted, filtered.
+
+    Conditions and branches are filtered as in depth order, where the "filtered
+    or all" fallback is decided per operand depth; deciding it per size bucket
+    would admit, say, the size-4 ifs as conditions and enumerate another space.
+    """
+    key = (f"size-{kind}", target_type, size)
+    cached = state.ordered.get(key)
+    if cached is not None:
+        return cached
+    exprs = [
+        expr
+        for expr in _exprs_of_size(target_type, var_types, size, max_depth, state, macros)
+        if expr_depth(expr) < max_depth
+    ]
+    if kind in ("cond", "branch"):
+        exprs = [
+            expr
+            for expr in exprs
+            if _operand_passes(kind, expr)
+            or _sized_fallback(
+                kind, target_type, var_types, expr_depth(expr), max_depth, state, macros
+            )
+        ]
+    order = _ordered_cond_exprs if kind == "cond" else _ordered_exprs
+    cached = order(exprs, state)
+    state.ordered[key] = cached
+    return cached
+
+
+def _sized_fallback(
+    kind: str,
+    target_type: TypeName,
+    var_types: dict[str, TypeName],
+    depth: int,
+    max_depth: int,
+    state: _EnumState,
+    macros: dict[str, MacroTemplate],
+) -> bool:
+    """True when no ``kind`` operand of exactly ``depth`` passes its filter.
+
+    Scans the sizes an expression of that depth can have, smallest first; a
+    node has at least two children, so none is smaller than ``2 * depth + 1``.
+    """
+    key = (kind, target_type, depth)
+    cached = state.fallbacks.get(key)
+    if cached is not None:
+        return cached
+    # Provisional answer for scans that come back to this depth.
+    state.fallbacks[key] = False
+    fallback = True
+    for size in range(2 * depth + 1, (3 ** (depth + 1) - 1) // 2 + 1):
+        exprs = _exprs_of_size(target_type, var_types, size, max_depth, state, macros)
+        if any(expr_depth(expr) == depth and _operand_passes(kind, expr) for expr in exprs):
+            fallback = False
+            break
+    state.fallbacks[key] = fallback
+    return fallback
+
+
+def _operand_passes(kind: str, expr: Expr) -> bool:
+    if kind == "cond":
+        return isinstance(expr, BinOp)
+    return not isinstance(expr, IfThenElse)
+
+
+def _ordered_at_depth(
+    target_type: TypeName,
+    var_types: dict[str, TypeName],
+    depth: int,
+    state: _EnumState,
+    macros: dict[str, MacroTemplate],
+) -> list[Expr]:
+    key = ("ordered", target_type, depth)
+    cached = state.ordered.get(key)
+    if cached is None:
+        exprs = _exprs_at_depth(target_type, var_types, depth, state, macros)
+        cached = _ordered_exprs(exprs, state)
+        state.ordered[key] = cached
+    return cached
+
+
+def _cond_at_depth(
+    var_types: dict[str, TypeName],
+    depth: int,
+    state: _EnumState,
+    macros: dict[str, MacroTemplate],
+) -> list[Expr]:
+    key: tuple[str, TypeName, int] = ("cond", "Bool", depth)
+    cached = state.ordered.get(key)
+    if cached is None:
+        exprs = _exprs_at_depth("Bool", var_types, depth, state, macros)
+        cached = _filter_cond_exprs(_ordered_cond_exprs(exprs, state))
+        state.ordered[key] = cached
+    return cached
+
+
+def _branch_at_depth(
+    target_type: TypeName,
+    var_types: dict[str, TypeName],
+    depth: int,
+    state: _EnumState,
+    macros: dict[str, MacroTemplate],
+) -> list[Expr]:
+    key = ("branch", target_type, depth)
+    cached = state.ordered.get(key)
+    if cached is None:
+        ordered = _ordered_at_depth(target_type, var_types, depth, state, macros)
+        cached = _filter_branch_exprs(ordered)
+        state.ordered[key] = cached
+    return cached
 
 
 def _depth_pairs(depth: int) -> list[tuple[int, int]]:
@@ -219,12 +585,14 @@ def _depth_triples(depth: int) -> list[tuple[int, int, int]]:
     )
 
 
-def _ordered_exprs(exprs: list[Expr]) -> list[Expr]:
-    return sorted(exprs, key=_expr_sort_key)
+def _ordered_exprs(exprs: list[Expr], state: _EnumState) -> list[Expr]:
+    memo = state.sort_keys
+    return sorted(exprs, key=lambda expr: _expr_sort_key(expr, memo))
 
 
-def _ordered_cond_exprs(exprs: list[Expr]) -> list[Expr]:
-    return sorted(exprs, key=_cond_sort_key)
+def _ordered_cond_exprs(exprs: list[Expr], state: _EnumState) -> list[Expr]:
+    memo = state.sort_keys
+    return sorted(exprs, key=lambda expr: _cond_sort_key(expr, memo))
 
 
 def _filter_cond_exprs(exprs: list[Expr]) -> list[Expr]:
@@ -243,7 +611,19 @@ def _filter_branch_exprs(exprs: list[Expr]) -> list[Expr]:
     return filtered or exprs
 
 
-def _expr_sort_key(expr: Expr) -> tuple[Any, ...]:
+def _expr_sort_key(expr: Expr, memo: dict[int, tuple[Any, ...]]) -> tuple[Any, ...]:
+    meta = expr._meta
+    if meta is not None:
+        cached = memo.get(meta.uid)
+        if cached is not None:
+            return cached
+    key = _compute_sort_key(expr, memo)
+    if meta is not None:
+        memo[meta.uid] = key
+    return key
+
+
+def _compute_sort_key(expr: Expr, memo: dict[int, tuple[Any, ...]]) -> tuple[Any, ...]:
     if isinstance(expr, Var):
         return (0, expr.name)
     if isinstance(expr, IntConst):
@@ -255,57 +635,58 @@ def _expr_sort_key(expr: Expr) -> tuple[Any, ...]:
         return (
             2,
             op_rank,
-            _expr_sort_key(expr.left),
-            _expr_sort_key(expr.right),
+            _expr_sort_key(expr.left, memo),
+            _expr_sort_key(expr.right, memo),
         )
     if isinstance(expr, IfThenElse):
         return (
             3,
-            _expr_sort_key(expr.cond),
-            _expr_sort_key(expr.then_expr),
-            _expr_sort_key(expr.else_expr),
+            _expr_sort_key(expr.cond, memo),
+            _expr_sort_key(expr.then_expr, memo),
+            _expr_sort_key(expr.else_expr, memo),
         )
     return (9, expr_to_str(expr))
 
 
 def _seed_if_exprs(
-    target_type: TypeName, var_types: dict[str, TypeName], depth: int
+    target_type: TypeName, var_types: dict[str, TypeName], depth: int, state: _EnumState
 ) -> list[Expr]:
     if target_type != "Int":
         return []
-    vars_int = [Var(name) for name, typ in sorted(var_types.items()) if typ == "Int"]
+    interner = state.interner
+    vars_int = [interner.var(name) for name, typ in sorted(var_types.items()) if typ == "Int"]
     if not vars_int:
         return []
-    consts = [IntConst(0), IntConst(1)]
+    consts: list[Expr] = [interner.int_const(0), interner.int_const(1)]
     conds: list[Expr] = []
     for var in vars_int:
         for const in consts:
-            conds.append(BinOp("lt", var, const))
-            conds.append(BinOp("gt", var, const))
+            conds.append(interner.binop("lt", var, const))
+            conds.append(interner.binop("gt", var, const))
     for left in vars_int:
         for right in vars_int:
             if left.name == right.name:
                 continue
-            conds.append(BinOp("gt", left, right))
-            conds.append(BinOp("lt", left, right))
+            conds.append(interner.binop("gt", left, right))
+            conds.append(interner.binop("lt", left, right))
     branches: list[Expr] = []
     branches.extend(vars_int)
     branches.extend(consts)
     for var in vars_int:
         for const in consts:
-            branches.append(BinOp("sub", const, var))
-            branches.append(BinOp("sub", var, const))
+            branches.append(interner.binop("sub", const, var))
+            branches.append(interner.binop("sub", var, const))
     exprs: list[Expr] = []
     for cond in conds:
         for then_expr in branches:
             for else_expr in branches:
-                candidate = IfThenElse(cond=cond, then_expr=then_expr, else_expr=else_expr)
+                candidate = interner.if_then_else(cond, then_expr, else_expr)
                 if expr_depth(candidate) == depth:
                     exprs.append(candidate)
     return _dedupe_exprs(exprs)
 
 
-def _cond_sort_key(expr: Expr) -> tuple[Any, ...]:
+def _cond_sort_key(expr: Expr, memo: dict[int, tuple[Any, ...]]) -> tuple[Any, ...]:
     if isinstance(expr, BinOp):
         left_kind = _operand_kind(expr.left)
         right_kind = _operand_kind(expr.right)
@@ -315,12 +696,12 @@ def _cond_sort_key(expr: Expr) -> tuple[Any, ...]:
             0,
             pattern_rank,
             op_rank,
-            _operand_sort_key(expr.left),
-            _operand_sort_key(expr.right),
+            _operand_sort_key(expr.left, memo),
+            _operand_sort_key(expr.right, memo),
         )
     if isinstance(expr, IfThenElse):
-        return (2, _expr_sort_key(expr))
-    return (1, _expr_sort_key(expr))
+        return (2, _expr_sort_key(expr, memo))
+    return (1, _expr_sort_key(expr, memo))
 
 
 def _operand_kind(expr: Expr) -> str:
@@ -343,12 +724,12 @@ def _cond_pattern_rank(left_kind: str, right_kind: str) -> int:
     return 4
 
 
-def _operand_sort_key(expr: Expr) -> tuple[Any, ...]:
+def _operand_sort_key(expr: Expr, memo: dict[int, tuple[Any, ...]]) -> tuple[Any, ...]:
     if isinstance(expr, Var):
         return (0, expr.name)
     if isinstance(expr, IntConst):
         return (1, _int_const_rank(expr.value), expr.value)
-    return (2, _expr_sort_key(expr))
+    return (2, _expr_sort_key(expr, memo))
 
 
 def _int_const_rank(value: int) -> int:
@@ -364,10 +745,11 @@ def _op_rank(op: BinOpName, ordering: list[BinOpName]) -> int:
 
 
 def _dedupe_exprs(exprs: list[Expr]) -> list[Expr]:
-    seen: set[str] = set()
+    # Interned nodes are unique per structure, so identity is structural equality.
+    seen: set[int] = set()
     ordered: list[Expr] = []
     for expr in exprs:
-        key = str(expr.to_dict())
+        key = id(expr)
         if key in seen:
             continue
         seen.add(key)
@@ -1,16 +1,88 @@
 from __future__ import annotations
 
+from array import array
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Any
 
 from eidolon_v16.bvps.ast import BinOp, BoolConst, Expr, IfThenElse, IntConst, Program, Var
 from eidolon_v16.bvps.types import TypeName, Value
 
+# Event codes for the compact trace; index into _EVENT_NAMES/_PAYLOAD_KEYS.
+_EV_INT = 0
+_EV_BOOL = 1
+_EV_VAR = 2
+_EV_BINOP = 3
+_EV_IF = 4
+_EVENT_NAMES = ("int", "bool", "var", "binop", "if")
+_PAYLOAD_KEYS = ("value", "value", "name", "op", "cond")
+
 
 @dataclass(frozen=True)
 class EvalTrace:
+    """Evaluation trace stored as parallel arrays (event code, step, value).
+
+    ``events`` builds the ``{"step", "event", "payload"}`` dicts on first
+    access, so traces that are never serialized cost no per-event dicts.
+    """
+
     steps: int
-    events: list[dict[str, Any]]
+    codes: bytes = b""
+    event_steps: tuple[int, ...] = ()
+    values: tuple[Any, ...] = ()
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    @cached_property
+    def events(self) -> list[dict[str, Any]]:
+        return [
+            {
+                "step": step,
+                "event": _EVENT_NAMES[code],
+                "payload": {_PAYLOAD_KEYS[code]: value},
+            }
+            for code, step, value in zip(self.codes, self.event_steps, self.values, strict=True)
+        ]
+
+
+class _Budget:
+    __slots__ = ("steps", "limit")
+
+    def __init__(self, limit: int) -> None:
+        self.steps = 0
+        self.limit = limit
+
+
+class _Recorder:
+    """Preallocated event buffers; one event per evaluated node at most."""
+
+    __slots__ = ("steps", "limit", "count", "codes", "event_steps", "values")
+
+    def __init__(self, limit: int) -> None:
+        size = max(limit, 0)
+        self.steps = 0
+        self.limit = limit
+        self.count = 0
+        self.codes = bytearray(size)
+        self.event_steps = array("l", bytes(array("l").itemsize * size))
+        self.values: list[Any] = [None] * size
+
+    def record(self, code: int, value: Any) -> None:
+        index = self.count
+        self.codes[index] = code
+        self.event_steps[index] = self.steps
+        self.values[index] = value
+        self.count = index + 1
+
+    def freeze(self) -> EvalTrace:
+        count = self.count
+        return EvalTrace(
+            steps=self.steps,
+            codes=bytes(self.codes[:count]),
+            event_steps=tuple(self.event_steps[:count]),
+            values=tuple(self.values[:count]),
+        )
 
 
 @dataclass
@@ -21,59 +93,13 @@ class Interpreter:
         self, program: Program, inputs: dict[str, Value], *, trace: bool = False
     ) -> tuple[Value, EvalTrace]:
         env = self._bind_inputs(program, inputs)
-        steps = 0
-        events: list[dict[str, Any]] = []
-
-        def record(event: str, payload: dict[str, Any]) -> None:
-            if trace:
-                events.append({"step": steps, "event": event, "payload": payload})
-
-        def tick() -> None:
-            nonlocal steps
-            steps += 1
-            if steps > self.step_budget:
-                raise RuntimeError("step budget exceeded")
-
-        def eval_expr(expr: Expr) -> Value:
-            tick()
-            if isinstance(expr, IntConst):
-                record("int", {"value": expr.value})
-                return expr.value
-            if isinstance(expr, BoolConst):
-                record("bool", {"value": expr.value})
-                return expr.value
-            if isinstance(expr, Var):
-                record("var", {"name": expr.name})
-                return env[expr.name]
-            if isinstance(expr, BinOp):
-                left = eval_expr(expr.left)
-                right = eval_expr(expr.right)
-                record("binop", {"op": expr.op})
-                if expr.op == "add":
-                    return int(left) + int(right)
-                if expr.op == "sub":
-                    return int(left) - int(right)
-                if expr.op == "mul":
-                    return int(left) * int(right)
-                if expr.op == "mod":
-                    return int(left) % int(right)
-                if expr.op == "lt":
-                    return int(left) < int(right)
-                if expr.op == "gt":
-                    return int(left) > int(right)
-                if expr.op == "eq":
-                    return left == right
-                raise ValueError("unknown binop")
-            if isinstance(expr, IfThenElse):
-                cond = eval_expr(expr.cond)
-                record("if", {"cond": bool(cond)})
-                if bool(cond):
-                    return eval_expr(expr.then_expr)
-                return eval_expr(expr.else_expr)
-            raise ValueError("unknown expr")
-
-        output = eval_expr(program.body)
-        return output, EvalTrace(steps=steps, events=events)
+        if not trace:
+            budget = _Budget(self.step_budget)
+            output = _eval_fast(program.body, env, budget)
+            return output, EvalTrace(steps=budget.steps)
+        recorder = _Recorder(self.step_budget)
+        output = _eval_traced(program.body, env, recorder)
+        return output, recorder.freeze()
 
     def _bind_inputs(self, program: Program, inputs: dict[str, Value]) -> dict[str, Value]:
         env: dict[str, Value] = {}
@@ -97,3 +123,67 @@ def _coerce_value(value: Value, type_name: TypeName) -> Value:
             return bool(value)
         raise TypeError("invalid bool input")
     raise ValueError(f"unknown type {type_name}")
+
+
+def _binop(op: str, left: Value, right: Value) -> Value:
+    if op == "add":
+        return int(left) + int(right)
+    if op == "sub":
+        return int(left) - int(right)
+    if op == "mul":
+        return int(left) * int(right)
+    if op == "mod":
+        return int(left) % int(right)
+    if op == "lt":
+        return int(left) < int(right)
+    if op == "gt":
+        return int(left) > int(right)
+    if op == "eq":
+        return left == right
+    raise ValueError("unknown binop")
+
+
+def _eval_fast(expr: Expr, env: dict[str, Value], budget: _Budget) -> Value:
+    budget.steps += 1
+    if budget.steps > budget.limit:
+        raise RuntimeError("step budget exceeded")
+    if isinstance(expr, Var):
+        return env[expr.name]
+    if isinstance(expr, (IntConst, BoolConst)):
+        return expr.value
+    if isinstance(expr, BinOp):
+        left = _eval_fast(expr.left, env, budget)
+        right = _eval_fast(expr.right, env, budget)
+        return _binop(expr.op, left, right)
+    if isinstance(expr, IfThenElse):
+        if bool(_eval_fast(expr.cond, env, budget)):
+            return _eval_fast(expr.then_expr, env, budget)
+        return _eval_fast(expr.else_expr, env, budget)
+    raise ValueError("unknown expr")
+
+
+def _eval_traced(expr: Expr, env: dict[str, Value], recorder: _Recorder) -> Value:
+    recorder.steps += 1
+    if recorder.steps > recorder.limit:
+        raise RuntimeError("step budget exceeded")
+    if isinstance(expr, IntConst):
+        recorder.record(_EV_INT, expr.value)
+        return expr.value
+    if isinstance(expr, BoolConst):
+        recorder.record(_EV_BOOL, expr.value)
+        return expr.value
+    if isinstance(expr, Var):
+        recorder.record(_EV_VAR, expr.name)
+        return env[expr.name]
+    if isinstance(expr, BinOp):
+        left = _eval_traced(expr.left, env, recorder)
+        right = _eval_traced(expr.right, env, recorder)
+        recorder.record(_EV_BINOP, expr.op)
+        return _binop(expr.op, left, right)
+    if isinstance(expr, IfThenElse):
+        cond = _eval_traced(expr.cond, env, recorder)
+        recorder.record(_EV_IF, bool(cond))
+        if bool(cond):
+            return _eval_traced(expr.then_expr, env, recorder)
+        return _eval_traced(expr.else_expr, env, recorder)
+    raise ValueError("unknown expr")
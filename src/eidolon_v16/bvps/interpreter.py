@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from typing import Any
 
 from eidolon_v16.bvps.dsl import (
@@ -17,16 +19,51 @@ from eidolon_v16.bvps.dsl import (
     ListLen,
     Program,
     Return,
+    Stmt,
     Var,
     While,
 )
 
+_COMPILED_CACHE_SIZE = 64
+
 
 @dataclass
 class Interpreter:
     step_limit: int = 1000
+    _compiled: OrderedDict[int, tuple[Program, CompiledProgram]] = field(
+        default_factory=OrderedDict, init=False, repr=False, compare=False
+    )
+
+    def run(
+        self, program: Program, args: list[Any], *, trace: bool = True
+    ) -> tuple[Any, dict[str, Any]]:
+        """Run ``program`` on ``args``.
+
+        With ``trace=False`` the program is compiled to closures once and the
+        event list comes back empty; output, step counts and the step-limit
+        error are the same as the tracing walker's.
+        """
+        if not trace:
+            compiled = self._compile(program)
+            output, steps = compiled.run(args, self.step_limit)
+            return output, {"steps": steps, "events": []}
+        return self._run_traced(program, args)
 
-    def run(self, program: Program, args: list[Any]) -> tuple[Any, dict[str, Any]]:
+    def _compile(self, program: Program) -> CompiledProgram:
+        # Programs hold lists and are unhashable; key by identity and keep the
+        # program alive alongside its compiled form so the id stays valid.
+        key = id(program)
+        cached = self._compiled.get(key)
+        if cached is not None and cached[0] is program:
+            self._compiled.move_to_end(key)
+            return cached[1]
+        compiled = compile_program(program)
+        self._compiled[key] = (program, compiled)
+        while len(self._compiled) > _COMPILED_CACHE_SIZE:
+            self._compiled.popitem(last=False)
+        return compiled
+
+    def _run_traced(self, program: Program, args: list[Any]) -> tuple[Any, dict[str, Any]]:
         env: dict[str, Any] = {}
         for name, value in zip(program.params, args, strict=False):
             env[name] = value
@@ -116,3 +153,213 @@ class Interpreter:
 
         exec_block(program.body)
         return output, {"steps": steps, "events": trace}
+
+
+class _Frame:
+    __slots__ = ("steps", "limit", "output")
+
+    def __init__(self, limit: int) -> None:
+        self.steps = 0
+        self.limit = limit
+        self.output: Any = None
+
+
+_ExprFn = Callable[[dict[str, Any]], Any]
+_StmtFn = Callable[[dict[str, Any], _Frame], bool]
+
+
+@dataclass(frozen=True)
+class CompiledProgram:
+    params: tuple[str, ...]
+    body: Callable[[dict[str, Any], _Frame], bool]
+
+    def run(self, args: list[Any], step_limit: int) -> tuple[Any, int]:
+        env: dict[str, Any] = dict(zip(self.params, args, strict=False))
+        frame = _Frame(step_limit)
+        self.body(env, frame)
+        return frame.output, frame.steps
+
+
+def compile_program(program: Program) -> CompiledProgram:
+    """Compile ``program`` to nested closures (no tracing).
+
+    Self-appends ``acc = append(acc, item)`` mutate in place when ``acc`` is
+    provably unaliased: not a parameter, only ever bound to a fresh list
+    literal or to its own append, and never copied into another variable.
+    """
+    owned = _owned_lists(program)
+    return CompiledProgram(
+        params=tuple(program.params), body=_compile_block(program.body, owned)
+    )
+
+
+def _owned_lists(program: Program) -> frozenset[str]:
+    candidates: set[str] = set()
+    rejected: set[str] = set(program.params)
+    for stmt in _walk_stmts(program.body):
+        if not isinstance(stmt, (Let, Assign)):
+            continue
+        expr = stmt.expr
+        if isinstance(expr, ConstList) or _is_self_append(stmt.name, expr):
+            candidates.add(stmt.name)
+        else:
+            rejected.add(stmt.name)
+        # Binding another variable to this list (or to its in-place append)
+        # would alias it.
+        source = expr.value if isinstance(expr, ListAppend) else expr
+        if isinstance(source, Var) and source.name != stmt.name:
+            rejected.add(source.name)
+    return frozenset(candidates - rejected)
+
+
+def _is_self_append(name: str, expr: Expr) -> bool:
+    return (
+        isinstance(expr, ListAppend)
+        and isinstance(expr.value, Var)
+        and expr.value.name == name
+    )
+
+
+def _walk_stmts(block: list[Stmt]) -> list[Stmt]:
+    stmts: list[Stmt] = []
+    for stmt in block:
+        stmts.append(stmt)
+        if isinstance(stmt, If):
+            stmts.extend(_walk_stmts(stmt.then_body))
+            stmts.extend(_walk_stmts(stmt.else_body))
+        elif isinstance(stmt, While):
+            stmts.extend(_walk_stmts(stmt.body))
+    return stmts
+
+
+def _compile_block(block: list[Stmt], owned: frozenset[str]) -> _StmtFn:
+    stmts = tuple(_compile_stmt(stmt, owned) for stmt in block)
+
+    def run_block(env: dict[str, Any], frame: _Frame) -> bool:
+        for stmt in stmts:
+            frame.steps += 1
+            if frame.steps > frame.limit:
+                raise RuntimeError("step limit exceeded")
+            if stmt(env, frame):
+                return True
+        return False
+
+    return run_block
+
+
+def _compile_stmt(stmt: Stmt, owned: frozenset[str]) -> _StmtFn:
+    if isinstance(stmt, (Let, Assign)):
+        name = stmt.name
+        if name in owned and _is_self_append(name, stmt.expr):
+            assert isinstance(stmt.expr, ListAppend)
+            item_fn = _compile_expr(stmt.expr.item)
+
+            def append_in_place(env: dict[str, Any], frame: _Frame) -> bool:
+                target = env[name]
+                target.append(int(item_fn(env)))
+                return False
+
+            return append_in_place
+        expr_fn = _compile_expr(stmt.expr)
+
+        def bind(env: dict[str, Any], frame: _Frame) -> bool:
+            env[name] = expr_fn(env)
+            return False
+
+        return bind
+    if isinstance(stmt, If):
+        cond_fn = _compile_expr(stmt.cond)
+        then_fn = _compile_block(stmt.then_body, owned)
+        else_fn = _compile_block(stmt.else_body, owned)
+
+        def branch(env: dict[str, Any], frame: _Frame) -> bool:
+            if cond_fn(env):
+                return then_fn(env, frame)
+            return else_fn(env, frame)
+
+        return branch
+    if isinstance(stmt, While):
+        cond_fn = _compile_expr(stmt.cond)
+        body_fn = _compile_block(stmt.body, owned)
+        max_steps = stmt.max_steps
+
+        def loop(env: dict[str, Any], frame: _Frame) -> bool:
+            iterations = 0
+            while cond_fn(env) and iterations < max_steps:
+                iterations += 1
+                if body_fn(env, frame):
+                    return True
+            return False
+
+        return loop
+    if isinstance(stmt, Return):
+        expr_fn = _compile_expr(stmt.expr)
+
+        def ret(env: dict[str, Any], frame: _Frame) -> bool:
+            frame.output = expr_fn(env)
+            return True
+
+        return ret
+    raise ValueError("unknown statement")
+
+
+def compile_expr(expr: Expr) -> Callable[[dict[str, Any]], Any]:
+    """Compile ``expr`` to a closure over an environment, with ``run``'s semantics."""
+    return _compile_expr(expr)
+
+
+def _compile_expr(expr: Expr) -> _ExprFn:
+    if isinstance(expr, (ConstInt, ConstBool)):
+        value = expr.value
+        return lambda env: value
+    if isinstance(expr, ConstList):
+        items = tuple(expr.value)
+        return lambda env: list(items)
+    if isinstance(expr, Var):
+        name = expr.name
+        return lambda env: env[name]
+    if isinstance(expr, BinOp):
+        left = _compile_expr(expr.left)
+        right = _compile_expr(expr.right)
+        op = expr.op
+        # Expressions are side-effect free, so converting each operand as it
+        # is evaluated gives the walker's results.
+        if op == "add":
+            return lambda env: int(left(env)) + int(right(env))
+        if op == "sub":
+            return lambda env: int(left(env)) - int(right(env))
+        if op == "mul":
+            return lambda env: int(left(env)) * int(right(env))
+        if op == "lt":
+            return lambda env: int(left(env)) < int(right(env))
+        if op == "lte":
+            return lambda env: int(left(env)) <= int(right(env))
+        if op == "gt":
+            return lambda env: int(left(env)) > int(right(env))
+        if op == "eq":
+            return lambda env: left(env) == right(env)
+        raise ValueError("unknown binop")
+    if isinstance(expr, ListLen):
+        value_fn = _compile_expr(expr.value)
+        return lambda env: len(value_fn(env))
+    if isinstance(expr, ListGet):
+        value_fn = _compile_expr(expr.value)
+        index_fn = _compile_expr(expr.index)
+        return lambda env: _list_get(value_fn(env), index_fn(env))
+    if isinstance(expr, ListAppend):
+        value_fn = _compile_expr(expr.value)
+        item_fn = _compile_expr(expr.item)
+        return lambda env: _list_append(value_fn(env), item_fn(env))
+    raise ValueError("unknown expr")
+
+
+def _list_get(value: Any, index: Any) -> Any:
+    if type(value) is list:
+        return value[int(index)]
+    return list(value)[int(index)]
+
+
+def _list_append(value: Any, item: Any) -> list[int]:
+    result = list(value)
+    result.append(int(item))
+    return result
@@ -0,0 +1,324 @@
+from __future__ import annotations
+
+import random
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from itertools import product
+from typing import Any
+
+from eidolon_v16.bvps.dsl import (
+    Assign,
+    BinOp,
+    BinOpName,
+    ConstBool,
+    ConstInt,
+    ConstList,
+    Expr,
+    If,
+    Let,
+    ListAppend,
+    ListGet,
+    ListLen,
+    Program,
+    Return,
+    Stmt,
+    TypeName,
+    Var,
+    While,
+)
+from eidolon_v16.bvps.interpreter import Interpreter, compile_expr
+
+LOOP_MAX_STEPS = 100
+SKETCH_ORDER = ("forward", "backward", "pairwise")
+INT_CONSTS = (0, 1)
+INT_ARITH_OPS: tuple[BinOpName, ...] = ("add", "sub", "mul")
+INT_CMP_OPS: tuple[BinOpName, ...] = ("lt", "lte", "gt", "eq")
+OE_SAMPLES = 32
+
+_ERROR = object()
+
+
+@dataclass(frozen=True)
+class ListSynthBudget:
+    max_expr_size: int = 5
+    max_candidates: int = 20000
+    step_limit: int = 2000
+
+
+@dataclass(frozen=True)
+class ListSynthResult:
+    program: Program
+    candidates_tried: int
+    sketch: str
+
+
+@dataclass(frozen=True)
+class _Sketch:
+    name: str
+    loop_vars: tuple[str, ...]
+
+
+_SKETCHES = {
+    "forward": _Sketch("forward", ("x", "i")),
+    "backward": _Sketch("backward", ("x", "i")),
+    "pairwise": _Sketch("pairwise", ("x", "y", "i")),
+}
+
+
+def synthesize_list_program(
+    examples: list[dict[str, Any]],
+    *,
+    accept: Callable[[Program], bool] | None = None,
+    budget: ListSynthBudget | None = None,
+) -> ListSynthResult | None:
+    """Search fold-loop sketches for a program matching ``examples``.
+
+    Candidates are tried cheapest first (guard size + update size), across
+    the forward, backward and pairwise loop sketches, in a fixed order.
+    ``accept`` is consulted for every candidate that fits the examples
+    (e.g. to run a counterexample search); returning ``False`` keeps searching.
+    Returns ``None`` once the candidate budget is spent.
+    """
+    budget = budget or ListSynthBudget()
+    if not examples:
+        return None
+    return_type = _infer_type(examples[0]["output"])
+    if return_type is None:
+        return None
+    interpreter = Interpreter(step_limit=budget.step_limit)
+    tried = 0
+    for sketch_name, program in enumerate_list_programs(examples, return_type, budget):
+        if tried >= budget.max_candidates:
+            break
+        tried += 1
+        if not _fits(program, examples, interpreter):
+            continue
+        if accept is not None and not accept(program):
+            continue
+        return ListSynthResult(program=program, candidates_tried=tried, sketch=sketch_name)
+    return None
+
+
+def enumerate_list_programs(
+    examples: list[dict[str, Any]],
+    return_type: TypeName,
+    budget: ListSynthBudget,
+) -> Iterator[tuple[str, Program]]:
+    """Yield ``(sketch, program)`` candidates in deterministic cost order."""
+    samples = _sample_values(examples)
+    banks = {
+        name: _ExprBank(return_type, sketch.loop_vars, samples, budget.max_expr_size)
+        for name, sketch in _SKETCHES.items()
+    }
+    inits = _initial_values(return_type)
+    # Cost 0 is reserved for "no guard"; updates start at size 1.
+    for cost in range(1, 2 * budget.max_expr_size + 1):
+        for sketch_name in SKETCH_ORDER:
+            bank = banks[sketch_name]
+            for guard_size in range(0, cost):
+                update_size = cost - guard_size
+                guards: list[Expr | None] = (
+                    [None] if guard_size == 0 else list(bank.guards(guard_size))
+                )
+                updates = bank.updates(update_size)
+                if not guards or not updates:
+                    continue
+                for init, guard, update in product(inits, guards, updates):
+                    yield sketch_name, _build_program(sketch_name, return_type, init, guard, update)
+
+
+class _ExprBank:
+    """Bottom-up expressions over the loop state, one per observed behaviour.
+
+    Expressions are grown by size, on demand, and evaluated with the
+    interpreter's compiled expression semantics on a fixed set of sample
+    environments; an expression whose results match an earlier (smaller) one
+    is dropped.
+    """
+
+    def __init__(
+        self,
+        acc_type: TypeName,
+        loop_vars: tuple[str, ...],
+        samples: list[dict[str, Any]],
+        max_size: int,
+    ) -> None:
+        self.acc_type = acc_type
+        self.samples = [{**sample, "acc": sample[f"acc_{acc_type}"]} for sample in samples]
+        self.by_size: dict[tuple[TypeName, int], list[tuple[Expr, tuple[Any, ...]]]] = {}
+        self._seen: set[tuple[TypeName, tuple[Any, ...]]] = set()
+        self._max_size = max_size
+        self._built = 1
+        self._leaves(loop_vars)
+
+    def updates(self, size: int) -> list[Expr]:
+        self._ensure(size)
+        # Re-assigning the accumulator to itself is a no-op.
+        return [
+            expr
+            for expr, _sig in self.by_size.get((self.acc_type, size), [])
+            if expr != Var("acc")
+        ]
+
+    def guards(self, size: int) -> Iterator[Expr]:
+        self._ensure(size)
+        for expr, signature in self.by_size.get(("bool", size), []):
+            # Constant guards are either "always" (no guard) or dead code.
+            if len(set(signature)) > 1:
+                yield expr
+
+    def _ensure(self, size: int) -> None:
+        # Grown lazily: cheap tasks never pay for the large sizes.
+        while self._built < min(size, self._max_size):
+            self._built += 1
+            self._grow(self._built)
+
+    def _add(self, type_name: TypeName, size: int, expr: Expr) -> None:
+        evaluate = compile_expr(expr)
+        signature = tuple(_evaluate(evaluate, env) for env in self.samples)
+        if any(value is _ERROR for value in signature):
+            return
+        if type_name == "bool" and not all(isinstance(value, bool) for value in signature):
+            return
+        key = (type_name, signature)
+        if key in self._seen:
+            return
+        self._seen.add(key)
+        self.by_size.setdefault((type_name, size), []).append((expr, signature))
+
+    def _leaves(self, loop_vars: tuple[str, ...]) -> None:
+        self._add(self.acc_type, 1, Var("acc"))
+        for name in loop_vars:
+            self._add("int", 1, Var(name))
+        for value in INT_CONSTS:
+            self._add("int", 1, ConstInt(value))
+        self._add("bool", 1, ConstBool(True))
+        self._add("bool", 1, ConstBool(False))
+        self._add("list_int", 1, ConstList([]))
+
+    def _grow(self, size: int) -> None:
+        for left_size in range(1, size - 1):
+            right_size = size - 1 - left_size
+            lefts = self.by_size.get(("int", left_size), [])
+            rights = self.by_size.get(("int", right_size), [])
+            for op in INT_ARITH_OPS:
+                for (left, _ls), (right, _rs) in product(lefts, rights):
+                    self._add("int", size, BinOp(op, left, right))
+            for op in INT_CMP_OPS:
+                for (left, _ls), (right, _rs) in product(lefts, rights):
+                    self._add("bool", size, BinOp(op, left, right))
+            lists = self.by_size.get(("list_int", left_size), [])
+            for (value, _vs), (item, _is) in product(lists, rights):
+                self._add("list_int", size, ListAppend(value, item))
+        for value, _sig in self.by_size.get(("list_int", size - 1), []):
+            self._add("int", size, ListLen(value))
+
+
+def _build_program(
+    sketch: str,
+    return_type: TypeName,
+    init: Expr | None,
+    guard: Expr | None,
+    update: Expr,
+) -> Program:
+    xs = Var("xs")
+    body: list[Stmt] = []
+    if init is None:
+        # Seed the accumulator with the first element when there is one.
+        body.append(Let("acc", ConstInt(0)))
+        body.append(
+            If(
+                cond=BinOp("gt", ListLen(xs), ConstInt(0)),
+                then_body=[Assign("acc", ListGet(xs, ConstInt(0)))],
+                else_body=[],
+            )
+        )
+    else:
+        body.append(Let("acc", init))
+    step: Stmt = Assign("acc", update)
+    if guard is not None:
+        step = If(cond=guard, then_body=[step], else_body=[])
+    if sketch == "backward":
+        body.append(Let("i", BinOp("sub", ListLen(xs), ConstInt(1))))
+        cond: Expr = BinOp("gt", Var("i"), ConstInt(-1))
+        advance = Assign("i", BinOp("sub", Var("i"), ConstInt(1)))
+    else:
+        body.append(Let("i", ConstInt(0)))
+        bound: Expr = ListLen(xs)
+        if sketch == "pairwise":
+            bound = BinOp("sub", ListLen(xs), ConstInt(1))
+        cond = BinOp("lt", Var("i"), bound)
+        advance = Assign("i", BinOp("add", Var("i"), ConstInt(1)))
+    loop_body: list[Stmt] = [Let("x", ListGet(xs, Var("i")))]
+    if sketch == "pairwise":
+        loop_body.append(Let("y", ListGet(xs, BinOp("add", Var("i"), ConstInt(1)))))
+    loop_body.extend([step, advance])
+    body.append(While(cond=cond, body=loop_body, max_steps=LOOP_MAX_STEPS))
+    body.append(Return(Var("acc")))
+    return Program(params=["xs"], body=body, return_type=return_type)
+
+
+def _initial_values(return_type: TypeName) -> list[Expr | None]:
+    if return_type == "int":
+        return [ConstInt(0), ConstInt(1), None]
+    if return_type == "bool":
+        return [ConstBool(True), ConstBool(False)]
+    return [ConstList([])]
+
+
+def _fits(program: Program, examples: list[dict[str, Any]], interpreter: Interpreter) -> bool:
+    for example in examples:
+        try:
+            output, _trace = interpreter.run(program, [list(example["input"])], trace=False)
+        except (RuntimeError, IndexError, KeyError, TypeError, ValueError):
+            return False
+        if output != example["output"] or type(output) is not type(example["output"]):
+            return False
+    return True
+
+
+def _infer_type(value: Any) -> TypeName | None:
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, int):
+        return "int"
+    if isinstance(value, list) and all(
+        isinstance(item, int) and not isinstance(item, bool) for item in value
+    ):
+        return "list_int"
+    return None
+
+
+def _sample_values(examples: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Deterministic loop-state environments drawn from the example lists.
+
+    Each variable is drawn independently so that equivalence on the samples
+    is not an artefact of correlated values.
+    """
+    ints = sorted({int(item) for example in examples for item in example["input"]})
+    values = sorted(set(ints[:6]) | {-2, -1, 0, 1, 2, 3, 5})
+    lists: list[list[int]] = [[], [1], [2, -1], [0, 3, 3]]
+    rng = random.Random(0)
+    samples: list[dict[str, Any]] = []
+    for _ in range(OE_SAMPLES):
+        samples.append(
+            {
+                "x": rng.choice(values),
+                "y": rng.choice(values),
+                "i": rng.randrange(5),
+                "acc_int": rng.choice(values),
+                "acc_bool": rng.random() < 0.5,
+                "acc_list_int": rng.choice(lists),
+            }
+        )
+    return samples
+
+
+def _evaluate(evaluate: Callable[[dict[str, Any]], Any], env: dict[str, Any]) -> Any:
+    try:
+        value = evaluate(env)
+    except (IndexError, KeyError, TypeError, ValueError):
+        return _ERROR
+    if isinstance(value, list):
+        return tuple(value)
+    return value
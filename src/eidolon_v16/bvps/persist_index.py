@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+
+from eidolon_v16.artifacts.store import ArtifactManifest, ManifestEntry
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = "index.sqlite"
+
+
+class PersistIndex:
+    """Entry index of a BVPS persist directory, shared by concurrent processes.
+
+    The persist ``ArtifactStore`` blobs are content-addressed and written
+    atomically; this SQLite index (WAL mode) replaces the store's
+    ``manifest.json`` for them, so processes appending at the same time
+    never drop each other's entries. Every insert gets a monotonically
+    increasing generation, and ``refresh`` only reads rows newer than the
+    last generation this process has seen.
+
+    A directory written before the index existed is imported once from its
+    manifest when the index is created.
+    """
+
+    def __init__(self, root: Path, *, timeout_s: float = 30.0) -> None:
+        self.root = root
+        self.db_path = root / INDEX_FILENAME
+        self._timeout_s = timeout_s
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._entries: dict[str, ManifestEntry] = {}
+        self._init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=self._timeout_s)
+
+    def _init_db(self) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS entries (
+                        generation INTEGER PRIMARY KEY AUTOINCREMENT,
+                        hash TEXT NOT NULL UNIQUE,
+                        type TEXT NOT NULL,
+                        entry_json TEXT NOT NULL
+                    )
+                    """
+                )
+                conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+                imported = conn.execute(
+                    "SELECT value FROM meta WHERE key = 'manifest_imported'"
+                ).fetchone()
+                if imported is None:
+                    self._import_manifest(conn)
+                    conn.execute("INSERT INTO meta (key, value) VALUES ('manifest_imported', '1')")
+        finally:
+            conn.close()
+
+    def _import_manifest(self, conn: sqlite3.Connection) -> None:
+        manifest_path = self.root / "manifest.json"
+        if not manifest_path.exists():
+            return
+        try:
+            manifest = ArtifactManifest.model_validate_json(manifest_path.read_bytes())
+        except ValueError as exc:
+            logger.warning(
+                "bvps persist manifest import skipped path=%s error=%s", manifest_path, exc
+            )
+            return
+        for entry in manifest.entries:
+            _insert(conn, entry)
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def add(self, entry: ManifestEntry) -> None:
+        """Insert ``entry`` unless its hash is already indexed; safe across processes."""
+        conn = self._connect()
+        try:
+            with conn:
+                _insert(conn, entry)
+        finally:
+            conn.close()
+
+    def entries_since(self, generation: int) -> tuple[int, list[ManifestEntry]]:
+        """Entries inserted after ``generation`` and the newest generation seen."""
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                "SELECT generation, entry_json FROM entries WHERE generation > ? "
+                "ORDER BY generation",
+                (generation,),
+            ).fetchall()
+        finally:
+            conn.close()
+        entries = [ManifestEntry.model_validate(json.loads(entry_json)) for _, entry_json in rows]
+        latest = int(rows[-1][0]) if rows else generation
+        return latest, entries
+
+    def refresh(self) -> int:
+        """Pull entries added since the last refresh; returns how many were new."""
+        with self._lock:
+            latest, entries = self.entries_since(self._generation)
+            for entry in entries:
+                self._entries.setdefault(entry.hash, entry)
+            self._generation = latest
+            return len(entries)
+
+    def entries(self, artifact_type: str | None = None) -> list[ManifestEntry]:
+        """Indexed entries after a refresh, sorted by hash like a manifest."""
+        self.refresh()
+        with self._lock:
+            entries = [
+                entry
+                for entry in self._entries.values()
+                if artifact_type is None or entry.type == artifact_type
+            ]
+        entries.sort(key=lambda entry: entry.hash)
+        return entries
+
+
+def _insert(conn: sqlite3.Connection, entry: ManifestEntry) -> None:
+    conn.execute(
+        "INSERT OR IGNORE INTO entries (hash, type, entry_json) VALUES (?, ?, ?)",
+        (entry.hash, entry.type, entry.model_dump_json()),
+    )
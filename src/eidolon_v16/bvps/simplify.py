@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import operator
+from collections.abc import Callable
+from typing import Any
+
+from eidolon_v16.bvps.ast import (
+    BinOp,
+    BinOpName,
+    BoolConst,
+    Expr,
+    ExprInterner,
+    IfThenElse,
+    IntConst,
+    MacroCall,
+    Program,
+    Var,
+    expr_to_str,
+)
+
+_COMMUTATIVE: frozenset[str] = frozenset({"add", "mul", "eq"})
+_INT_FOLDS: dict[str, Callable[[int, int], Any]] = {
+    "add": operator.add,
+    "sub": operator.sub,
+    "mul": operator.mul,
+    "mod": operator.mod,
+    "lt": operator.lt,
+    "gt": operator.gt,
+}
+
+
+class Simplifier:
+    """Constant folding and algebraic identities, bottom-up, to a canonical form.
+
+    The normal form evaluates to the same value as the input on every input
+    binding all its variables. A rewrite never drops a subexpression that can
+    raise (``mod`` by anything but a non-zero constant, macro calls), so both
+    fail on the same inputs. ``gt`` is rewritten to ``lt`` and operands of
+    commutative operators are put in a fixed order, so equivalent spellings
+    such as ``x + 1`` and ``1 + x`` share one normal form.
+
+    Results are built through ``interner``: normal forms compare by identity,
+    and interned inputs from the same interner are memoized by uid.
+    """
+
+    def __init__(self, interner: ExprInterner | None = None) -> None:
+        self.interner = interner or ExprInterner()
+        self._memo: dict[int, Expr] = {}
+        self._total: dict[int, bool] = {}
+        self._text: dict[int, str] = {}
+
+    def simplify(self, expr: Expr) -> Expr:
+        meta = expr._meta
+        if meta is None or meta.owner is not self.interner:
+            return self._rewrite(expr)
+        cached = self._memo.get(meta.uid)
+        if cached is None:
+            cached = self._rewrite(expr)
+            self._memo[meta.uid] = cached
+        return cached
+
+    def simplify_program(self, program: Program) -> Program:
+        return Program(
+            params=program.params,
+            body=self.simplify(program.body),
+            return_type=program.return_type,
+        )
+
+    def _rewrite(self, expr: Expr) -> Expr:
+        interner = self.interner
+        if isinstance(expr, IntConst):
+            return interner.int_const(expr.value)
+        if isinstance(expr, BoolConst):
+            return interner.bool_const(expr.value)
+        if isinstance(expr, Var):
+            return interner.var(expr.name)
+        if isinstance(expr, BinOp):
+            return self._binop(expr.op, self.simplify(expr.left), self.simplify(expr.right))
+        if isinstance(expr, IfThenElse):
+            return self._if(
+                self.simplify(expr.cond),
+                self.simplify(expr.then_expr),
+                self.simplify(expr.else_expr),
+            )
+        if isinstance(expr, MacroCall):
+            return interner.macro_call(expr.name, tuple(self.simplify(arg) for arg in expr.args))
+        raise ValueError("unknown expr")
+
+    def _binop(self, op: BinOpName, left: Expr, right: Expr) -> Expr:
+        interner = self.interner
+        folded = _fold(op, left, right)
+        if folded is not None:
+            if isinstance(folded, bool):
+                return interner.bool_const(folded)
+            return interner.int_const(folded)
+        if op == "gt":
+            op, left, right = "lt", right, left
+        elif op in _COMMUTATIVE and self._order_key(right) < self._order_key(left):
+            left, right = right, left
+        if op == "add":
+            if _is_int(left, 0):
+                return right
+            if _is_int(right, 0):
+                return left
+        elif op == "sub":
+            if _is_int(right, 0):
+                return left
+            if left is right and self._is_total(left):
+                return interner.int_const(0)
+        elif op == "mul":
+            if _is_int(left, 1):
+                return right
+            if _is_int(right, 1):
+                return left
+            if _is_int(left, 0) and self._is_total(right):
+                return left
+            if _is_int(right, 0) and self._is_total(left):
+                return right
+        elif op == "mod":
+            if _is_int(right, 1) and self._is_total(left):
+                return interner.int_const(0)
+        elif op == "lt":
+            if left is right and self._is_total(left):
+                return interner.bool_const(False)
+        elif op == "eq":
+            if left is right and self._is_total(left):
+                return interner.bool_const(True)
+        return interner.binop(op, left, right)
+
+    def _if(self, cond: Expr, then_expr: Expr, else_expr: Expr) -> Expr:
+        if isinstance(cond, (BoolConst, IntConst)):
+            return then_expr if bool(cond.value) else else_expr
+        if then_expr is else_expr and self._is_total(cond):
+            return then_expr
+        if (
+            isinstance(then_expr, BoolConst)
+            and isinstance(else_expr, BoolConst)
+            and then_expr.value
+            and not else_expr.value
+            and _is_comparison(cond)
+        ):
+            return cond
+        return self.interner.if_then_else(cond, then_expr, else_expr)
+
+    def _is_total(self, expr: Expr) -> bool:
+        """Whether evaluating the normal form ``expr`` can never raise."""
+        meta = expr._meta
+        assert meta is not None
+        cached = self._total.get(meta.uid)
+        if cached is not None:
+            return cached
+        total: bool
+        if isinstance(expr, (IntConst, BoolConst, Var)):
+            total = True
+        elif isinstance(expr, BinOp):
+            total = self._is_total(expr.left) and self._is_total(expr.right)
+            if expr.op == "mod" and not (
+                isinstance(expr.right, IntConst) and expr.right.value != 0
+            ):
+                total = False
+        elif isinstance(expr, IfThenElse):
+            total = (
+                self._is_total(expr.cond)
+                and self._is_total(expr.then_expr)
+                and self._is_total(expr.else_expr)
+            )
+        else:
+            total = False
+        self._total[meta.uid] = total
+        return total
+
+    def _order_key(self, expr: Expr) -> str:
+        meta = expr._meta
+        assert meta is not None
+        cached = self._text.get(meta.uid)
+        if cached is None:
+            cached = expr_to_str(expr)
+            self._text[meta.uid] = cached
+        return cached
+
+
+def simplify_expr(expr: Expr) -> Expr:
+    return Simplifier().simplify(expr)
+
+
+def simplify_program(program: Program, simplifier: Simplifier | None = None) -> Program:
+    return (simplifier or Simplifier()).simplify_program(program)
+
+
+def _fold(op: BinOpName, left: Expr, right: Expr) -> int | bool | None:
+    if op == "eq":
+        if isinstance(left, (IntConst, BoolConst)) and isinstance(right, (IntConst, BoolConst)):
+            return bool(left.value == right.value)
+        return None
+    if not (isinstance(left, IntConst) and isinstance(right, IntConst)):
+        return None
+    if op == "mod" and right.value == 0:
+        # Leave the division by zero in place so the program still raises.
+        return None
+    fold = _INT_FOLDS.get(op)
+    if fold is None:
+        return None
+    folded: int | bool = fold(left.value, right.value)
+    return folded
+
+
+def _is_int(expr: Expr, value: int) -> bool:
+    return isinstance(expr, IntConst) and expr.value == value
+
+
+def _is_comparison(expr: Expr) -> bool:
+    return isinstance(expr, BinOp) and expr.op in {"lt", "gt", "eq"}
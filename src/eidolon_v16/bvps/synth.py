@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import math
 import random
 from collections.abc import Callable
 from dataclasses import dataclass
@@ -22,6 +23,7 @@ from eidolon_v16.bvps.dsl import (
     While,
 )
 from eidolon_v16.bvps.interpreter import Interpreter
+from eidolon_v16.bvps.list_synth import synthesize_list_program
 from eidolon_v16.ucr.models import TaskInput
 
 
@@ -58,6 +60,15 @@ def synthesize_program(task: TaskInput, seed: int) -> SynthResult:
             )
         examples.append(counterexample)
 
+    searched = _search_program(operation, examples, spec, rng, interpreter)
+    if searched is not None:
+        return SynthResult(
+            program=searched,
+            examples=examples,
+            input_list=input_list,
+            operation=operation,
+        )
+
     fallback = _candidate_programs(operation)[0]
     return SynthResult(
         program=fallback,
@@ -82,19 +93,66 @@ def _normalize_examples(examples: list[dict[str, Any]], operation: str) -> list[
         return [{"input": [1, 2], "output": [2, 1]}]
     if operation == "is_sorted":
         return [{"input": [1, 2, 2], "output": True}]
+    spec = _SPEC_FUNCTIONS.get(operation)
+    if spec is not None:
+        return [{"input": list(sample), "output": spec(list(sample))} for sample in _DEFAULT_INPUTS]
     return []
 
 
+_SPEC_FUNCTIONS: dict[str, Callable[[list[int]], Any]] = {
+    "sum": lambda xs: sum(xs),
+    "max": lambda xs: max(xs) if xs else 0,
+    "reverse": lambda xs: list(reversed(xs)),
+    "is_sorted": lambda xs: all(xs[i] <= xs[i + 1] for i in range(len(xs) - 1)),
+    "min": lambda xs: min(xs) if xs else 0,
+    "length": lambda xs: len(xs),
+    "product": lambda xs: math.prod(xs),
+    "count_positive": lambda xs: sum(1 for x in xs if x > 0),
+    "filter_positive": lambda xs: [x for x in xs if x > 0],
+}
+
+_DEFAULT_INPUTS: tuple[tuple[int, ...], ...] = ((3, -1, 2), (1, 5, 2, 2), ())
+
+
 def _spec_function(operation: str) -> Callable[[list[int]], Any]:
-    if operation == "sum":
-        return lambda xs: sum(xs)
-    if operation == "max":
-        return lambda xs: max(xs) if xs else 0
-    if operation == "reverse":
-        return lambda xs: list(reversed(xs))
-    if operation == "is_sorted":
-        return lambda xs: all(xs[i] <= xs[i + 1] for i in range(len(xs) - 1))
-    return lambda xs: None
+    return _SPEC_FUNCTIONS.get(operation, lambda xs: None)
+
+
+def _search_program(
+    operation: str,
+    examples: list[dict[str, Any]],
+    spec: Callable[[list[int]], Any],
+    rng: random.Random,
+    interpreter: Interpreter,
+) -> Program | None:
+    """Enumerative fallback when no template survives the examples."""
+    search_examples = [
+        {
+            "input": [int(x) for x in example["input"]],
+            "output": example.get("output", spec([int(x) for x in example["input"]])),
+        }
+        for example in examples
+    ]
+    known_spec = operation in _SPEC_FUNCTIONS
+
+    def accept(program: Program) -> bool:
+        # Without a reference spec the examples are the whole specification.
+        if not known_spec:
+            return True
+        try:
+            counterexample = _find_counterexample(program, spec, rng, interpreter)
+        except (RuntimeError, IndexError):
+            return False
+        if counterexample is None:
+            return True
+        examples.append(counterexample)
+        search_examples.append(counterexample)
+        return False
+
+    result = synthesize_list_program(search_examples, accept=accept)
+    if result is None:
+        return None
+    return result.program
 
 
 def _passes_examples(
@@ -106,7 +164,7 @@ def _passes_examples(
     for example in examples:
         inputs = [int(x) for x in example["input"]]
         expected = example.get("output", spec(inputs))
-        output, _trace = interpreter.run(program, [inputs])
+        output, _trace = interpreter.run(program, [inputs], trace=False)
         if output != expected:
             return False
     return True
@@ -122,7 +180,7 @@ def _find_counterexample(
         length = rng.randint(0, 5)
         sample = [rng.randint(-3, 6) for _ in range(length)]
         expected = spec(sample)
-        output, _trace = interpreter.run(program, [sample])
+        output, _trace = interpreter.run(program, [sample], trace=False)
         if output != expected:
             return {"input": sample, "output": expected}
     return None
@@ -1,10 +1,9 @@
 from __future__ import annotations
 
+import hashlib
 import io
 import logging
 import tarfile
-import tempfile
-from pathlib import Path
 from typing import Any
 
 from eidolon_v16.artifacts.store import ArtifactRef, ArtifactStore
@@ -26,34 +25,47 @@ def build_capsule(
 ) -> ArtifactRef:
     capsule_type = "capsule_success" if decision.action == "answer" else "capsule_failure"
     logger.info("capsule build start type=%s", capsule_type)
-    with tempfile.TemporaryDirectory() as tmpdir:
-        base = Path(tmpdir)
-        (base / "task.json").write_bytes(canonical_json_bytes(task.model_dump(mode="json")))
-        (base / "interpretation.json").write_bytes(
-            canonical_json_bytes(interpretation.model_dump(mode="json"))
-        )
-        (base / "solution.json").write_bytes(canonical_json_bytes(solution))
-        (base / "lanes.json").write_bytes(
-            canonical_json_bytes([lane.model_dump(mode="json") for lane in lanes])
-        )
-        (base / "decision.json").write_bytes(canonical_json_bytes(decision.model_dump(mode="json")))
-        repro = f"uv run eidolon episode replay --ucr runs/{episode_id}/ucr.json\n"
-        (base / "repro.txt").write_text(repro)
-        data = _tar_directory(base)
+    members = {
+        "task.json": canonical_json_bytes(task.model_dump(mode="json")),
+        "interpretation.json": canonical_json_bytes(interpretation.model_dump(mode="json")),
+        "solution.json": canonical_json_bytes(solution),
+        "lanes.json": canonical_json_bytes([lane.model_dump(mode="json") for lane in lanes]),
+        "decision.json": canonical_json_bytes(decision.model_dump(mode="json")),
+        "repro.txt": f"uv run eidolon episode replay --ucr runs/{episode_id}/ucr.json\n".encode(),
+    }
+    data, content_hash = _tar_members(members)
     ref = store.put_bytes(
         data,
         artifact_type=capsule_type,
         media_type="application/x-tar",
         producer="capsules",
+        content_hash=content_hash,
     )
     logger.info("capsule build complete hash=%s", ref.hash)
     return ref
 
 
-def _tar_directory(path: Path) -> bytes:
-    fileobj = io.BytesIO()
+class _HashingBuffer(io.BytesIO):
+    def __init__(self) -> None:
+        super().__init__()
+        self.digest = hashlib.sha256()
+
+    def write(self, data: Any) -> int:
+        self.digest.update(data)
+        return super().write(data)
+
+
+def _tar_members(members: dict[str, bytes]) -> tuple[bytes, str]:
+    """Build a deterministic tar in memory, hashing it as it is written."""
+    fileobj = _HashingBuffer()
     with tarfile.open(fileobj=fileobj, mode="w") as tar:
-        for item in sorted(path.rglob("*")):
-            if item.is_file():
-                tar.add(item, arcname=item.relative_to(path))
-    return fileobj.getvalue()
+        for name in sorted(members):
+            payload = members[name]
+            info = tarfile.TarInfo(name=name)
+            info.size = len(payload)
+            info.mtime = 0
+            info.mode = 0o644
+            info.uid = info.gid = 0
+            info.uname = info.gname = ""
+            tar.addfile(info, io.BytesIO(payload))
+    return fileobj.getvalue(), fileobj.digest.hexdigest()
@@ -3,9 +3,15 @@ from __future__ import annotations
 import json
 import logging
 import tarfile
-import tempfile
+import time
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
+from typing import Any
 
+from eidolon_v16.artifacts.store import ArtifactStore, ManifestEntry
+from eidolon_v16.config import AppConfig
 from eidolon_v16.orchestrator.controller import EpisodeController
 from eidolon_v16.orchestrator.types import ModeConfig
 from eidolon_v16.runtime import initialize_runtime
@@ -13,6 +19,63 @@ from eidolon_v16.ucr.models import TaskInput
 
 logger = logging.getLogger(__name__)
 
+_WORKER_STATE: dict[str, Any] = {}
+
+
+@dataclass(frozen=True)
+class CapsuleReplayResult:
+    path: str
+    ok: bool
+    duration_ms: int
+    expected_action: str | None = None
+    replayed_action: str | None = None
+    ucr_hash: str | None = None
+    error: str | None = None
+
+
+@dataclass(frozen=True)
+class CapsuleBatchSummary:
+    total: int
+    passed: int
+    failed: int
+    total_ms: int
+    workers: int
+    results: list[CapsuleReplayResult] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "total": self.total,
+            "passed": self.passed,
+            "failed": self.failed,
+            "total_ms": self.total_ms,
+            "workers": self.workers,
+            "results": [asdict(result) for result in self.results],
+        }
+
+
+def read_capsule_member(path: Path, name: str) -> dict[str, Any] | list[Any] | None:
+    """Read one JSON member straight out of a capsule tar without extracting it."""
+    with tarfile.open(path) as tar:
+        try:
+            member = tar.getmember(name)
+        except KeyError:
+            return None
+        handle = tar.extractfile(member)
+        if handle is None:
+            return None
+        with handle:
+            payload = json.loads(handle.read().decode("utf-8"))
+    if isinstance(payload, (dict, list)):
+        return payload
+    return None
+
+
+def read_capsule_task(path: Path) -> TaskInput | None:
+    payload = read_capsule_member(path, "task.json")
+    if not isinstance(payload, dict):
+        return None
+    return TaskInput.model_validate(payload)
+
 
 def replay_capsule_tar(path: Path, controller: EpisodeController, seed: int = 0) -> bool:
     mode = ModeConfig(seed=seed)
@@ -23,14 +86,164 @@ def replay_capsule_tar(path: Path, controller: EpisodeController, seed: int = 0)
         logger=logger,
     )
     logger.info("capsule replay start path=%s", path)
-    with tempfile.TemporaryDirectory() as tmpdir:
-        with tarfile.open(path) as tar:
-            tar.extractall(tmpdir)
-        task_path = Path(tmpdir) / "task.json"
-        if not task_path.exists():
-            logger.warning("capsule replay missing task.json")
-            return False
-        task = TaskInput.model_validate(json.loads(task_path.read_text()))
+    task = read_capsule_task(path)
+    if task is None:
+        logger.warning("capsule replay missing task.json")
+        return False
     controller.run(task, mode)
     logger.info("capsule replay complete")
     return True
+
+
+def collect_capsule_paths(inputs: Iterable[Path]) -> list[Path]:
+    paths: list[Path] = []
+    for item in inputs:
+        if item.is_dir():
+            paths.extend(sorted(item.rglob("capsule_*.tar")))
+        elif item.is_file():
+            paths.append(item)
+        else:
+            logger.warning("capsule path not found path=%s", item)
+    seen: set[Path] = set()
+    unique: list[Path] = []
+    for path in paths:
+        resolved = path.resolve()
+        if resolved in seen:
+            continue
+        seen.add(resolved)
+        unique.append(path)
+    return unique
+
+
+def _replay_one(
+    path: Path,
+    controller: EpisodeController,
+    store: ArtifactStore,
+    mode: ModeConfig,
+) -> CapsuleReplayResult:
+    start_ns = time.monotonic_ns()
+    expected_action: str | None = None
+    try:
+        task = read_capsule_task(path)
+        if task is None:
+            raise ValueError("capsule missing task.json")
+        decision = read_capsule_member(path, "decision.json")
+        if isinstance(decision, dict) and decision.get("action") is not None:
+            expected_action = str(decision["action"])
+        result = controller.run(task, mode, store=store)
+        ucr = json.loads(result.ucr_path.read_text())
+        replayed_action = ucr.get("decision", {}).get("action")
+    except Exception as exc:
+        logger.warning("capsule replay failed path=%s error=%s", path, exc)
+        return CapsuleReplayResult(
+            path=str(path),
+            ok=False,
+            duration_ms=int((time.monotonic_ns() - start_ns) // 1_000_000),
+            expected_action=expected_action,
+            error=f"{type(exc).__name__}: {exc}",
+        )
+    ok = expected_action is None or replayed_action == expected_action
+    return CapsuleReplayResult(
+        path=str(path),
+        ok=ok,
+        duration_ms=int((time.monotonic_ns() - start_ns) // 1_000_000),
+        expected_action=expected_action,
+        replayed_action=None if replayed_action is None else str(replayed_action),
+        ucr_hash=result.ucr_hash,
+    )
+
+
+def _init_worker(config: AppConfig, mode: ModeConfig) -> None:
+    initialize_runtime(
+        cpu_threads=mode.cpu_threads,
+        use_gpu=mode.use_gpu,
+        gpu_id=mode.gpu_id,
+        logger=logger,
+    )
+    store = ArtifactStore(config.paths.artifact_store)
+    # Workers never write the shared manifest; new entries are shipped back
+    # to the parent, which merges and flushes once. Blobs are shared, so
+    # another worker must never read one half-written.
+    store.set_manifest_flush_mode("per_suite")
+    store.set_atomic_writes(True)
+    _WORKER_STATE["controller"] = EpisodeController(config=config)
+    _WORKER_STATE["store"] = store
+    _WORKER_STATE["mode"] = mode
+    _WORKER_STATE["known"] = {entry.hash for entry in store.load_manifest().entries}
+
+
+def _worker_replay(path: str) -> tuple[CapsuleReplayResult, list[dict[str, Any]]]:
+    store: ArtifactStore = _WORKER_STATE["store"]
+    known: set[str] = _WORKER_STATE["known"]
+    result = _replay_one(Path(path), _WORKER_STATE["controller"], store, _WORKER_STATE["mode"])
+    new_entries: list[dict[str, Any]] = []
+    for entry in store.load_manifest().entries:
+        if entry.hash in known:
+            continue
+        known.add(entry.hash)
+        new_entries.append(entry.model_dump(mode="json"))
+    return result, new_entries
+
+
+def replay_capsules(
+    paths: Iterable[Path],
+    *,
+    config: AppConfig,
+    seed: int = 0,
+    workers: int = 1,
+    use_gpu: bool = False,
+) -> CapsuleBatchSummary:
+    """Replay many capsules, sharing one controller per worker process.
+
+    A capsule passes when its episode re-runs and reaches the same decision
+    action that was recorded in the capsule's ``decision.json``.
+    """
+    capsule_paths = collect_capsule_paths(paths)
+    mode = ModeConfig(seed=seed, use_gpu=use_gpu)
+    workers = max(1, min(workers, len(capsule_paths) or 1))
+    logger.info("capsule batch start count=%s workers=%s", len(capsule_paths), workers)
+    start_ns = time.monotonic_ns()
+    store = ArtifactStore(config.paths.artifact_store)
+    store.set_manifest_flush_mode("per_suite")
+    results: list[CapsuleReplayResult] = []
+    if workers == 1:
+        initialize_runtime(
+            cpu_threads=mode.cpu_threads,
+            use_gpu=mode.use_gpu,
+            gpu_id=mode.gpu_id,
+            logger=logger,
+        )
+        controller = EpisodeController(config=config)
+        for path in capsule_paths:
+            results.append(_replay_one(path, controller, store, mode))
+    else:
+        manifest = store.load_manifest()
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(config, mode),
+        ) as executor:
+            for result, new_entries in executor.map(
+                _worker_replay, [str(path) for path in capsule_paths]
+            ):
+                results.append(result)
+                for entry in new_entries:
+                    manifest.add_entry(ManifestEntry.model_validate(entry))
+    store.flush_manifest(force=True)
+    passed = sum(1 for result in results if result.ok)
+    summary = CapsuleBatchSummary(
+        total=len(results),
+        passed=passed,
+        failed=len(results) - passed,
+        total_ms=int((time.monotonic_ns() - start_ns) // 1_000_000),
+        workers=workers,
+        results=results,
+    )
+    logger.info(
+        "capsule batch complete total=%s passed=%s failed=%s total_ms=%s",
+        summary.total,
+        summary.passed,
+        summary.failed,
+        summary.total_ms,
+    )
+    return summary
@@ -7,6 +7,7 @@ from pathlib import Path
 import typer
 from rich.console import Console
 
+from eidolon_v16.capsules.runner import replay_capsules
 from eidolon_v16.config import default_config
 from eidolon_v16.eval.open_eval import run_open_eval
 from eidolon_v16.eval.sealed_eval import run_sealed_eval
@@ -25,12 +26,14 @@ eval_app = typer.Typer(help="Evaluation commands")
 skills_app = typer.Typer(help="Skills commands")
 ledger_app = typer.Typer(help="Ledger commands")
 language_app = typer.Typer(help="Language patch commands")
+capsules_app = typer.Typer(help="Capsule commands")
 
 app.add_typer(episode_app, name="episode")
 app.add_typer(eval_app, name="eval")
 app.add_typer(skills_app, name="skills")
 app.add_typer(ledger_app, name="ledger")
 app.add_typer(language_app, name="language")
+app.add_typer(capsules_app, name="capsules")
 
 console = Console()
 logger = logging.getLogger(__name__)
@@ -43,6 +46,9 @@ SUITE_OPTION = typer.Option(..., "--suite", "--suite-file", exists=True, dir_oka
 OUT_DIR_OPTION = typer.Option(None, "--out-dir", "--out")
 SEALED_SEED_OPTION = typer.Option(None, "--seed")
 REVEAL_SEED_OPTION = typer.Option(False, "--reveal-seed")
+CAPSULE_PATHS_ARGUMENT = typer.Argument(..., exists=True)
+WORKERS_OPTION = typer.Option(1, "--workers", min=1)
+SUMMARY_OUT_OPTION = typer.Option(None, "--out", dir_okay=False)
 
 
 def _load_task(path: Path) -> TaskInput:
@@ -174,6 +180,30 @@ def eval_suite(
     console.print(f"Suite report: {result.report_path}")
 
 
+@capsules_app.command("replay")
+def capsules_replay(
+    paths: list[Path] = CAPSULE_PATHS_ARGUMENT,
+    seed: int = SEED_OPTION,
+    workers: int = WORKERS_OPTION,
+    out: Path | None = SUMMARY_OUT_OPTION,
+) -> None:
+    logger.info("capsules replay start paths=%s workers=%s", len(paths), workers)
+    config = default_config()
+    summary = replay_capsules(paths, config=config, seed=seed, workers=workers)
+    if out is not None:
+        out.parent.mkdir(parents=True, exist_ok=True)
+        out.write_text(json.dumps(summary.to_dict(), indent=2, sort_keys=True))
+    for result in summary.results:
+        if not result.ok:
+            console.print(f"FAIL {result.path}: {result.error or result.replayed_action}")
+    console.print(
+        f"Capsules replayed: {summary.total} passed={summary.passed} "
+        f"failed={summary.failed} total_ms={summary.total_ms}"
+    )
+    if summary.failed:
+        raise typer.Exit(code=1)
+
+
 @skills_app.command("list")
 def skills_list() -> None:
     initialize_runtime(logger=logger)
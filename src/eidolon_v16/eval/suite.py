@@ -8,11 +8,13 @@ import re
 import socket
 import subprocess
 import sys
+import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from eidolon_v16 import metrics, tracing
 from eidolon_v16.artifacts.store import ArtifactStore
 from eidolon_v16.bvps import cache as bvps_cache
 from eidolon_v16.config import AppConfig
@@ -44,20 +46,26 @@ class SuiteReport:
 
 def run_suite(config: AppConfig, suite_path: Path, out_dir: Path | None = None) -> SuiteReport:
     suite_spec = _load_suite_yaml(suite_path.read_bytes(), suite_path)
+    probes = metrics.registry()
+    probes_start = probes.snapshot() if probes.enabled else None
+    trace = tracing.tracer()
+    trace_scope = trace.open_scope() if trace is not None else None
+    suite_start = time.perf_counter()
     store = ArtifactStore(config.paths.artifact_store)
     suite_meta: dict[str, Any] = {}
     bvps_cache_entries: dict[tuple[str, str, int], dict[str, Any]] = {}
-    if (
-        bvps_cache.persist_enabled()
-        and os.getenv("EIDOLON_BVPS_PERSIST_PRELOAD", "").strip() == "1"
-    ):
+    preload_mode = os.getenv("EIDOLON_BVPS_PERSIST_PRELOAD", "").strip().lower()
+    if bvps_cache.persist_enabled() and preload_mode in {"1", "lazy"}:
         persist_store = bvps_cache.persist_store()
-        cache_entries, stats = bvps_cache.preload_persistent_cache(persist_store)
-        bvps_cache_entries.update(cache_entries)
+        bvps_cache_entries, stats = bvps_cache.preload_persistent_cache(
+            persist_store, lazy=preload_mode == "lazy"
+        )
         suite_meta = {
             "bvps_persist_preload_ms": stats.preload_ms,
             "bvps_persist_preload_entries": stats.entries,
             "bvps_persist_preload_errors": stats.errors,
+            "bvps_persist_preload_snapshot_entries": stats.snapshot_entries,
+            "bvps_persist_preload_lazy_entries": stats.lazy_entries,
         }
     store.set_manifest_flush_mode("per_suite")
     controller = EpisodeController(config=config, bvps_cache=bvps_cache_entries)
@@ -80,20 +88,19 @@ def run_suite(config: AppConfig, suite_path: Path, out_dir: Path | None = None)
     verify_json_serialize_values: list[int] = []
     verify_store_manifest_values: list[int] = []
     solve_model_values: list[int] = []
+    kernel_load_values: list[int] = []
     solve_cache_lookup_values: list[int] = []
     verify_check_count_values: dict[str, list[int]] = {}
     solve_other_values: list[int] = []
     verify_checks_values: dict[str, list[int]] = {}
     for seed in suite_spec.seeds:
         logger.info("suite run seed=%s", seed)
-        for task_entry in suite_spec.tasks:
-            raw = json.loads(task_entry.path.read_text())
-            task = TaskInput.from_raw(raw)
-            result = controller.run(
-                task,
-                ModeConfig(seed=seed, use_gpu=False),
-                store=store,
-            )
+        tasks = [
+            TaskInput.from_raw(json.loads(task_entry.path.read_text()))
+            for task_entry in suite_spec.tasks
+        ]
+        episodes = controller.run_many(tasks, ModeConfig(seed=seed, use_gpu=False), store=store)
+        for task_entry, result in zip(suite_spec.tasks, episodes, strict=True):
             payload = json.loads(result.ucr_path.read_text())
             verification = payload.get("verification", [])
             if not isinstance(verification, list):
@@ -128,6 +135,8 @@ def run_suite(config: AppConfig, suite_path: Path, out_dir: Path | None = None)
             if "overhead_ms" in costs:
                 overhead_values.append(overhead_ms)
             _merge_lane_ms(lane_ms_sum, lane_ms)
+            if "kernel_load_ms" in costs:
+                kernel_load_values.append(_as_int(costs.get("kernel_load_ms")))
             solve_breakdown = costs.get("solve_breakdown_ms", {})
             if not isinstance(solve_breakdown, dict):
                 solve_breakdown = {}
@@ -321,6 +330,11 @@ def run_suite(config: AppConfig, suite_path: Path, out_dir: Path | None = None)
                     run_entry.setdefault(key, value)
             results.append(run_entry)
 
+    if isinstance(bvps_cache_entries, bvps_cache.LazyPersistCache):
+        # Entries read on demand go into the snapshot for the next preload.
+        suite_meta["bvps_persist_preload_hydrated_entries"] = (
+            bvps_cache_entries.flush_snapshot()
+        )
     total_ms_sum = sum(total_ms_values)
     total_ms_mean = int(total_ms_sum / len(total_ms_values)) if total_ms_values else 0
     total_ms_p95 = _percentile(total_ms_values, 0.95)
@@ -420,6 +434,8 @@ def run_suite(config: AppConfig, suite_path: Path, out_dir: Path | None = None)
             "overhead_residual_ms_max": max(overhead_residual_values)
             if overhead_residual_values
             else 0,
+            "kernel_load_ms_sum": sum(kernel_load_values),
+            "kernel_load_ms_max": max(kernel_load_values) if kernel_load_values else 0,
             "solve_model_ms_sum": solve_model_sum,
             "solve_model_ms_mean": solve_model_mean,
             "solve_model_ms_p95": _percentile(solve_model_values, 0.95),
@@ -459,6 +475,8 @@ def run_suite(config: AppConfig, suite_path: Path, out_dir: Path | None = None)
                 report["metrics"][f"suite_store_manifest_flush_detail_{key}_p95"] = value_int
                 report["metrics"][f"suite_store_manifest_flush_detail_{key}_p99"] = value_int
                 report["metrics"][f"suite_store_manifest_flush_detail_{key}_max"] = value_int
+    if probes_start is not None:
+        report["probes"] = probes.export(probes.delta(probes_start))
     persist_stats = bvps_cache.persist_stats_snapshot()
     if persist_stats:
         disable_reason = str(
@@ -533,6 +551,14 @@ def run_suite(config: AppConfig, suite_path: Path, out_dir: Path | None = None)
         media_type="application/json",
         producer="eval",
     )
+    if trace is not None and trace_scope is not None:
+        trace.record(
+            "suite", suite_start, time.perf_counter(), cat="suite", suite=suite_spec.suite_name
+        )
+        try:
+            trace.write(out_dir / "trace.json", since=trace_scope)
+        finally:
+            trace.close_scope(trace_scope)
     logger.info("suite complete report=%s", report_path)
     return SuiteReport(report_path=report_path)
 
@@ -1,10 +1,133 @@
 from __future__ import annotations
 
+import hashlib
+import importlib
 import json
+import os
+import re
+from collections import OrderedDict
 from typing import Any
 
+_STDLIB_ENCODER = json.JSONEncoder(
+    sort_keys=True,
+    separators=(",", ":"),
+    ensure_ascii=False,
+)
 
-def dumps_bytes(obj: Any) -> bytes:
-    return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode(
-        "utf-8"
+# orjson renders floats differently from the stdlib (``1e-05`` vs ``0.00001``,
+# ``1e+16`` vs ``1e16``) and maps non-finite floats to ``null``. Any output
+# containing a float-looking or null token is re-encoded with the stdlib so
+# the canonical bytes never depend on which backend is installed. Matches
+# inside string values are harmless false positives.
+_ORJSON_UNSAFE = re.compile(rb"(?:^|[:,\[])(?:-?\d+[.eE]|null)")
+
+
+def _load_orjson() -> Any | None:
+    backend = os.getenv("EIDOLON_JSON_BACKEND", "").strip().lower() or "auto"
+    if backend == "stdlib":
+        return None
+    try:
+        return importlib.import_module("orjson")
+    except ImportError:
+        return None
+
+
+_orjson = _load_orjson()
+_ORJSON_OPTIONS = 0
+if _orjson is not None:
+    _ORJSON_OPTIONS = (
+        _orjson.OPT_SORT_KEYS
+        | _orjson.OPT_PASSTHROUGH_DATACLASS
+        | _orjson.OPT_PASSTHROUGH_DATETIME
+        | _orjson.OPT_PASSTHROUGH_SUBCLASS
     )
+
+
+def _orjson_default(obj: Any) -> Any:
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps_bytes_stdlib(obj: Any) -> bytes:
+    return _STDLIB_ENCODER.encode(obj).encode("utf-8")
+
+
+def _dumps_bytes_orjson(obj: Any) -> bytes | None:
+    """Encode with orjson, or return None when the stdlib must decide."""
+    if _orjson is None:
+        return None
+    try:
+        data: bytes = _orjson.dumps(obj, default=_orjson_default, option=_ORJSON_OPTIONS)
+    except (TypeError, _orjson.JSONEncodeError):
+        return None
+    if _ORJSON_UNSAFE.search(data) is not None:
+        return None
+    return data
+
+
+def backend_name() -> str:
+    return "orjson" if _orjson is not None else "stdlib"
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    data = _dumps_bytes_orjson(obj)
+    if data is None:
+        return _dumps_bytes_stdlib(obj)
+    return data
+
+
+class CanonicalMemo:
+    """Identity-keyed cache of canonical encodings.
+
+    Only hand it payloads that are not mutated after the first encode: entries
+    are keyed by ``id(obj)`` and keep a strong reference so the id cannot be
+    recycled while cached.
+    """
+
+    def __init__(self, max_entries: int = 256) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[int, tuple[Any, bytes, str | None]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _lookup(self, obj: Any) -> tuple[Any, bytes, str | None] | None:
+        key = id(obj)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] is obj:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+        return None
+
+    def _insert(self, obj: Any, data: bytes, digest: str | None) -> None:
+        self._entries[id(obj)] = (obj, data, digest)
+        self._entries.move_to_end(id(obj))
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def dumps_bytes(self, obj: Any) -> bytes:
+        entry = self._lookup(obj)
+        if entry is not None:
+            return entry[1]
+        self.misses += 1
+        data = dumps_bytes(obj)
+        self._insert(obj, data, None)
+        return data
+
+    def sha256(self, obj: Any) -> str:
+        entry = self._lookup(obj)
+        if entry is not None and entry[2] is not None:
+            return entry[2]
+        if entry is None:
+            self.misses += 1
+            data = dumps_bytes(obj)
+        else:
+            data = entry[1]
+        digest = hashlib.sha256(data).hexdigest()
+        self._insert(obj, data, digest)
+        return digest
+
+    def clear(self) -> None:
+        self._entries.clear()
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
-from typing import Any, Protocol
+from typing import Any, Protocol, TypeVar, cast
 
 from eidolon_v16.ucr.models import Interpretation, TaskInput
 
+_T = TypeVar("_T")
+
 
 @dataclass(frozen=True)
 class SolutionCandidate:
@@ -25,3 +28,65 @@ class Kernel(Protocol):
 
     def critique(self, task: TaskInput, solution: SolutionCandidate, *, seed: int) -> str:
         ...
+
+
+class BatchKernel(Protocol):
+    async def propose_interpretations_batch(
+        self, tasks: Sequence[TaskInput], *, seeds: Sequence[int]
+    ) -> list[list[Interpretation]]:
+        ...
+
+    async def propose_solution_batch(
+        self,
+        requests: Sequence[tuple[TaskInput, Interpretation]],
+        *,
+        seeds: Sequence[int],
+    ) -> list[SolutionCandidate]:
+        ...
+
+
+def supports_batch(kernel: Kernel) -> bool:
+    return callable(getattr(kernel, "propose_interpretations_batch", None)) and callable(
+        getattr(kernel, "propose_solution_batch", None)
+    )
+
+
+async def propose_interpretations_batch(
+    kernel: Kernel, tasks: Sequence[TaskInput], *, seeds: Sequence[int]
+) -> list[list[Interpretation]]:
+    """Batch helper that falls back to one-at-a-time calls for plain kernels."""
+    if len(tasks) != len(seeds):
+        raise ValueError("tasks and seeds must have the same length")
+    if supports_batch(kernel):
+        batched = await cast(BatchKernel, kernel).propose_interpretations_batch(
+            tasks, seeds=seeds
+        )
+        return _checked_batch(batched, len(tasks))
+    return [
+        kernel.propose_interpretations(task, seed=seed)
+        for task, seed in zip(tasks, seeds, strict=True)
+    ]
+
+
+async def propose_solution_batch(
+    kernel: Kernel,
+    requests: Sequence[tuple[TaskInput, Interpretation]],
+    *,
+    seeds: Sequence[int],
+) -> list[SolutionCandidate]:
+    if len(requests) != len(seeds):
+        raise ValueError("requests and seeds must have the same length")
+    if supports_batch(kernel):
+        batched = await cast(BatchKernel, kernel).propose_solution_batch(requests, seeds=seeds)
+        return _checked_batch(batched, len(requests))
+    return [
+        kernel.propose_solution(task, interpretation, seed=seed)
+        for (task, interpretation), seed in zip(requests, seeds, strict=True)
+    ]
+
+
+def _checked_batch(results: list[_T], expected: int) -> list[_T]:
+    # Callers pair results with their inputs by position.
+    if len(results) != expected:
+        raise ValueError(f"batch kernel returned {len(results)} results for {expected} inputs")
+    return results
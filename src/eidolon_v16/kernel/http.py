@@ -1,23 +1,215 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import http.client
 import json
 import logging
-import urllib.request
+import os
+import threading
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Any, cast
+from urllib.parse import urlsplit
 
 from eidolon_v16.artifacts.store import ArtifactStore
 from eidolon_v16.kernel.base import Kernel, SolutionCandidate
+from eidolon_v16.kernel.env import get_float_env, get_int_env
+from eidolon_v16.kernel.response_cache import ResponseCache
 from eidolon_v16.ucr.canonical import canonical_json_bytes
 from eidolon_v16.ucr.models import Interpretation, TaskInput
 
 logger = logging.getLogger(__name__)
 
+_TRANSIENT_ERRORS: tuple[type[BaseException], ...] = (
+    ConnectionError,
+    TimeoutError,
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    http.client.IncompleteRead,
+)
+
+
+class KernelHttpError(RuntimeError):
+    def __init__(self, method: str, status: int, body: bytes) -> None:
+        super().__init__(f"kernel http {method} failed status={status}")
+        self.method = method
+        self.status = status
+        self.body = body
+
+
+class KernelReplayMissError(RuntimeError):
+    def __init__(self, method: str, request_hash: str) -> None:
+        super().__init__(
+            f"kernel replay miss method={method} request_sha256={request_hash}"
+        )
+        self.method = method
+        self.request_hash = request_hash
+
+
+_CACHE_MODES = {"off", "on", "replay"}
+
+
+def cache_mode_from_env() -> str:
+    raw = os.getenv("EIDOLON_KERNEL_CACHE", "").strip().lower()
+    if raw in {"", "0", "false", "no", "off"}:
+        return "off"
+    if raw in {"1", "true", "yes", "on"}:
+        return "on"
+    if raw == "replay":
+        return "replay"
+    raise ValueError("EIDOLON_KERNEL_CACHE must be one of off, on, replay")
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    max_attempts: int = 3
+    backoff_s: float = 0.1
+    max_backoff_s: float = 2.0
+    retry_statuses: frozenset[int] = field(
+        default_factory=lambda: frozenset({429, 502, 503, 504})
+    )
+
+    @classmethod
+    def from_env(cls) -> RetryPolicy:
+        attempts = get_int_env("EIDOLON_KERNEL_RETRIES", 2) + 1
+        backoff = get_float_env("EIDOLON_KERNEL_BACKOFF_S", 0.1)
+        return cls(max_attempts=max(1, attempts), backoff_s=max(0.0, backoff))
+
+    def delay_s(self, attempt: int) -> float:
+        return float(min(self.max_backoff_s, self.backoff_s * (2 ** (attempt - 1))))
+
+
+class HttpConnectionPool:
+    """Keep-alive ``http.client`` connections, pooled per (scheme, host, port)."""
+
+    def __init__(self, max_idle_per_host: int = 4) -> None:
+        self.max_idle_per_host = max_idle_per_host
+        self._idle: dict[tuple[str, str, int], list[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+        self.connections_opened = 0
+
+    def _acquire(
+        self, key: tuple[str, str, int], timeout_s: float
+    ) -> tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                conn = idle.pop()
+                conn.timeout = timeout_s
+                return conn, True
+            self.connections_opened += 1
+        scheme, host, port = key
+        if scheme == "https":
+            return http.client.HTTPSConnection(host, port, timeout=timeout_s), False
+        return http.client.HTTPConnection(host, port, timeout=timeout_s), False
+
+    def _release(self, key: tuple[str, str, int], conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle_per_host:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def request(
+        self,
+        url: str,
+        body: bytes,
+        *,
+        headers: dict[str, str],
+        timeout_s: float,
+    ) -> tuple[int, bytes]:
+        parts = urlsplit(url)
+        scheme = parts.scheme or "http"
+        port = parts.port or (443 if scheme == "https" else 80)
+        key = (scheme, parts.hostname or "localhost", port)
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+        conn, reused = self._acquire(key, timeout_s)
+        try:
+            conn.request("POST", path, body=body, headers=headers)
+            response = conn.getresponse()
+            data = response.read()
+        except _TRANSIENT_ERRORS:
+            conn.close()
+            if not reused:
+                raise
+            # The server dropped an idle keep-alive connection; retry once on
+            # a fresh one without consuming a retry attempt.
+            conn, _ = self._acquire(key, timeout_s)
+            try:
+                conn.request("POST", path, body=body, headers=headers)
+                response = conn.getresponse()
+                data = response.read()
+            except BaseException:
+                conn.close()
+                raise
+        except BaseException:
+            conn.close()
+            raise
+        if response.will_close:
+            conn.close()
+        else:
+            self._release(key, conn)
+        return response.status, data
+
+    def close(self) -> None:
+        with self._lock:
+            idle = self._idle
+            self._idle = {}
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
+
+
+_DEFAULT_POOL = HttpConnectionPool()
+
+
+def default_pool() -> HttpConnectionPool:
+    return _DEFAULT_POOL
+
 
 class HttpKernel(Kernel):
-    def __init__(self, base_url: str, store: ArtifactStore, timeout_s: float = 30.0) -> None:
+    def __init__(
+        self,
+        base_url: str,
+        store: ArtifactStore,
+        timeout_s: float = 30.0,
+        *,
+        pool: HttpConnectionPool | None = None,
+        retry: RetryPolicy | None = None,
+        max_concurrency: int | None = None,
+        cache_mode: str | None = None,
+        cache_dir: Path | None = None,
+    ) -> None:
         self.base_url = base_url.rstrip("/")
         self.store = store
         self.timeout_s = timeout_s
+        self.pool = pool if pool is not None else _DEFAULT_POOL
+        self.retry = retry if retry is not None else RetryPolicy.from_env()
+        if max_concurrency is None:
+            max_concurrency = get_int_env("EIDOLON_KERNEL_CONCURRENCY", 8)
+        self.max_concurrency = max(1, max_concurrency)
+        # ArtifactStore is not thread-safe; batch calls record from worker threads.
+        self._store_lock = threading.Lock()
+        self.cache_mode = cache_mode if cache_mode is not None else cache_mode_from_env()
+        if self.cache_mode not in _CACHE_MODES:
+            raise ValueError(f"unknown kernel cache mode: {self.cache_mode}")
+        self._cache: ResponseCache | None = None
+        if self.cache_mode != "off":
+            if cache_dir is None:
+                override = os.getenv("EIDOLON_KERNEL_CACHE_DIR", "").strip()
+                cache_dir = Path(override).expanduser() if override else store.root / "kernel_cache"
+            self._cache = ResponseCache(cache_dir)
+
+    def bind_store(self, store: ArtifactStore) -> None:
+        """Record later calls into ``store``; a pooled kernel outlives each episode's store."""
+        with self._store_lock:
+            self.store = store
 
     def propose_interpretations(self, task: TaskInput, *, seed: int) -> list[Interpretation]:
         payload = {"seed": seed, "task": task.model_dump(mode="json")}
@@ -62,28 +254,124 @@ class HttpKernel(Kernel):
             raise ValueError("kernel http response missing critique string")
         return critique
 
+    async def propose_interpretations_batch(
+        self, tasks: Sequence[TaskInput], *, seeds: Sequence[int]
+    ) -> list[list[Interpretation]]:
+        if len(tasks) != len(seeds):
+            raise ValueError("tasks and seeds must have the same length")
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def one(task: TaskInput, seed: int) -> list[Interpretation]:
+            async with semaphore:
+                return await asyncio.to_thread(self.propose_interpretations, task, seed=seed)
+
+        return list(
+            await asyncio.gather(
+                *(one(task, seed) for task, seed in zip(tasks, seeds, strict=True))
+            )
+        )
+
+    async def propose_solution_batch(
+        self,
+        requests: Sequence[tuple[TaskInput, Interpretation]],
+        *,
+        seeds: Sequence[int],
+    ) -> list[SolutionCandidate]:
+        if len(requests) != len(seeds):
+            raise ValueError("requests and seeds must have the same length")
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def one(
+            task: TaskInput, interpretation: Interpretation, seed: int
+        ) -> SolutionCandidate:
+            async with semaphore:
+                return await asyncio.to_thread(
+                    self.propose_solution, task, interpretation, seed=seed
+                )
+
+        return list(
+            await asyncio.gather(
+                *(
+                    one(task, interpretation, seed)
+                    for (task, interpretation), seed in zip(requests, seeds, strict=True)
+                )
+            )
+        )
+
+    def _record(self, record: dict[str, Any]) -> None:
+        with self._store_lock:
+            self.store.put_json(record, artifact_type="kernel_call", producer="kernel_http")
+
+    def _send(self, method: str, url: str, request_body: bytes) -> tuple[int, bytes, int]:
+        headers = {"Content-Type": "application/json", "Connection": "keep-alive"}
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                status, body = self.pool.request(
+                    url, request_body, headers=headers, timeout_s=self.timeout_s
+                )
+            except _TRANSIENT_ERRORS as exc:
+                if attempt >= self.retry.max_attempts:
+                    raise
+                logger.warning(
+                    "kernel http transient error method=%s attempt=%s error=%r",
+                    method,
+                    attempt,
+                    exc,
+                )
+            else:
+                if status < 400:
+                    return status, body, attempt
+                if status not in self.retry.retry_statuses or attempt >= self.retry.max_attempts:
+                    raise KernelHttpError(method, status, body)
+                logger.warning(
+                    "kernel http retryable status method=%s attempt=%s status=%s",
+                    method,
+                    attempt,
+                    status,
+                )
+            time.sleep(self.retry.delay_s(attempt))
+
     def _call(self, method: str, payload: dict[str, Any]) -> dict[str, Any]:
         url = f"{self.base_url}/{method}"
         logger.info("kernel http call start method=%s url=%s", method, url)
         request_body = canonical_json_bytes(payload)
-        request = urllib.request.Request(
-            url,
-            data=request_body,
-            headers={"Content-Type": "application/json"},
-            method="POST",
-        )
         record: dict[str, Any] = {"method": method, "url": url, "request": payload}
+        cache_key: str | None = None
+        if self._cache is not None:
+            request_hash = hashlib.sha256(request_body).hexdigest()
+            cache_key = ResponseCache.key({"url": url, "request_sha256": request_hash})
+            cached = self._cache.get(cache_key)
+            if isinstance(cached, dict) and isinstance(cached.get("response"), dict):
+                record.update(
+                    {"response": cached["response"], "status": cached.get("status"), "cached": True}
+                )
+                self._record(record)
+                logger.info("kernel http cache hit method=%s", method)
+                return cast(dict[str, Any], cached["response"])
+            if self.cache_mode == "replay":
+                error = KernelReplayMissError(method, request_hash)
+                record["error"] = repr(error)
+                self._record(record)
+                raise error
         try:
-            with urllib.request.urlopen(request, timeout=self.timeout_s) as response:
-                response_body = response.read()
-                status = response.status
+            status, response_body, attempts = self._send(method, url, request_body)
             response_json = json.loads(response_body.decode("utf-8"))
             record.update({"response": response_json, "status": status})
-            self.store.put_json(record, artifact_type="kernel_call", producer="kernel_http")
+            if attempts > 1:
+                record["attempts"] = attempts
+            if (
+                self._cache is not None
+                and cache_key is not None
+                and isinstance(response_json, dict)
+            ):
+                self._cache.put(cache_key, {"status": status, "response": response_json})
+            self._record(record)
             logger.info("kernel http call done method=%s status=%s", method, status)
             return cast(dict[str, Any], response_json)
         except Exception as exc:
             record["error"] = repr(exc)
-            self.store.put_json(record, artifact_type="kernel_call", producer="kernel_http")
+            self._record(record)
             logger.exception("kernel http call failed method=%s", method)
             raise
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import Any
+
+from eidolon_v16.kernel.base import Kernel
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PooledKernel:
+    kernel: Kernel
+    info: dict[str, Any]
+    load_ms: int
+    uses: int = 0
+
+
+class KernelPool:
+    """Kernels built once per fingerprint and shared across episodes.
+
+    The fingerprint must cover everything the factory reads (kernel kind,
+    model path, runtime knobs) so a changed environment builds a new kernel
+    instead of silently reusing a stale one.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[Hashable, PooledKernel] = {}
+        self._lock = threading.Lock()
+        self.loads = 0
+        self.hits = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(
+        self,
+        key: Hashable,
+        factory: Callable[[], tuple[Kernel, dict[str, Any]]],
+    ) -> tuple[PooledKernel, bool]:
+        """Return ``(entry, reused)``, building the kernel on first use of ``key``."""
+        # Loading under the lock keeps concurrent callers from loading the
+        # same model twice.
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.uses += 1
+                self.hits += 1
+                return entry, True
+            start = time.perf_counter()
+            kernel, info = factory()
+            load_ms = int((time.perf_counter() - start) * 1000)
+            entry = PooledKernel(kernel=kernel, info=info, load_ms=load_ms, uses=1)
+            self._entries[key] = entry
+            self.loads += 1
+        logger.info("kernel pool load kind=%s load_ms=%s", info.get("kind"), load_ms)
+        return entry, False
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_DEFAULT_POOL = KernelPool()
+
+
+def default_kernel_pool() -> KernelPool:
+    return _DEFAULT_POOL
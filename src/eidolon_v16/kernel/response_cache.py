@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from eidolon_v16.json_canon import dumps_bytes
+from eidolon_v16.ucr.canonical import sha256_canonical
+
+logger = logging.getLogger(__name__)
+
+
+def default_cache_dir(name: str) -> Path:
+    xdg_cache = os.getenv("XDG_CACHE_HOME", "").strip()
+    base = Path(xdg_cache).expanduser() if xdg_cache else Path.home() / ".cache"
+    return (base / "eidolon_v16" / name).resolve()
+
+
+class ResponseCache:
+    """On-disk kernel response cache, one JSON file per canonical key hash.
+
+    Writes go through a temp file and ``os.replace`` so concurrent episodes
+    never observe a torn entry; unreadable entries count as misses.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+
+    @staticmethod
+    def key(parts: dict[str, Any]) -> str:
+        return sha256_canonical(parts)
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Any | None:
+        path = self._path(key)
+        try:
+            payload = json.loads(path.read_bytes())
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, ValueError) as exc:
+            logger.warning("response cache unreadable path=%s error=%s", path, exc)
+            self.misses += 1
+            return None
+        if not isinstance(payload, dict) or payload.get("key") != key:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return payload.get("response")
+
+    def put(self, key: str, response: Any, *, meta: dict[str, Any] | None = None) -> None:
+        path = self._path(key)
+        record: dict[str, Any] = {"key": key, "response": response}
+        if meta:
+            record["meta"] = meta
+        data = dumps_bytes(record)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-", suffix=".json")
+            try:
+                with os.fdopen(fd, "wb") as handle:
+                    handle.write(data)
+                os.replace(tmp_name, path)
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+        except OSError as exc:
+            logger.warning("response cache write failed path=%s error=%s", path, exc)
+            return
+        self.writes += 1
@@ -1,18 +1,25 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
 import logging
 import os
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass, replace
+from pathlib import Path
 from typing import Any, cast
 
 from eidolon_v16.kernel.base import Kernel, SolutionCandidate
+from eidolon_v16.kernel.env import get_float_env, get_int_env
+from eidolon_v16.kernel.response_cache import ResponseCache, default_cache_dir
 from eidolon_v16.kernel.stub import StubKernel
 from eidolon_v16.ucr.models import Interpretation, TaskInput
 
 logger = logging.getLogger(__name__)
 
+_FINGERPRINT_CHUNK = 1 << 20
+
 
 @dataclass(frozen=True)
 class LlamaCppConfig:
@@ -33,6 +40,11 @@ class LlamaCppKernel(Kernel):
         self.config = config
         self._fallback = StubKernel()
         self._llama = llama
+        self._model_hash = _model_fingerprint(config.gguf_path)
+        self._response_cache = _response_cache_from_env(config.temperature)
+        prompt_cache_mb = get_int_env("EIDOLON_LLAMA_PROMPT_CACHE_MB", 256)
+        if _attach_prompt_cache(llama, prompt_cache_mb):
+            logger.info("llamacpp prompt KV cache enabled capacity_mb=%s", prompt_cache_mb)
         logger.info(
             "llamacpp kernel init gguf=%s n_ctx=%s n_gpu_layers=%s n_threads=%s "
             "n_batch=%s temp=%s chat_format=%s",
@@ -45,61 +57,118 @@ class LlamaCppKernel(Kernel):
             config.chat_format,
         )
 
-    def complete(self, prompt: str, max_tokens: int, stop: Sequence[str] | None) -> str:
-        logger.info("llamacpp complete start max_tokens=%s", max_tokens)
-        response = cast(Any, self._llama(
-            prompt,
-            max_tokens=max_tokens,
-            stop=stop,
-            temperature=self.config.temperature,
-        ))
-        text = _extract_chat_text(response)
-        logger.info("llamacpp complete done chars=%s", len(text))
-        return text
+    def complete(
+        self,
+        prompt: str,
+        max_tokens: int,
+        stop: Sequence[str] | None,
+        *,
+        seed: int | None = None,
+    ) -> str:
+        def generate() -> str:
+            logger.info("llamacpp complete start max_tokens=%s", max_tokens)
+            response = cast(
+                Any,
+                self._llama(
+                    prompt,
+                    max_tokens=max_tokens,
+                    stop=stop,
+                    temperature=self.config.temperature,
+                    **_seed_kwargs(seed),
+                ),
+            )
+            text = _extract_chat_text(response)
+            logger.info("llamacpp complete done chars=%s", len(text))
+            return text
+
+        return self._cached("complete", prompt, max_tokens, seed, stop, generate)
 
-    def _complete_json(self, prompt: str, max_tokens: int) -> str:
-        logger.info("llamacpp json complete start max_tokens=%s", max_tokens)
-        text = _chat_complete(self._llama, prompt, max_tokens, self.config.temperature)
-        logger.info("llamacpp json complete done chars=%s", len(text))
+    def _complete_json(self, prompt: str, max_tokens: int, seed: int | None = None) -> str:
+        def generate() -> str:
+            logger.info("llamacpp json complete start max_tokens=%s", max_tokens)
+            text = _chat_complete(
+                self._llama, prompt, max_tokens, self.config.temperature, seed=seed
+            )
+            logger.info("llamacpp json complete done chars=%s", len(text))
+            return text
+
+        return self._cached("chat_json", prompt, max_tokens, seed, None, generate)
+
+    def _complete_json_batch(
+        self, prompts: Sequence[str], max_tokens: int, seeds: Sequence[int]
+    ) -> list[str]:
+        logger.info("llamacpp json batch start prompts=%s", len(prompts))
+        return [
+            self._complete_json(prompt, max_tokens=max_tokens, seed=seed)
+            for prompt, seed in zip(prompts, seeds, strict=True)
+        ]
+
+    def _cached(
+        self,
+        call: str,
+        prompt: str,
+        max_tokens: int,
+        seed: int | None,
+        stop: Sequence[str] | None,
+        generate: Callable[[], str],
+    ) -> str:
+        cache = self._response_cache
+        if cache is None:
+            return generate()
+        key = cache.key(
+            {
+                "model": self._model_hash,
+                "chat_format": self.config.chat_format,
+                "call": call,
+                "prompt": prompt,
+                "max_tokens": max_tokens,
+                "temperature": self.config.temperature,
+                "seed": seed,
+                "stop": list(stop) if stop else None,
+            }
+        )
+        cached = cache.get(key)
+        if isinstance(cached, str):
+            logger.info("llamacpp response cache hit call=%s key=%s", call, key[:12])
+            return cached
+        text = generate()
+        cache.put(key, text, meta={"call": call})
         return text
 
     def propose_interpretations(self, task: TaskInput, *, seed: int) -> list[Interpretation]:
         prompt = _interpretation_prompt(task)
-        text = self._complete_json(prompt, max_tokens=256)
-        data = _safe_json_loads(text)
-        items = data.get("interpretations") if isinstance(data, dict) else data
-        if not isinstance(items, list):
-            logger.error("llamacpp interpretations invalid payload=%s", data)
-            raise ValueError("llamacpp interpretations response must be a list")
-        try:
-            return [Interpretation.model_validate(item) for item in items]
-        except (TypeError, ValueError) as exc:
-            logger.error("llamacpp interpretations validation failed raw=%s", text)
-            raise ValueError("llamacpp interpretations failed validation") from exc
+        text = self._complete_json(prompt, max_tokens=256, seed=seed)
+        return _parse_interpretations(text)
 
     def propose_solution(
         self, task: TaskInput, interpretation: Interpretation, *, seed: int
     ) -> SolutionCandidate:
         prompt = _solution_prompt(task, interpretation)
-        text = self._complete_json(prompt, max_tokens=256)
-        data = _safe_json_loads(text)
-        if not isinstance(data, dict):
-            logger.error("llamacpp solution invalid payload=%s", data)
-            raise ValueError("llamacpp solution response must be an object")
-        try:
-            return SolutionCandidate(
-                output=data.get("output"),
-                solution_kind=str(data.get("solution_kind", "llamacpp")),
-                program=data.get("program"),
-                trace=data.get("trace"),
-            )
-        except (TypeError, ValueError) as exc:
-            logger.error("llamacpp solution validation failed raw=%s", text)
-            raise ValueError("llamacpp solution failed validation") from exc
+        text = self._complete_json(prompt, max_tokens=256, seed=seed)
+        return _parse_solution(text)
+
+    async def propose_interpretations_batch(
+        self, tasks: Sequence[TaskInput], *, seeds: Sequence[int]
+    ) -> list[list[Interpretation]]:
+        # The model is single-stream, so prompts are generated back to back on
+        # one worker thread; the event loop stays free for local verification.
+        prompts = [_interpretation_prompt(task) for task in tasks]
+        texts = await asyncio.to_thread(self._complete_json_batch, prompts, 256, seeds)
+        return [_parse_interpretations(text) for text in texts]
+
+    async def propose_solution_batch(
+        self,
+        requests: Sequence[tuple[TaskInput, Interpretation]],
+        *,
+        seeds: Sequence[int],
+    ) -> list[SolutionCandidate]:
+        prompts = [_solution_prompt(task, interpretation) for task, interpretation in requests]
+        texts = await asyncio.to_thread(self._complete_json_batch, prompts, 256, seeds)
+        return [_parse_solution(text) for text in texts]
 
     def critique(self, task: TaskInput, solution: SolutionCandidate, *, seed: int) -> str:
         prompt = _critique_prompt(task, solution)
-        text = self.complete(prompt, max_tokens=128, stop=["\n\n"])
+        text = self.complete(prompt, max_tokens=128, stop=["\n\n"], seed=seed)
         return text.strip()
 
 
@@ -124,11 +193,11 @@ def config_from_env() -> LlamaCppConfig:
         logger.info("llamacpp GPU offload disabled (no CUDA detected)")
     return LlamaCppConfig(
         gguf_path=gguf_path,
-        n_ctx=_get_int_env("EIDOLON_N_CTX", 2048),
+        n_ctx=get_int_env("EIDOLON_N_CTX", 2048),
         n_gpu_layers=n_gpu_layers,
-        n_threads=_get_int_env("EIDOLON_N_THREADS", 16),
-        n_batch=_get_int_env("EIDOLON_N_BATCH", 512),
-        temperature=_get_float_env("EIDOLON_TEMP", 0.0),
+        n_threads=get_int_env("EIDOLON_N_THREADS", 16),
+        n_batch=get_int_env("EIDOLON_N_BATCH", 512),
+        temperature=get_float_env("EIDOLON_TEMP", 0.0),
         chat_format=chat_format,
     )
 
@@ -137,6 +206,27 @@ def from_env() -> LlamaCppKernel:
     return LlamaCppKernel(config_from_env())
 
 
+_CONFIG_ENV_KEYS = (
+    "EIDOLON_GGUF",
+    "EIDOLON_CHAT_FORMAT",
+    "EIDOLON_N_CTX",
+    "EIDOLON_N_GPU_LAYERS",
+    "EIDOLON_N_THREADS",
+    "EIDOLON_N_BATCH",
+    "EIDOLON_TEMP",
+    "CUDA_VISIBLE_DEVICES",
+    "EIDOLON_LLAMA_PROMPT_CACHE_MB",
+    "EIDOLON_LLAMA_CACHE",
+    "EIDOLON_LLAMA_CACHE_DIR",
+    "XDG_CACHE_HOME",
+)
+
+
+def env_fingerprint() -> tuple[tuple[str, str], ...]:
+    """Every env input to ``config_from_env``; equal fingerprints load equal models."""
+    return tuple((name, os.getenv(name, "").strip()) for name in _CONFIG_ENV_KEYS)
+
+
 def _load_llama(config: LlamaCppConfig) -> tuple[Any, int]:
     from llama_cpp import Llama
 
@@ -168,24 +258,54 @@ def _load_llama(config: LlamaCppConfig) -> tuple[Any, int]:
         raise
 
 
-def _get_int_env(name: str, default: int) -> int:
-    raw = os.getenv(name)
-    if raw is None or raw.strip() == "":
-        return default
+def _attach_prompt_cache(llama: Any, capacity_mb: int) -> bool:
+    """Keep KV state for recent prompts so the shared instruction prefix is not re-evaluated."""
+    if capacity_mb <= 0:
+        return False
+    set_cache = getattr(llama, "set_cache", None)
+    if not callable(set_cache):
+        return False
     try:
-        return int(raw)
-    except ValueError as exc:
-        raise ValueError(f"{name} must be an int") from exc
+        from llama_cpp import LlamaRAMCache
+    except Exception:
+        return False
+    set_cache(LlamaRAMCache(capacity_bytes=capacity_mb << 20))
+    return True
 
 
-def _get_float_env(name: str, default: float) -> float:
-    raw = os.getenv(name)
-    if raw is None or raw.strip() == "":
-        return default
+def _model_fingerprint(gguf_path: str) -> str:
+    """Hash of the model's size plus its first and last MiB.
+
+    Hashing the whole GGUF would cost seconds per load; the header (which
+    carries the model metadata) and tail tell apart distinct files in practice.
+    """
+    digest = hashlib.sha256()
     try:
-        return float(raw)
-    except ValueError as exc:
-        raise ValueError(f"{name} must be a float") from exc
+        with open(gguf_path, "rb") as handle:
+            size = os.fstat(handle.fileno()).st_size
+            digest.update(str(size).encode("ascii"))
+            digest.update(handle.read(_FINGERPRINT_CHUNK))
+            if size > _FINGERPRINT_CHUNK:
+                handle.seek(max(_FINGERPRINT_CHUNK, size - _FINGERPRINT_CHUNK))
+                digest.update(handle.read(_FINGERPRINT_CHUNK))
+    except OSError:
+        digest.update(f"path:{Path(gguf_path).resolve()}".encode())
+    return digest.hexdigest()
+
+
+def _response_cache_from_env(temperature: float) -> ResponseCache | None:
+    raw = os.getenv("EIDOLON_LLAMA_CACHE", "").strip().lower()
+    if raw in {"0", "false", "no", "off"}:
+        return None
+    # Sampled outputs are only pinned to their seed when explicitly requested.
+    if raw == "" and temperature != 0.0:
+        return None
+    override = os.getenv("EIDOLON_LLAMA_CACHE_DIR", "").strip()
+    if override:
+        root = Path(override).expanduser().resolve()
+    else:
+        root = default_cache_dir("llamacpp_responses")
+    return ResponseCache(root)
 
 
 def _resolve_n_gpu_layers() -> tuple[int, str]:
@@ -239,7 +359,14 @@ def _is_cuda_unavailable(exc: Exception) -> bool:
     return any(indicator in message for indicator in indicators)
 
 
-def _chat_complete(llama: Any, prompt: str, max_tokens: int, temperature: float) -> str:
+def _chat_complete(
+    llama: Any,
+    prompt: str,
+    max_tokens: int,
+    temperature: float,
+    *,
+    seed: int | None = None,
+) -> str:
     if hasattr(llama, "create_chat_completion"):
         try:
             response = llama.create_chat_completion(
@@ -247,12 +374,14 @@ def _chat_complete(llama: Any, prompt: str, max_tokens: int, temperature: float)
                 max_tokens=max_tokens,
                 temperature=temperature,
                 response_format={"type": "json_object"},
+                **_seed_kwargs(seed),
             )
         except (TypeError, ValueError):
             response = llama.create_chat_completion(
                 messages=[{"role": "user", "content": prompt}],
                 max_tokens=max_tokens,
                 temperature=temperature,
+                **_seed_kwargs(seed),
             )
         return _extract_chat_text(response)
     response = llama(
@@ -260,10 +389,16 @@ def _chat_complete(llama: Any, prompt: str, max_tokens: int, temperature: float)
         max_tokens=max_tokens,
         stop=None,
         temperature=temperature,
+        **_seed_kwargs(seed),
     )
     return _extract_chat_text(response)
 
 
+def _seed_kwargs(seed: int | None) -> dict[str, int]:
+    # The response cache keys on the seed, so sampling must actually use it.
+    return {} if seed is None else {"seed": seed}
+
+
 def _extract_chat_text(response: Any) -> str:
     if isinstance(response, dict):
         choices = response.get("choices")
@@ -300,6 +435,36 @@ def _safe_json_loads(text: str) -> Any:
         raise ValueError("llamacpp returned invalid JSON") from exc
 
 
+def _parse_interpretations(text: str) -> list[Interpretation]:
+    data = _safe_json_loads(text)
+    items = data.get("interpretations") if isinstance(data, dict) else data
+    if not isinstance(items, list):
+        logger.error("llamacpp interpretations invalid payload=%s", data)
+        raise ValueError("llamacpp interpretations response must be a list")
+    try:
+        return [Interpretation.model_validate(item) for item in items]
+    except (TypeError, ValueError) as exc:
+        logger.error("llamacpp interpretations validation failed raw=%s", text)
+        raise ValueError("llamacpp interpretations failed validation") from exc
+
+
+def _parse_solution(text: str) -> SolutionCandidate:
+    data = _safe_json_loads(text)
+    if not isinstance(data, dict):
+        logger.error("llamacpp solution invalid payload=%s", data)
+        raise ValueError("llamacpp solution response must be an object")
+    try:
+        return SolutionCandidate(
+            output=data.get("output"),
+            solution_kind=str(data.get("solution_kind", "llamacpp")),
+            program=data.get("program"),
+            trace=data.get("trace"),
+        )
+    except (TypeError, ValueError) as exc:
+        logger.error("llamacpp solution validation failed raw=%s", text)
+        raise ValueError("llamacpp solution failed validation") from exc
+
+
 def _extract_json(text: str) -> str | None:
     for start, end in (("[", "]"), ("{", "}")):
         start_idx = text.find(start)
@@ -62,11 +62,14 @@ def _target_cost(
     macros: dict[str, MacroTemplate],
     max_programs: int,
 ) -> int:
-    for idx, program in enumerate(
-        bvps_enumerate.enumerate_programs(spec, macros=macros)
-    ):
-        if idx >= max_programs:
-            break
+    programs = bvps_enumerate.enumerate_programs(
+        spec,
+        macros=macros,
+        order=bvps_enumerate.enum_order_from_env(),
+        limit=max_programs,
+        normalize=bvps_enumerate.normalize_from_env(),
+    )
+    for idx, program in enumerate(programs):
         expanded = expand_program(program, macros)
         body_hash = canonical_json_bytes(expanded.body.to_dict())
         if body_hash == target_hash:
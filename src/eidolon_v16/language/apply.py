@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
 from collections.abc import Mapping
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from hashlib import sha256
 
 from eidolon_v16.bvps.ast import (
@@ -16,7 +18,7 @@ from eidolon_v16.bvps.ast import (
     expr_to_str,
 )
 from eidolon_v16.language.spec import MacroTemplate
-from eidolon_v16.ucr.canonical import canonical_json_bytes
+from eidolon_v16.ucr.canonical import canonical_json_bytes, sha256_canonical
 
 
 @dataclass(frozen=True)
@@ -25,13 +27,79 @@ class MacroDefinition:
     body: Expr
 
 
-def expand_program(program: Program, macros: Mapping[str, MacroTemplate]) -> Program:
-    compiled = {
-        name: MacroDefinition(params=tuple(template.params), body=template.to_expr())
-        for name, template in macros.items()
-    }
+_EMPTY_MACROS_HASH = "0" * 64
+_COMPILED_CACHE_SIZE = 32
+_CALL_MEMO_SIZE = 4096
 
+
+@dataclass(frozen=True)
+class CompiledMacros:
+    """Macro definitions parsed once per macros hash.
+
+    ``call_memo`` remembers the expansion of each distinct ``MacroCall``
+    node; nodes are frozen dataclasses, so expansions can be shared between
+    candidate programs. Instances are shared across threads through the
+    module cache, so the memo is only touched under ``memo_lock``.
+    """
+
+    macros_hash: str
+    definitions: Mapping[str, MacroDefinition]
+    call_memo: dict[MacroCall, Expr] = field(default_factory=dict, compare=False)
+    memo_lock: threading.Lock = field(
+        default_factory=threading.Lock, compare=False, repr=False
+    )
+
+
+_COMPILED: OrderedDict[str, CompiledMacros] = OrderedDict()
+_COMPILED_LOCK = threading.Lock()
+
+
+def macros_hash(macros: Mapping[str, MacroTemplate]) -> str:
+    if not macros:
+        return _EMPTY_MACROS_HASH
+    payload = {name: macro.model_dump(mode="json") for name, macro in sorted(macros.items())}
+    return sha256_canonical(payload)
+
+
+def compile_macros(macros: Mapping[str, MacroTemplate]) -> CompiledMacros:
+    digest = macros_hash(macros)
+    with _COMPILED_LOCK:
+        cached = _COMPILED.get(digest)
+        if cached is not None:
+            _COMPILED.move_to_end(digest)
+            return cached
+    compiled = CompiledMacros(
+        macros_hash=digest,
+        definitions={
+            name: MacroDefinition(params=tuple(template.params), body=template.to_expr())
+            for name, template in macros.items()
+        },
+    )
+    with _COMPILED_LOCK:
+        # Another thread may have compiled the same macros meanwhile; keep one.
+        compiled = _COMPILED.setdefault(digest, compiled)
+        _COMPILED.move_to_end(digest)
+        while len(_COMPILED) > _COMPILED_CACHE_SIZE:
+            _COMPILED.popitem(last=False)
+    return compiled
+
+
+def expand_program(
+    program: Program, macros: Mapping[str, MacroTemplate] | CompiledMacros
+) -> Program:
+    """Expand every ``MacroCall`` in ``program``.
+
+    Subtrees without macro calls are returned as-is rather than copied, and a
+    program with no macro calls at all is returned unchanged; for an interned
+    body that is known from its metadata, without walking the tree.
+    """
+    meta = program.body._meta
+    if meta is not None and not meta.has_macro:
+        return program
+    compiled = macros if isinstance(macros, CompiledMacros) else compile_macros(macros)
     expanded_body = _expand_expr(program.body, compiled)
+    if expanded_body is program.body:
+        return program
     return Program(
         params=list(program.params),
         body=expanded_body,
@@ -49,56 +117,68 @@ def program_hash(program: Program) -> str:
     return digest
 
 
-def _expand_expr(expr: Expr, macros: Mapping[str, MacroDefinition]) -> Expr:
+def _expand_expr(expr: Expr, compiled: CompiledMacros) -> Expr:
     if isinstance(expr, MacroCall):
-        macro = macros.get(expr.name)
+        memo = compiled.call_memo
+        with compiled.memo_lock:
+            cached = memo.get(expr)
+        if cached is not None:
+            return cached
+        macro = compiled.definitions.get(expr.name)
         if macro is None:
             raise ValueError(f"unknown macro {expr.name}")
         if len(macro.params) != len(expr.args):
             raise ValueError(f"macro {expr.name} expected {len(macro.params)} args")
         arg_map = {
-            param: _expand_expr(arg, macros)
+            param: _expand_expr(arg, compiled)
             for param, arg in zip(macro.params, expr.args, strict=True)
         }
         substituted = _substitute(macro.body, arg_map)
-        return _expand_expr(substituted, macros)
-    if isinstance(expr, IntConst):
-        return IntConst(value=expr.value)
-    if isinstance(expr, BoolConst):
-        return BoolConst(value=expr.value)
-    if isinstance(expr, Var):
-        return Var(name=expr.name)
+        expanded = _expand_expr(substituted, compiled)
+        with compiled.memo_lock:
+            if len(memo) >= _CALL_MEMO_SIZE:
+                memo.clear()
+            memo[expr] = expanded
+        return expanded
+    if isinstance(expr, (IntConst, BoolConst, Var)):
+        return expr
     if isinstance(expr, BinOp):
-        left = _expand_expr(expr.left, macros)
-        right = _expand_expr(expr.right, macros)
+        left = _expand_expr(expr.left, compiled)
+        right = _expand_expr(expr.right, compiled)
+        if left is expr.left and right is expr.right:
+            return expr
         return BinOp(op=expr.op, left=left, right=right)
     if isinstance(expr, IfThenElse):
-        cond = _expand_expr(expr.cond, macros)
-        then_expr = _expand_expr(expr.then_expr, macros)
-        else_expr = _expand_expr(expr.else_expr, macros)
+        cond = _expand_expr(expr.cond, compiled)
+        then_expr = _expand_expr(expr.then_expr, compiled)
+        else_expr = _expand_expr(expr.else_expr, compiled)
+        if cond is expr.cond and then_expr is expr.then_expr and else_expr is expr.else_expr:
+            return expr
         return IfThenElse(cond=cond, then_expr=then_expr, else_expr=else_expr)
     raise ValueError("unknown expr")
 
 
 def _substitute(expr: Expr, mapping: Mapping[str, Expr]) -> Expr:
-    if isinstance(expr, Var) and expr.name in mapping:
-        return mapping[expr.name]
-    if isinstance(expr, IntConst):
-        return IntConst(value=expr.value)
-    if isinstance(expr, BoolConst):
-        return BoolConst(value=expr.value)
     if isinstance(expr, Var):
-        return Var(name=expr.name)
+        return mapping.get(expr.name, expr)
+    if isinstance(expr, (IntConst, BoolConst)):
+        return expr
     if isinstance(expr, BinOp):
         left = _substitute(expr.left, mapping)
         right = _substitute(expr.right, mapping)
+        if left is expr.left and right is expr.right:
+            return expr
         return BinOp(op=expr.op, left=left, right=right)
     if isinstance(expr, IfThenElse):
         cond = _substitute(expr.cond, mapping)
         then_expr = _substitute(expr.then_expr, mapping)
         else_expr = _substitute(expr.else_expr, mapping)
+        if cond is expr.cond and then_expr is expr.then_expr and else_expr is expr.else_expr:
+            return expr
         return IfThenElse(cond=cond, then_expr=then_expr, else_expr=else_expr)
     if isinstance(expr, MacroCall):
         expanded_args = tuple(_substitute(arg, mapping) for arg in expr.args)
+        if all(new is old for new, old in zip(expanded_args, expr.args, strict=True)):
+            return expr
         return MacroCall(name=expr.name, args=expanded_args)
     raise ValueError("unknown expr")
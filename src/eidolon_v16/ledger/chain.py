@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import fcntl
 import json
 from datetime import datetime, timezone
 from pathlib import Path
@@ -10,18 +11,19 @@ from eidolon_v16.ucr.canonical import canonical_json_bytes, sha256_bytes
 
 def append_event(ledger_path: Path, kind: str, payload: dict[str, Any]) -> str:
     ledger_path.parent.mkdir(parents=True, exist_ok=True)
-    prev_hash = _read_last_hash(ledger_path)
-    ts_utc = _utc_now()
-    event = {
-        "ts_utc": ts_utc,
-        "kind": kind,
-        "payload": payload,
-        "prev_hash": prev_hash,
-    }
-    event_hash = _compute_event_hash(event)
-    event["event_hash"] = event_hash
-    line = canonical_json_bytes(event).decode("utf-8")
     with ledger_path.open("a", encoding="utf-8") as handle:
+        fcntl.flock(handle, fcntl.LOCK_EX)
+        prev_hash = _read_last_hash(ledger_path)
+        ts_utc = _utc_now()
+        event = {
+            "ts_utc": ts_utc,
+            "kind": kind,
+            "payload": payload,
+            "prev_hash": prev_hash,
+        }
+        event_hash = _compute_event_hash(event)
+        event["event_hash"] = event_hash
+        line = canonical_json_bytes(event).decode("utf-8")
         handle.write(line + "\n")
     return event_hash
 
@@ -57,6 +57,9 @@ class Ledger:
         payload_json = payload_bytes.decode("utf-8")
         ts = datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
         with self._connect() as conn:
+            # Take the write lock before reading the tail so concurrent
+            # processes cannot both claim the same seq.
+            conn.execute("BEGIN IMMEDIATE")
             last_seq, prev_hash = self._latest_hash(conn)
             seq = last_seq + 1
             event_hash = sha256_bytes(
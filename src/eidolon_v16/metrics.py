@@ -0,0 +1,287 @@
+from __future__ import annotations
+
+import functools
+import os
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+@dataclass
+class TimerStat:
+    count: int = 0
+    ns_sum: int = 0
+    ns_max: int = 0
+
+
+@dataclass
+class HistogramStat:
+    """Count and sum plus power-of-two buckets (bucket ``k`` holds values < 2**k)."""
+
+    count: int = 0
+    total: int = 0
+    max: int = 0
+    buckets: dict[int, int] = field(default_factory=dict)
+
+    def quantile(self, q: float) -> int:
+        """Upper bound of the bucket holding the ``q`` quantile (0 when empty)."""
+        if self.count == 0:
+            return 0
+        rank = q * self.count
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                return min((1 << bucket) - 1, self.max) if bucket else 0
+        return self.max
+
+
+@dataclass
+class MetricsSnapshot:
+    counters: dict[str, int] = field(default_factory=dict)
+    timers: dict[str, TimerStat] = field(default_factory=dict)
+    histograms: dict[str, HistogramStat] = field(default_factory=dict)
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self) -> _NullTimer:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        return None
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class _Timer:
+    __slots__ = ("_registry", "_name", "_start_ns")
+
+    def __init__(self, registry: MetricsRegistry, name: str) -> None:
+        self._registry = registry
+        self._name = name
+        self._start_ns = 0
+
+    def __enter__(self) -> _Timer:
+        self._start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self._registry.record_ns(self._name, time.perf_counter_ns() - self._start_ns)
+
+
+class MetricsRegistry:
+    """Named counters, nanosecond timers and histograms.
+
+    Timers keep raw nanoseconds; ms/us views are derived only on export, so
+    short operations are no longer rounded to zero one call at a time. A
+    disabled registry drops every record after one attribute check and hands
+    out a shared no-op timer, so probes can stay in hot paths.
+
+    ``snapshot``/``delta`` follow ``ArtifactStore.store_costs_snapshot``: take
+    a snapshot at the start of a scope and export the delta at its end.
+    Timer and histogram maxima cannot be subtracted; a delta reports the
+    registry-wide maximum for every metric recorded during the scope.
+    """
+
+    def __init__(self, enabled: bool = True) -> None:
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._counters: dict[str, int] = {}
+        self._timers: dict[str, TimerStat] = {}
+        self._histograms: dict[str, HistogramStat] = {}
+
+    def incr(self, name: str, value: int = 1) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def record_ns(self, name: str, ns: int) -> None:
+        if not self.enabled:
+            return
+        ns = max(0, ns)
+        with self._lock:
+            stat = self._timers.get(name)
+            if stat is None:
+                stat = self._timers[name] = TimerStat()
+            stat.count += 1
+            stat.ns_sum += ns
+            if ns > stat.ns_max:
+                stat.ns_max = ns
+
+    def observe(self, name: str, value: int) -> None:
+        if not self.enabled:
+            return
+        value = max(0, int(value))
+        bucket = value.bit_length()
+        with self._lock:
+            stat = self._histograms.get(name)
+            if stat is None:
+                stat = self._histograms[name] = HistogramStat()
+            stat.count += 1
+            stat.total += value
+            if value > stat.max:
+                stat.max = value
+            stat.buckets[bucket] = stat.buckets.get(bucket, 0) + 1
+
+    def timer(self, name: str) -> _Timer | _NullTimer:
+        """Context manager timing its block into ``name``."""
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self, name)
+
+    def timed(self, name: str) -> Callable[[F], F]:
+        """Decorator timing every call into ``name``; checks ``enabled`` per call."""
+
+        def decorate(func: F) -> F:
+            @functools.wraps(func)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                start_ns = time.perf_counter_ns()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.record_ns(name, time.perf_counter_ns() - start_ns)
+
+            return wrapper  # type: ignore[return-value]
+
+        return decorate
+
+    def counter(self, name: str) -> int:
+        with self._lock:
+            return self._counters.get(name, 0)
+
+    def timer_stat(self, name: str) -> TimerStat:
+        with self._lock:
+            stat = self._timers.get(name)
+            return TimerStat() if stat is None else TimerStat(stat.count, stat.ns_sum, stat.ns_max)
+
+    def snapshot(self) -> MetricsSnapshot:
+        with self._lock:
+            return MetricsSnapshot(
+                counters=dict(self._counters),
+                timers={
+                    name: TimerStat(stat.count, stat.ns_sum, stat.ns_max)
+                    for name, stat in self._timers.items()
+                },
+                histograms={
+                    name: HistogramStat(stat.count, stat.total, stat.max, dict(stat.buckets))
+                    for name, stat in self._histograms.items()
+                },
+            )
+
+    def delta(self, start: MetricsSnapshot) -> MetricsSnapshot:
+        current = self.snapshot()
+        counters = {
+            name: value - start.counters.get(name, 0)
+            for name, value in current.counters.items()
+            if value != start.counters.get(name, 0)
+        }
+        timers: dict[str, TimerStat] = {}
+        for name, stat in current.timers.items():
+            before = start.timers.get(name, TimerStat())
+            if stat.count != before.count:
+                timers[name] = TimerStat(
+                    stat.count - before.count, stat.ns_sum - before.ns_sum, stat.ns_max
+                )
+        histograms: dict[str, HistogramStat] = {}
+        for name, hist in current.histograms.items():
+            prior = start.histograms.get(name, HistogramStat())
+            if hist.count != prior.count:
+                buckets = {
+                    bucket: count - prior.buckets.get(bucket, 0)
+                    for bucket, count in hist.buckets.items()
+                    if count != prior.buckets.get(bucket, 0)
+                }
+                histograms[name] = HistogramStat(
+                    hist.count - prior.count, hist.total - prior.total, hist.max, buckets
+                )
+        return MetricsSnapshot(counters=counters, timers=timers, histograms=histograms)
+
+    def export(self, snapshot: MetricsSnapshot | None = None) -> dict[str, Any]:
+        """JSON-ready view: timers in microseconds, histograms as quantile bounds."""
+        if snapshot is None:
+            snapshot = self.snapshot()
+        return {
+            "counters": dict(sorted(snapshot.counters.items())),
+            "timers_us": {
+                name: {
+                    "count": stat.count,
+                    "sum": ns_to_us(stat.ns_sum),
+                    "max": ns_to_us(stat.ns_max),
+                }
+                for name, stat in sorted(snapshot.timers.items())
+            },
+            "histograms": {
+                name: {
+                    "count": hist.count,
+                    "sum": hist.total,
+                    "p50": hist.quantile(0.5),
+                    "p90": hist.quantile(0.9),
+                    "max": hist.max,
+                }
+                for name, hist in sorted(snapshot.histograms.items())
+            },
+        }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._timers.clear()
+            self._histograms.clear()
+
+
+def ns_to_us(ns: int) -> int:
+    return int((max(0, ns) + 999) // 1000)
+
+
+def ns_to_ms(ns: int) -> int:
+    return int(round(max(0, ns) / 1_000_000))
+
+
+_REGISTRY = MetricsRegistry(enabled=False)
+_REGISTRY_ENV: str | None = None
+
+
+def registry() -> MetricsRegistry:
+    """Process-wide registry for probes, enabled by ``EIDOLON_METRICS=1``."""
+    global _REGISTRY_ENV
+    env = os.getenv("EIDOLON_METRICS", "").strip()
+    if env != _REGISTRY_ENV:
+        _REGISTRY_ENV = env
+        _REGISTRY.enabled = env == "1"
+    return _REGISTRY
+
+
+def timer(name: str) -> _Timer | _NullTimer:
+    return registry().timer(name)
+
+
+def incr(name: str, value: int = 1) -> None:
+    registry().incr(name, value)
+
+
+def observe(name: str, value: int) -> None:
+    registry().observe(name, value)
+
+
+def timed(name: str) -> Callable[[F], F]:
+    """Decorator form of ``timer`` on the process-wide registry."""
+
+    def decorate(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with registry().timer(name):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
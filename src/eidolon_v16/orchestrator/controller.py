@@ -1,13 +1,16 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import os
 import time
+from collections.abc import Sequence
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, cast
 
+from eidolon_v16 import metrics, tracing
 from eidolon_v16.arith_types import canonicalize_number
 from eidolon_v16.artifacts.manifest import build_artifact_manifest
 from eidolon_v16.artifacts.store import ArtifactRef, ArtifactStore
@@ -19,24 +22,32 @@ from eidolon_v16.bvps.dsl import program_from_dict
 from eidolon_v16.bvps.interpreter import Interpreter
 from eidolon_v16.capsules.bundle import build_capsule
 from eidolon_v16.config import AppConfig
-from eidolon_v16.kernel.base import Kernel, SolutionCandidate
-from eidolon_v16.json_canon import dumps_bytes
+from eidolon_v16.kernel.base import (
+    Kernel,
+    SolutionCandidate,
+    propose_interpretations_batch,
+    propose_solution_batch,
+    supports_batch,
+)
+from eidolon_v16.json_canon import CanonicalMemo, dumps_bytes
 from eidolon_v16.kernel.http import HttpKernel
+from eidolon_v16.kernel.pool import KernelPool, default_kernel_pool
 from eidolon_v16.kernel.stub import StubKernel
 from eidolon_v16.kernels import resolve_kernel_name
+from eidolon_v16.kernels.llamacpp_kernel import env_fingerprint as llamacpp_env_fingerprint
 from eidolon_v16.kernels.llamacpp_kernel import from_env as llamacpp_from_env
-from eidolon_v16.language.registry import load_registry as load_language_registry
+from eidolon_v16.language.apply import macros_hash
 from eidolon_v16.language.spec import MacroTemplate
 from eidolon_v16.ledger import chain as ledger_chain
 from eidolon_v16.ledger.db import Ledger
-from eidolon_v16.orchestrator.types import EpisodeResult, ModeConfig
+from eidolon_v16.orchestrator.registry_cache import RegistryCache
+from eidolon_v16.orchestrator.types import EpisodeResult, KernelPrefetch, ModeConfig
 from eidolon_v16.runtime import initialize_runtime
-from eidolon_v16.skills.admission import admit_skill
-from eidolon_v16.skills.bundle import bundle_identity, write_skill_bundle
+from eidolon_v16.skills.admission import AdmissionCache, admit_skill
+from eidolon_v16.skills.bundle import write_skill_bundle
 from eidolon_v16.skills.compile import compile_skill_from_bvps
-from eidolon_v16.skills.registry import load_registry as load_skill_registry
 from eidolon_v16.skills.registry import register_skill
-from eidolon_v16.skills.store import load_bundle, save_bundle
+from eidolon_v16.skills.store import save_bundle
 from eidolon_v16.ucr.canonical import canonical_json_bytes, compute_ucr_hash, sha256_canonical
 from eidolon_v16.ucr.canonical import sha256_bytes
 from eidolon_v16.ucr.models import (
@@ -64,6 +75,12 @@ def _elapsed_ms(start_ns: int) -> int:
     return int(round(duration_ns / 1_000_000))
 
 
+def _batch_share_ms(start: float, size: int) -> int:
+    """Each of ``size`` episodes' share of a batch call started at ``start``."""
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    return int(round(elapsed_ms / max(1, size)))
+
+
 def _build_artifact_plan(solution_payload: dict[str, Any]) -> dict[str, Any]:
     return solution_payload
 
@@ -110,10 +127,11 @@ def _bvps_cache_key(spec_hash: str, macros_hash: str, attempt: int) -> tuple[str
 
 
 def _bvps_macros_hash(macros: dict[str, MacroTemplate]) -> str:
-    if not macros:
-        return "0" * 64
-    payload = {name: macro.model_dump(mode="json") for name, macro in sorted(macros.items())}
-    return sha256_canonical(payload)
+    return macros_hash(macros)
+
+
+# Programs remembered per semantic key; older ones are dropped first.
+_BVPS_SEMANTIC_PER_KEY = 8
 
 
 class EpisodeController:
@@ -121,9 +139,14 @@ class EpisodeController:
         self,
         config: AppConfig,
         bvps_cache: dict[tuple[str, str, int], dict[str, Any]] | None = None,
+        kernel_pool: KernelPool | None = None,
     ) -> None:
         self.config = config
         self._bvps_cache = bvps_cache if bvps_cache is not None else {}
+        self._bvps_semantic_cache: dict[str, list[dict[str, Any]]] = {}
+        self._kernel_pool = kernel_pool if kernel_pool is not None else default_kernel_pool()
+        self._kernel_load_ms = 0
+        self._registry_cache = RegistryCache()
 
     def run(
         self,
@@ -131,6 +154,7 @@ class EpisodeController:
         mode: ModeConfig,
         *,
         store: ArtifactStore | None = None,
+        prefetched: KernelPrefetch | None = None,
     ) -> EpisodeResult:
         initialize_runtime(
             cpu_threads=mode.cpu_threads,
@@ -153,6 +177,11 @@ class EpisodeController:
         admitted_skill: dict[str, Any] | None = None
         active_language_patches: list[dict[str, Any]] = []
         macros_for_spec: dict[str, MacroTemplate] = {}
+        probes = metrics.registry()
+        probes_start = probes.snapshot() if probes.enabled else None
+        trace = tracing.tracer()
+        # Episodes may run concurrently on other threads; export only this one's spans.
+        trace_scope = trace.open_scope(this_thread=True) if trace is not None else None
         overall_start = time.perf_counter()
         t_episode_start = overall_start
         t_interpret0 = overall_start
@@ -169,6 +198,9 @@ class EpisodeController:
         solve_model_ms = 0
         solve_bvps_cache_lookup_ms = 0
         solve_bvps_fastpath_ms = 0
+        kernel_load_ms: int | None = None
+        # Batch kernel time spent before this episode started, charged to it.
+        batch_charged_ms = 0
         if bvps_spec is not None:
             self._inject_bvps_spec(task, bvps_spec)
             kernel_info = {"kind": "bvps"}
@@ -211,21 +243,40 @@ class EpisodeController:
                         breakdown.get("solve_bvps_fastpath_ms", 0)
                     )
         else:
-            kernel = self._select_kernel(store)
-            kernel_info = getattr(self, "_kernel_info", {"kind": "unknown"})
+            if prefetched is None:
+                kernel = self._select_kernel(store)
+                kernel_info = getattr(self, "_kernel_info", {"kind": "unknown"})
+                kernel_load_ms = self._kernel_load_ms
+            else:
+                kernel = prefetched.kernel
+                kernel_info = dict(prefetched.kernel_info)
+                kernel_load_ms = prefetched.load_ms
             logger.info("interpret phase")
             t_interpret0 = time.perf_counter()
-            interpretations = kernel.propose_interpretations(task, seed=mode.seed)
+            if prefetched is None:
+                with tracing.span("kernel.propose_interpretations", cat="kernel"):
+                    interpretations = kernel.propose_interpretations(task, seed=mode.seed)
+            else:
+                interpretations = list(prefetched.interpretations)
+                batch_charged_ms += prefetched.interpret_ms
             interpretations.sort(key=lambda item: item.interpretation_id)
             chosen = interpretations[0]
             t_interpret1 = time.perf_counter()
             phase_ms["interpret"] = int((t_interpret1 - t_interpret0) * 1000)
+            if prefetched is not None:
+                phase_ms["interpret"] += prefetched.interpret_ms
 
             logger.info("solve phase")
             t_solve0 = time.perf_counter()
-            solution = self._solve_task(task, chosen, kernel, seed=mode.seed)
+            solve_charged_ms = 0
+            if prefetched is not None and prefetched.solution is not None:
+                solution = prefetched.solution
+                solve_charged_ms = prefetched.solve_ms
+                batch_charged_ms += solve_charged_ms
+            else:
+                solution = self._solve_task(task, chosen, kernel, seed=mode.seed)
             t_solve1 = time.perf_counter()
-            solve_duration_ms = int((t_solve1 - t_solve0) * 1000)
+            solve_duration_ms = int((t_solve1 - t_solve0) * 1000) + solve_charged_ms
             phase_ms["solve"] = solve_duration_ms
             solve_model_ms = solve_duration_ms
         postsolve_detail: dict[str, int] = {
@@ -505,7 +556,7 @@ class EpisodeController:
 
         lane_durations = dict(lane_durations)
         t_episode_end = time.perf_counter()
-        total_ms = int((t_episode_end - overall_start) * 1000)
+        total_ms = int((t_episode_end - overall_start) * 1000) + batch_charged_ms
         solve_known_ms = (
             solve_task_load_ms
             + solve_model_ms
@@ -623,6 +674,14 @@ class EpisodeController:
         }
         if isinstance(verify_task_verifier_detail_ms, dict):
             costs["verify_task_verifier_detail_ms"] = verify_task_verifier_detail_ms
+        if kernel_load_ms is not None:
+            costs["kernel_load_ms"] = kernel_load_ms
+        if prefetched is not None and bvps_spec is None:
+            costs["kernel_batch"] = {
+                "size": prefetched.batch_size,
+                "interpret_ms": prefetched.interpret_ms,
+                "solve_ms": prefetched.solve_ms if prefetched.solution is not None else 0,
+            }
         if bvps_summary is not None:
             breakdown = bvps_summary.get("solve_breakdown_ms")
             stats = bvps_summary.get("solve_bvps_stats")
@@ -790,6 +849,8 @@ class EpisodeController:
         costs["overhead_ms"] = overhead_ms
         costs["overhead_breakdown_ms"] = overhead_breakdown
         costs["verify_breakdown_ms"] = verify_breakdown_ms
+        if probes_start is not None:
+            costs["metrics"] = probes.export(probes.delta(probes_start))
         ucr_dict["costs"] = costs
         witness_payload["costs"] = witness_costs
 
@@ -828,9 +889,131 @@ class EpisodeController:
             {"episode_id": episode_id, "ucr_hash": ucr_hash, "run_dir": str(run_dir)},
         )
 
+        if trace is not None and trace_scope is not None:
+            self._trace_episode(
+                trace,
+                trace_scope,
+                run_dir,
+                episode_id=episode_id,
+                kind=str(task.normalized.get("kind", "unknown")),
+                marks={
+                    "interpret": (t_interpret0, t_interpret1),
+                    "solve": (t_solve0, t_solve1),
+                    "postsolve": (t_solve1, t_verify0),
+                    "verify": (t_verify0, t_verify1),
+                    "decide": (t_verify1, t_capsule0),
+                    "capsule": (t_capsule0, t_capsule1),
+                    "postcapsule": (t_capsule1, t_episode_end),
+                },
+                start=t_episode_start,
+                end=t_episode_end,
+            )
+
         logger.info("episode complete id=%s ucr=%s", episode_id, ucr_path)
         return EpisodeResult(ucr_path=ucr_path, witness_path=witness_path, ucr_hash=ucr_hash)
 
+    def _trace_episode(
+        self,
+        trace: tracing.Tracer,
+        trace_scope: tracing.TraceScope,
+        run_dir: Path,
+        *,
+        episode_id: str,
+        kind: str,
+        marks: dict[str, tuple[float, float]],
+        start: float,
+        end: float,
+    ) -> None:
+        """Record phase spans from the episode's timestamps; write ``run_dir/trace.json``."""
+        trace.record("episode", start, end, cat="episode", episode_id=episode_id, kind=kind)
+        for phase, (phase_start, phase_end) in marks.items():
+            if phase_end > phase_start:
+                trace.record(phase, phase_start, phase_end, cat="phase")
+        trace.record("finalize", end, time.perf_counter(), cat="phase")
+        try:
+            trace.write(run_dir / "trace.json", since=trace_scope)
+        except OSError as exc:
+            logger.warning("episode trace write failed run_dir=%s error=%s", run_dir, exc)
+        finally:
+            trace.close_scope(trace_scope)
+
+    def run_many(
+        self,
+        tasks: Sequence[TaskInput],
+        mode: ModeConfig,
+        *,
+        store: ArtifactStore | None = None,
+    ) -> list[EpisodeResult]:
+        """Run several episodes, batching kernel proposals when the kernel allows it."""
+        if store is None:
+            store = ArtifactStore(self.config.paths.artifact_store)
+        prefetched = self._prefetch_kernel_batch(tasks, mode, store)
+        return [
+            self.run(task, mode, store=store, prefetched=prefetched.get(index))
+            for index, task in enumerate(tasks)
+        ]
+
+    def _prefetch_kernel_batch(
+        self,
+        tasks: Sequence[TaskInput],
+        mode: ModeConfig,
+        store: ArtifactStore,
+    ) -> dict[int, KernelPrefetch]:
+        indices = [
+            index for index, task in enumerate(tasks) if self._parse_bvps_spec(task) is None
+        ]
+        if len(indices) < 2:
+            return {}
+        kernel = self._select_kernel(store)
+        if not supports_batch(kernel):
+            return {}
+        load_ms = self._kernel_load_ms
+        kernel_info = dict(getattr(self, "_kernel_info", {"kind": "unknown"}))
+        batch_tasks = [tasks[index] for index in indices]
+        logger.info("kernel batch prefetch start tasks=%s", len(batch_tasks))
+        batch_start = time.perf_counter()
+        with tracing.span("kernel.batch_interpretations", cat="kernel", size=len(indices)):
+            interpretations = asyncio.run(
+                propose_interpretations_batch(
+                    kernel, batch_tasks, seeds=[mode.seed] * len(indices)
+                )
+            )
+        interpret_share_ms = _batch_share_ms(batch_start, len(indices))
+        requests: list[tuple[TaskInput, Interpretation]] = []
+        pending: list[int] = []
+        for position, (task, items) in enumerate(
+            zip(batch_tasks, interpretations, strict=True)
+        ):
+            if not items or self._solve_task_locally(task) is not None:
+                continue
+            chosen = sorted(items, key=lambda item: item.interpretation_id)[0]
+            requests.append((task, chosen))
+            pending.append(position)
+        solutions: dict[int, SolutionCandidate] = {}
+        solve_share_ms = 0
+        if requests:
+            solve_start = time.perf_counter()
+            with tracing.span("kernel.batch_solutions", cat="kernel", size=len(requests)):
+                proposed = asyncio.run(
+                    propose_solution_batch(kernel, requests, seeds=[mode.seed] * len(requests))
+                )
+            solve_share_ms = _batch_share_ms(solve_start, len(requests))
+            solutions = dict(zip(pending, proposed, strict=True))
+        logger.info("kernel batch prefetch done solutions=%s", len(solutions))
+        return {
+            index: KernelPrefetch(
+                kernel=kernel,
+                kernel_info=kernel_info,
+                interpretations=list(items),
+                solution=solutions.get(position),
+                load_ms=load_ms if position == 0 else 0,
+                batch_size=len(indices),
+                interpret_ms=interpret_share_ms,
+                solve_ms=solve_share_ms,
+            )
+            for position, (index, items) in enumerate(zip(indices, interpretations, strict=True))
+        }
+
     def replay(self, ucr_path: Path) -> bool:
         initialize_runtime(logger=logger, use_gpu=False)
         logger.info("replay start ucr=%s", ucr_path)
@@ -876,7 +1059,7 @@ class EpisodeController:
         if kind == "list":
             program = program_from_dict(solution["program"])
             interpreter = Interpreter(step_limit=2000)
-            output, _trace = interpreter.run(program, [solution["input"]])
+            output, _trace = interpreter.run(program, [solution["input"]], trace=False)
             output_value = cast(object, output)
             list_expected = cast(object, solution.get("output"))
             return output_value == list_expected
@@ -918,16 +1101,34 @@ class EpisodeController:
             base_url = os.getenv("EIDOLON_KERNEL_URL", "").strip()
             if not base_url:
                 raise ValueError("EIDOLON_KERNEL_URL is required for http kernel")
-            self._kernel_info = {"kind": "http", "base_url": base_url}
-            logger.info("kernel selected http url=%s", base_url)
-            return HttpKernel(base_url=base_url, store=store)
-        if kernel_kind == "llamacpp":
-            kernel = llamacpp_from_env()
-            config = getattr(kernel, "config", None)
-            if config is None:
-                self._kernel_info = {"kind": "llamacpp"}
-            else:
-                self._kernel_info = {
+            # The response cache defaults to a directory under store.root, so the
+            # root is part of the key; the store object itself is rebound below.
+            key: tuple[Any, ...] = (
+                "http",
+                base_url,
+                str(store.root),
+                os.getenv("EIDOLON_KERNEL_CACHE", "").strip().lower(),
+                os.getenv("EIDOLON_KERNEL_CACHE_DIR", "").strip(),
+                os.getenv("EIDOLON_KERNEL_RETRIES", "").strip(),
+                os.getenv("EIDOLON_KERNEL_BACKOFF_S", "").strip(),
+                os.getenv("EIDOLON_KERNEL_CONCURRENCY", "").strip(),
+            )
+
+            def factory() -> tuple[Kernel, dict[str, Any]]:
+                return HttpKernel(base_url=base_url, store=store), {
+                    "kind": "http",
+                    "base_url": base_url,
+                }
+
+        elif kernel_kind == "llamacpp":
+            key = ("llamacpp", llamacpp_env_fingerprint())
+
+            def factory() -> tuple[Kernel, dict[str, Any]]:
+                kernel = llamacpp_from_env()
+                config = getattr(kernel, "config", None)
+                if config is None:
+                    return kernel, {"kind": "llamacpp"}
+                return kernel, {
                     "kind": "llamacpp",
                     "gguf": config.gguf_path,
                     "n_ctx": config.n_ctx,
@@ -937,13 +1138,29 @@ class EpisodeController:
                     "temperature": config.temperature,
                     "chat_format": config.chat_format,
                 }
-            logger.info("kernel selected llamacpp")
-            return kernel
-        if kernel_kind == "unknown":
-            logger.warning("unknown EIDOLON_KERNEL=%s; defaulting to stub", kernel_value)
-        self._kernel_info = {"kind": "stub"}
-        logger.info("kernel selected stub")
-        return StubKernel()
+
+        else:
+            if kernel_kind == "unknown":
+                logger.warning("unknown EIDOLON_KERNEL=%s; defaulting to stub", kernel_value)
+            key = ("stub",)
+
+            def factory() -> tuple[Kernel, dict[str, Any]]:
+                return StubKernel(), {"kind": "stub"}
+
+        entry, reused = self._kernel_pool.get(key, factory)
+        if isinstance(entry.kernel, HttpKernel):
+            # Kernel calls are artifacts of the current episode: write them
+            # through its store, not the one the pooled kernel was built with.
+            entry.kernel.bind_store(store)
+        self._kernel_info = dict(entry.info)
+        self._kernel_load_ms = 0 if reused else entry.load_ms
+        logger.info(
+            "kernel selected %s reused=%s load_ms=%s",
+            entry.info.get("kind"),
+            reused,
+            entry.load_ms,
+        )
+        return entry.kernel
 
     def _solve_task(
         self,
@@ -953,6 +1170,13 @@ class EpisodeController:
         *,
         seed: int,
     ) -> SolutionCandidate:
+        local = self._solve_task_locally(task)
+        if local is not None:
+            return local
+        with tracing.span("kernel.propose_solution", cat="kernel"):
+            return kernel.propose_solution(task, interpretation, seed=seed)
+
+    def _solve_task_locally(self, task: TaskInput) -> SolutionCandidate | None:
         normalized = task.normalized
         kind = normalized.get("kind", "unknown")
         data = normalized.setdefault("data", {})
@@ -973,7 +1197,7 @@ class EpisodeController:
             actions = data.get("actions")
             if isinstance(actions, list) and all(isinstance(item, str) for item in actions):
                 return SolutionCandidate(output=actions, solution_kind="world_script")
-        return kernel.propose_solution(task, interpretation, seed=seed)
+        return None
 
     def _extract_arith_expression(self, task: TaskInput) -> str:
         normalized = task.normalized
@@ -1024,22 +1248,9 @@ class EpisodeController:
     def _load_language_macros(
         self, spec_payload: dict[str, Any]
     ) -> tuple[dict[str, MacroTemplate], list[dict[str, Any]]]:
-        registry = load_language_registry(self.config.paths.language_registry)
-        macros: dict[str, MacroTemplate] = {}
-        patches: list[dict[str, Any]] = []
         scope = str(spec_payload.get("name", "")).strip()
-        for record in registry.patches:
-            if record.spec.scope != scope:
-                continue
-            macros.update(record.spec.macros)
-            patches.append(
-                {
-                    "name": record.spec.name,
-                    "version": record.spec.version,
-                    "scope": record.spec.scope,
-                }
-            )
-        return macros, patches
+        scoped = self._registry_cache.scope_macros(self.config.paths.language_registry, scope)
+        return dict(scoped.macros), [dict(patch) for patch in scoped.patches]
 
     def _bvps_seed(self, spec: bvps_types.Spec, spec_hash: str) -> int:
         if spec.bounds.seed is not None:
@@ -1060,6 +1271,76 @@ class EpisodeController:
     def _bvps_cache_skip_model(self) -> bool:
         return os.getenv("EIDOLON_BVPS_CACHE_SKIP_MODEL", "").strip() == "1"
 
+    def _bvps_semantic_cache_enabled(self) -> bool:
+        return os.getenv("EIDOLON_BVPS_SEMANTIC_CACHE", "").strip() == "1"
+
+    def _remember_bvps_semantic(self, semantic_key: str, program: dict[str, Any]) -> None:
+        programs = self._bvps_semantic_cache.setdefault(semantic_key, [])
+        if program in programs:
+            programs.remove(program)
+        programs.insert(0, program)
+        del programs[_BVPS_SEMANTIC_PER_KEY:]
+
+    def _bvps_semantic_candidates(self, semantic_key: str) -> list[dict[str, Any]]:
+        candidates = list(self._bvps_semantic_cache.get(semantic_key, []))
+        if not self._bvps_persist_enabled():
+            return candidates
+        persist_store = bvps_cache.persist_store()
+        for entry in bvps_cache.iter_persistent_entries(persist_store):
+            if semantic_key not in entry.created_from:
+                continue
+            payload = bvps_cache.read_persistent_payload(persist_store, entry.hash)
+            parsed = bvps_cache.parse_bvps_cache_payload(payload)
+            if parsed is None or payload.get("semantic_key") != semantic_key:
+                continue
+            program = parsed[2]["program"]
+            if program not in candidates:
+                candidates.append(program)
+        return candidates
+
+    def _lookup_bvps_semantic(
+        self, spec: bvps_types.Spec, semantic_key: str, *, seed: int
+    ) -> dict[str, Any] | None:
+        """First remembered program for ``semantic_key`` that passes ``spec``'s own checks.
+
+        Candidates are re-validated exactly like a freshly synthesized program
+        (the spec's examples, then its fuzz trials), so a hit never weakens the
+        acceptance test.
+        """
+        for program_dict in self._bvps_semantic_candidates(semantic_key):
+            try:
+                program = bvps_ast.program_from_dict(program_dict)
+            except (KeyError, TypeError, ValueError):
+                continue
+            if not bvps_cegis.revalidate(program, spec, seed):
+                continue
+            program_pretty = bvps_ast.expr_to_str(program.body)
+            depth = bvps_ast.expr_depth(program.body)
+            return {
+                "program": program_dict,
+                "program_pretty": program_pretty,
+                "report": {
+                    "program_pretty": program_pretty,
+                    "stats": {
+                        "candidates_tried": 0,
+                        "depth": depth,
+                        "depth_max": depth,
+                        "counterexamples": 0,
+                        "seed": seed,
+                        "fuzz_trials": spec.bounds.fuzz_trials,
+                    },
+                    "examples": [{"in": ex.inputs, "out": ex.output} for ex in spec.examples],
+                    "counterexamples": [],
+                },
+                "solve_bvps_stats": {
+                    "candidates": 0,
+                    "depth_max": depth,
+                    "trials": spec.bounds.fuzz_trials,
+                    "cegis_iters": 0,
+                },
+            }
+        return None
+
     def _load_bvps_persistent_cache(
         self,
         persist_store: ArtifactStore,
@@ -1106,9 +1387,11 @@ class EpisodeController:
         macros_hash: str,
         cache_key: str,
         program: dict[str, Any],
+        program_hash: str,
         program_pretty: str,
         report_payload: dict[str, Any],
         solve_stats: dict[str, Any],
+        semantic_key: str | None = None,
     ) -> None:
         payload = {
             "cache_key": cache_key,
@@ -1117,14 +1400,16 @@ class EpisodeController:
             "attempt": attempt,
             "macros_hash": macros_hash,
             "program": program,
-            "program_hash": sha256_canonical(program),
+            "program_hash": program_hash,
             "program_pretty": program_pretty,
             "report": report_payload,
             "solve_bvps_stats": solve_stats,
         }
-        bvps_cache.write_persistent_payload(
-            persist_store, payload, created_from=[spec_hash, cache_key]
-        )
+        created_from = [spec_hash, cache_key]
+        if semantic_key is not None:
+            payload["semantic_key"] = semantic_key
+            created_from.append(semantic_key)
+        bvps_cache.write_persistent_payload(persist_store, payload, created_from=created_from)
 
     def _solve_bvps(
         self,
@@ -1138,7 +1423,8 @@ class EpisodeController:
         attempt: int = 1,
     ) -> tuple[SolutionCandidate, list[Any], dict[str, Any]]:
         solve_start = time.perf_counter()
-        spec_hash = sha256_canonical(spec_payload)
+        canon = CanonicalMemo()
+        spec_hash = canon.sha256(spec_payload)
         macros_hash = _bvps_macros_hash(macros)
         cache_key = _bvps_cache_key(spec_hash, macros_hash, attempt)
         cache_key_str = bvps_cache.bvps_cache_key_string(spec_hash, macros_hash, attempt)
@@ -1197,8 +1483,25 @@ class EpisodeController:
                 task_load_ms = 0
             derived_seed = self._bvps_seed(spec, spec_hash)
 
+        semantic_key: str | None = None
+        if spec is not None and self._bvps_semantic_cache_enabled():
+            semantic_key = bvps_cache.spec_semantic_key(spec)
+        if cache_hit is None and spec is not None and semantic_key is not None:
+            semantic_start_ns = time.perf_counter_ns()
+            semantic = self._lookup_bvps_semantic(spec, semantic_key, seed=derived_seed)
+            semantic_us = max(0, int((time.perf_counter_ns() - semantic_start_ns + 999) / 1_000))
+            cache_lookup_us += semantic_us
+            cache_lookup_ms += semantic_us // 1000
+            if semantic is not None:
+                cache_hit = semantic
+                cache_scope = "semantic"
+                semantic["macros_hash"] = macros_hash
+                self._bvps_cache[cache_key] = dict(semantic)
+
         if cache_hit is not None:
             program_dict = dict(cache_hit["program"])
+            if semantic_key is not None:
+                self._remember_bvps_semantic(semantic_key, program_dict)
             program_pretty = str(cache_hit.get("program_pretty", ""))
             report_payload = dict(cache_hit.get("report", {}))
             stats = dict(cache_hit.get("solve_bvps_stats", {}))
@@ -1271,6 +1574,8 @@ class EpisodeController:
                 "macros_hash": macros_hash,
             }
             self._bvps_cache[cache_key] = dict(cache_record)
+            if semantic_key is not None:
+                self._remember_bvps_semantic(semantic_key, program_dict)
             if self._bvps_persist_enabled():
                 persist_store = bvps_cache.persist_store()
                 self._store_bvps_persistent_cache(
@@ -1281,9 +1586,11 @@ class EpisodeController:
                     macros_hash=macros_hash,
                     cache_key=cache_key_str,
                     program=program_dict,
+                    program_hash=canon.sha256(program_dict),
                     program_pretty=program_pretty,
                     report_payload=report_payload,
                     solve_stats=stats,
+                    semantic_key=semantic_key,
                 )
 
         compile_ms = int(synth_profile.get("bvps_compile_ms", 0))
@@ -1307,9 +1614,15 @@ class EpisodeController:
             "solve_bvps_fastpath_ms": fastpath_ms,
         }
 
-        spec_ref = store.put_json(spec_payload, artifact_type="bvps_spec", producer="bvps")
-        program_ref = store.put_json(
+        spec_ref = store.put_json_bytes(
+            spec_payload,
+            canon.dumps_bytes(spec_payload),
+            artifact_type="bvps_spec",
+            producer="bvps",
+        )
+        program_ref = store.put_json_bytes(
             program_dict,
+            canon.dumps_bytes(program_dict),
             artifact_type="bvps_program",
             producer="bvps",
             created_from=[spec_ref.hash],
@@ -1341,6 +1654,7 @@ class EpisodeController:
             program=program_dict,
             trace={"bvps_report": report_ref.hash},
         )
+        metrics.incr(f"bvps.cache.{cache_scope if cache_hit is not None else 'miss'}")
         summary = {
             "solution_kind": "bvps_program",
             "program_pretty": program_pretty,
@@ -1360,7 +1674,7 @@ class EpisodeController:
                 "macros_hash": macros_hash,
                 "bvps_seed": derived_seed,
                 "attempt": attempt,
-                "program_hash": sha256_canonical(program_dict),
+                "program_hash": canon.sha256(program_dict),
             },
             "bvps_fastpath": bvps_fastpath,
         }
@@ -1371,8 +1685,8 @@ class EpisodeController:
         task: TaskInput,
         store: ArtifactStore,
     ) -> dict[str, Any] | None:
-        registry = load_skill_registry(self.config.paths.skills_registry)
-        if not registry.skills:
+        index = self._registry_cache.skill_index(self.config.paths.skills_registry)
+        if not len(index):
             return None
         data = task.normalized.get("data", {})
         spec_payload = data.get("bvps_spec")
@@ -1380,15 +1694,13 @@ class EpisodeController:
             return None
         spec_name = str(spec_payload.get("name", "")).lower()
         prompt = str(task.normalized.get("prompt", "")).lower()
-        records = sorted(registry.skills, key=lambda record: record.spec.name)
-        for record in records:
-            if not self._skill_matches(record.spec, spec_name, prompt, task.normalized.get("kind")):
-                continue
+        for record in index.candidates(spec_name, prompt, task.normalized.get("kind")):
             bundle_dir = Path(record.bundle_dir)
             if not bundle_dir.exists():
                 continue
-            bundle = load_bundle(bundle_dir)
-            identity = bundle_identity(bundle)
+            cached_bundle = self._registry_cache.bundle(bundle_dir)
+            bundle = cached_bundle.bundle
+            identity = dict(cached_bundle.identity)
             existing_admission = None
             if self._auto_skills_enabled():
                 existing_admission = self._load_existing_admission(bundle_dir, identity)
@@ -1429,23 +1741,6 @@ class EpisodeController:
             }
         return None
 
-    def _skill_matches(
-        self,
-        spec: Any,
-        spec_name: str,
-        prompt: str,
-        task_family: str | None,
-    ) -> bool:
-        trigger = spec.triggers
-        if trigger.task_family and trigger.task_family != task_family:
-            return False
-        if not trigger.task_contains:
-            return False
-        haystack = f"{spec_name} {prompt}"
-        return any(
-            keyword and keyword.lower() in haystack for keyword in trigger.task_contains
-        )
-
     def _build_solution_payload(self, task: TaskInput, solution: Any) -> dict[str, Any]:
         kind = task.normalized.get("kind", "unknown")
         data = task.normalized.get("data", {})
@@ -1507,16 +1802,16 @@ class EpisodeController:
         base = self.config.paths.runs_dir
         base.mkdir(parents=True, exist_ok=True)
         candidate = base / episode_id
-        if not candidate.exists():
-            candidate.mkdir(parents=True, exist_ok=True)
-            return candidate
-        suffix = 1
+        suffix = 0
         while True:
-            candidate = base / f"{episode_id}-r{suffix:02d}"
-            if not candidate.exists():
-                candidate.mkdir(parents=True, exist_ok=True)
+            # mkdir without exist_ok claims the directory atomically, so
+            # parallel replays of the same episode never share a run dir.
+            try:
+                candidate.mkdir()
                 return candidate
-            suffix += 1
+            except FileExistsError:
+                suffix += 1
+                candidate = base / f"{episode_id}-r{suffix:02d}"
 
     def _utc_now(self) -> str:
         return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
@@ -1824,8 +2119,9 @@ class EpisodeController:
             if isinstance(bundle_dir_value, str) and bundle_dir_value:
                 bundle_dir = Path(bundle_dir_value)
                 if bundle_dir.exists():
-                    loaded_bundle = load_bundle(bundle_dir)
-                    identity = bundle_identity(loaded_bundle)
+                    cached_bundle = self._registry_cache.bundle(bundle_dir)
+                    loaded_bundle = cached_bundle.bundle
+                    identity = dict(cached_bundle.identity)
                     existing = self._load_existing_admission(bundle_dir, identity)
                     if existing is not None:
                         return {
@@ -1845,7 +2141,12 @@ class EpisodeController:
         )
         if compiled_bundle is None:
             return None
-        admission = admit_skill(bundle=compiled_bundle, store=store, seed=seed)
+        admission_cache = None
+        if not self._admission_reverify_enabled():
+            admission_cache = AdmissionCache(self.config.paths.skills_dir / ".admission_cache")
+        admission = admit_skill(
+            bundle=compiled_bundle, store=store, seed=seed, cache=admission_cache
+        )
         if admission.admitted:
             bundle_dir = save_bundle(compiled_bundle, self.config.paths.skills_dir)
             register_skill(
@@ -1862,4 +2163,5 @@ class EpisodeController:
             "admitted": admission.admitted,
             "admission_ref": admission.evidence_ref,
             "admission_ran": True,
+            "admission_cached": admission.cached,
         }
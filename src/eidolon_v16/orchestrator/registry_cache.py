@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from eidolon_v16.language.registry import LanguageRegistry
+from eidolon_v16.language.registry import load_registry as load_language_registry
+from eidolon_v16.language.spec import MacroTemplate
+from eidolon_v16.skills.bundle import SkillBundle, bundle_identity
+from eidolon_v16.skills.registry import SkillRegistry
+from eidolon_v16.skills.registry import load_registry as load_skill_registry
+from eidolon_v16.skills.store import load_bundle
+from eidolon_v16.skills.trigger_index import SkillTriggerIndex
+
+# (st_mtime_ns, st_size, st_ino) of a file, or None when it does not exist.
+# The inode catches atomic replaces that land within one mtime tick.
+_StatKey = tuple[int, int, int] | None
+
+_BUNDLE_FILES = ("skill.json", "program.json", "tests.json", "verify_profile.json")
+
+
+def _stat_key(path: Path) -> _StatKey:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+@dataclass(frozen=True)
+class CachedBundle:
+    bundle: SkillBundle
+    identity: dict[str, str]
+
+
+@dataclass(frozen=True)
+class ScopeMacros:
+    macros: dict[str, MacroTemplate]
+    patches: list[dict[str, Any]]
+
+
+@dataclass
+class RegistryCacheStats:
+    registry_loads: int = 0
+    registry_hits: int = 0
+    bundle_loads: int = 0
+    bundle_hits: int = 0
+
+
+@dataclass
+class _LanguageEntry:
+    registry: LanguageRegistry
+    by_scope: dict[str, ScopeMacros] = field(default_factory=dict)
+
+
+class RegistryCache:
+    """Skill/language registries and skill bundles, re-read only when their files change.
+
+    Cached objects are shared between episodes; callers must treat them as
+    read-only.
+    """
+
+    def __init__(self) -> None:
+        self._skills: dict[Path, tuple[_StatKey, SkillRegistry, SkillTriggerIndex]] = {}
+        self._language: dict[Path, tuple[_StatKey, _LanguageEntry]] = {}
+        self._bundles: dict[Path, tuple[tuple[_StatKey, ...], CachedBundle]] = {}
+        self.stats = RegistryCacheStats()
+
+    def _skill_entry(self, path: Path) -> tuple[_StatKey, SkillRegistry, SkillTriggerIndex]:
+        key = _stat_key(path)
+        cached = self._skills.get(path)
+        if cached is not None and cached[0] == key:
+            self.stats.registry_hits += 1
+            return cached
+        registry = load_skill_registry(path)
+        self.stats.registry_loads += 1
+        entry = (key, registry, SkillTriggerIndex(registry.skills))
+        self._skills[path] = entry
+        return entry
+
+    def skill_registry(self, path: Path) -> SkillRegistry:
+        return self._skill_entry(path)[1]
+
+    def skill_index(self, path: Path) -> SkillTriggerIndex:
+        return self._skill_entry(path)[2]
+
+    def _language_entry(self, path: Path) -> _LanguageEntry:
+        key = _stat_key(path)
+        cached = self._language.get(path)
+        if cached is not None and cached[0] == key:
+            self.stats.registry_hits += 1
+            return cached[1]
+        registry = load_language_registry(path)
+        self.stats.registry_loads += 1
+        entry = _LanguageEntry(registry=registry)
+        for record in registry.patches:
+            scoped = entry.by_scope.setdefault(record.spec.scope, ScopeMacros({}, []))
+            # Later patches override earlier ones, matching registry order.
+            scoped.macros.update(record.spec.macros)
+            scoped.patches.append(
+                {
+                    "name": record.spec.name,
+                    "version": record.spec.version,
+                    "scope": record.spec.scope,
+                }
+            )
+        self._language[path] = (key, entry)
+        return entry
+
+    def language_registry(self, path: Path) -> LanguageRegistry:
+        return self._language_entry(path).registry
+
+    def scope_macros(self, path: Path, scope: str) -> ScopeMacros:
+        return self._language_entry(path).by_scope.get(scope, ScopeMacros({}, []))
+
+    def bundle(self, bundle_dir: Path) -> CachedBundle:
+        key = tuple(_stat_key(bundle_dir / name) for name in _BUNDLE_FILES)
+        cached = self._bundles.get(bundle_dir)
+        if cached is not None and cached[0] == key:
+            self.stats.bundle_hits += 1
+            return cached[1]
+        bundle = load_bundle(bundle_dir)
+        entry = CachedBundle(bundle=bundle, identity=bundle_identity(bundle))
+        self.stats.bundle_loads += 1
+        self._bundles[bundle_dir] = (key, entry)
+        return entry
+
+    def clear(self) -> None:
+        self._skills.clear()
+        self._language.clear()
+        self._bundles.clear()
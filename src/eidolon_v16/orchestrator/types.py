@@ -2,8 +2,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any
 
-from eidolon_v16.ucr.models import TaskInput
+from eidolon_v16.kernel.base import Kernel, SolutionCandidate
+from eidolon_v16.ucr.models import Interpretation, TaskInput
 
 
 @dataclass(frozen=True)
@@ -24,4 +26,22 @@ class EpisodeResult:
     ucr_hash: str
 
 
-__all__ = ["TaskInput", "ModeConfig", "EpisodeResult"]
+@dataclass(frozen=True)
+class KernelPrefetch:
+    """Kernel proposals gathered ahead of time by a batched suite run.
+
+    ``interpret_ms``/``solve_ms`` are this episode's share of the batch wall
+    time, charged to its phases since the kernel calls ran before it started.
+    """
+
+    kernel: Kernel
+    kernel_info: dict[str, Any]
+    interpretations: list[Interpretation]
+    solution: SolutionCandidate | None = None
+    load_ms: int = 0
+    batch_size: int = 0
+    interpret_ms: int = 0
+    solve_ms: int = 0
+
+
+__all__ = ["TaskInput", "ModeConfig", "EpisodeResult", "KernelPrefetch"]
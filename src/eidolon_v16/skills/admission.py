@@ -1,8 +1,14 @@
 from __future__ import annotations
 
 import json
+import logging
+import os
 import random
+import tempfile
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Any
 
 from eidolon_v16.artifacts.store import ArtifactRef, ArtifactStore
@@ -11,6 +17,13 @@ from eidolon_v16.bvps import types as bvps_types
 from eidolon_v16.bvps.interp import Interpreter as BvpsInterpreter
 from eidolon_v16.eval.generator_families import get_generator_families
 from eidolon_v16.skills.bundle import SkillBundle, bundle_identity
+from eidolon_v16.ucr.canonical import canonical_json_bytes, sha256_canonical
+
+logger = logging.getLogger(__name__)
+
+_POOL_LOCK = threading.Lock()
+_POOL: ProcessPoolExecutor | None = None
+_POOL_WORKERS = 0
 
 
 @dataclass(frozen=True)
@@ -18,6 +31,71 @@ class AdmissionResult:
     admitted: bool
     rationale: str
     evidence_ref: ArtifactRef | None = None
+    cached: bool = False
+
+
+# Spec fields that differ between compilations of the same skill but are not
+# read by any gate.
+_VOLATILE_SPEC_FIELDS = ("created_ts_utc", "origin_episode_id", "artifacts")
+
+
+def admission_cache_key(bundle: SkillBundle, seed: int) -> str:
+    """Hash of everything the regression and sealed-lite gates depend on."""
+    spec_payload = bundle.spec.model_dump(mode="json")
+    for name in _VOLATILE_SPEC_FIELDS:
+        spec_payload.pop(name, None)
+    return sha256_canonical(
+        {
+            "spec": spec_payload,
+            "program": bundle.program,
+            "tests": bundle.tests,
+            "verify_profile": bundle.verify_profile,
+            "seed": seed,
+            "families": [family.name for family in get_generator_families()],
+        }
+    )
+
+
+class AdmissionCache:
+    """Persistent regression/sealed-lite gate outcomes, passing and failing alike.
+
+    Entries are keyed by ``admission_cache_key`` and written atomically, so
+    concurrent episodes in other processes can share one directory.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+
+    def _path(self, key: str) -> Path:
+        return self.root / f"{key}.json"
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        try:
+            payload = json.loads(self._path(key).read_bytes())
+        except (OSError, ValueError):
+            return None
+        if not isinstance(payload, dict) or payload.get("key") != key:
+            return None
+        if not isinstance(payload.get("regression"), dict):
+            return None
+        if not isinstance(payload.get("sealed_lite"), dict):
+            return None
+        return payload
+
+    def put(self, key: str, regression: dict[str, Any], sealed: dict[str, Any]) -> None:
+        data = canonical_json_bytes({"key": key, "regression": regression, "sealed_lite": sealed})
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.root, prefix=".tmp-", suffix=".json")
+            try:
+                with os.fdopen(fd, "wb") as handle:
+                    handle.write(data)
+                os.replace(tmp_name, self._path(key))
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+        except OSError as exc:
+            logger.warning("admission cache write failed key=%s error=%s", key, exc)
 
 
 def admit_skill(
@@ -25,9 +103,23 @@ def admit_skill(
     bundle: SkillBundle,
     store: ArtifactStore,
     seed: int,
+    cache: AdmissionCache | None = None,
 ) -> AdmissionResult:
-    regression = run_regression_gate(bundle, seed=seed)
-    sealed = run_sealed_lite_gate(bundle, seed=seed)
+    cache_key = admission_cache_key(bundle, seed) if cache is not None else None
+    cached = cache.get(cache_key) if cache is not None and cache_key is not None else None
+    if cached is not None:
+        regression = cached["regression"]
+        sealed = cached["sealed_lite"]
+        logger.info("admission cache hit skill=%s key=%s", bundle.spec.name, cache_key)
+    else:
+        workers = admission_workers()
+        if workers > 1:
+            regression, sealed = _run_gates_parallel(bundle, seed=seed, workers=workers)
+        else:
+            regression = run_regression_gate(bundle, seed=seed)
+            sealed = run_sealed_lite_gate(bundle, seed=seed)
+        if cache is not None and cache_key is not None:
+            cache.put(cache_key, regression, sealed)
     sealed_ref = store.put_json(
         sealed,
         artifact_type=f"skill_sealed_lite:{bundle.spec.name}",
@@ -62,7 +154,12 @@ def admit_skill(
         producer="skills",
         created_from=[ref.hash for ref in bundle.artifact_refs],
     )
-    return AdmissionResult(admitted=admitted, rationale=rationale, evidence_ref=evidence_ref)
+    return AdmissionResult(
+        admitted=admitted,
+        rationale=rationale,
+        evidence_ref=evidence_ref,
+        cached=cached is not None,
+    )
 
 
 def run_regression_gate(bundle: SkillBundle, seed: int) -> dict[str, Any]:
@@ -98,45 +195,106 @@ def run_sealed_lite_gate(bundle: SkillBundle, seed: int) -> dict[str, Any]:
     interpreter = BvpsInterpreter(step_budget=_step_budget(bundle))
     families = get_generator_families()
     base_spec = bundle.spec.model_dump(mode="json")
-    family_results: list[dict[str, Any]] = []
-    sealed_cases: list[dict[str, Any]] = []
-    overall_status = "PASS"
-    for idx, family in enumerate(families):
-        family_seed = seed + idx * 101
-        specs = family.generate(base_spec, family_seed)
-        variant_results: list[dict[str, Any]] = []
-        for spec in specs:
-            variant_results.append(_evaluate_spec(program, spec, interpreter))
-            mutated = family.mutate(spec, family_seed + 7)
-            variant_results.append(_evaluate_spec(program, mutated, interpreter))
-        family_pass = all(item["pass"] for item in variant_results)
-        family_status = "PASS" if family_pass else "FAIL"
-        overall_status = "FAIL" if family_status == "FAIL" else overall_status
-        sealed_cases.extend(
-            [
-                {
-                    "family": family.name,
-                    "spec": item["spec"],
-                    "cases": item["cases"],
-                }
-                for item in variant_results
-            ]
-        )
-        family_results.append(
-            {
-                "family": family.name,
-                "status": family_status,
-                "variants": variant_results,
-            }
-        )
+    family_results = [
+        _run_sealed_family(program, interpreter, base_spec, family, seed + idx * 101)
+        for idx, family in enumerate(families)
+    ]
+    return _merge_sealed_lite(family_results, [family.canary_token for family in families])
+
+
+def _run_sealed_family(
+    program: bvps_ast.Program,
+    interpreter: BvpsInterpreter,
+    base_spec: dict[str, Any],
+    family: Any,
+    family_seed: int,
+) -> dict[str, Any]:
+    specs = family.generate(base_spec, family_seed)
+    variant_results: list[dict[str, Any]] = []
+    for spec in specs:
+        variant_results.append(_evaluate_spec(program, spec, interpreter))
+        mutated = family.mutate(spec, family_seed + 7)
+        variant_results.append(_evaluate_spec(program, mutated, interpreter))
+    family_pass = all(item["pass"] for item in variant_results)
+    return {
+        "family": family.name,
+        "status": "PASS" if family_pass else "FAIL",
+        "variants": variant_results,
+    }
+
+
+def _merge_sealed_lite(
+    family_results: list[dict[str, Any]], canary_tokens: list[str]
+) -> dict[str, Any]:
+    sealed_cases = [
+        {"family": result["family"], "spec": item["spec"], "cases": item["cases"]}
+        for result in family_results
+        for item in result["variants"]
+    ]
+    overall_status = (
+        "FAIL" if any(result["status"] == "FAIL" for result in family_results) else "PASS"
+    )
     return {
         "status": overall_status,
         "families": family_results,
         "sealed_cases": sealed_cases,
-        "canary_tokens": [family.canary_token for family in families],
+        "canary_tokens": canary_tokens,
     }
 
 
+def admission_workers() -> int:
+    raw = os.getenv("EIDOLON_ADMISSION_WORKERS", "").strip()
+    if not raw:
+        return 1
+    try:
+        return max(1, int(raw))
+    except ValueError as exc:
+        raise ValueError("EIDOLON_ADMISSION_WORKERS must be an int") from exc
+
+
+def _admission_pool(workers: int) -> ProcessPoolExecutor:
+    # One pool per process, reused across admissions so worker start-up is
+    # paid once rather than on every auto-skill episode.
+    global _POOL, _POOL_WORKERS
+    with _POOL_LOCK:
+        if _POOL is None or workers != _POOL_WORKERS:
+            if _POOL is not None:
+                _POOL.shutdown(wait=False)
+            _POOL = ProcessPoolExecutor(max_workers=workers)
+            _POOL_WORKERS = workers
+        return _POOL
+
+
+def _sealed_family_task(bundle: SkillBundle, family_index: int, seed: int) -> dict[str, Any]:
+    family = get_generator_families()[family_index]
+    return _run_sealed_family(
+        bvps_ast.program_from_dict(bundle.program),
+        BvpsInterpreter(step_budget=_step_budget(bundle)),
+        bundle.spec.model_dump(mode="json"),
+        family,
+        seed + family_index * 101,
+    )
+
+
+def _run_gates_parallel(
+    bundle: SkillBundle, *, seed: int, workers: int
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Run the regression gate and each sealed-lite family as separate pool tasks.
+
+    Results are merged in family order, so the evidence payload is identical
+    to the sequential gates.
+    """
+    families = get_generator_families()
+    pool = _admission_pool(workers)
+    regression_future = pool.submit(run_regression_gate, bundle, seed)
+    family_futures: list[Future[dict[str, Any]]] = [
+        pool.submit(_sealed_family_task, bundle, idx, seed) for idx in range(len(families))
+    ]
+    family_results = [future.result() for future in family_futures]
+    sealed = _merge_sealed_lite(family_results, [family.canary_token for family in families])
+    return regression_future.result(), sealed
+
+
 def run_canary_gate(
     bundle: SkillBundle,
     sealed_lite: list[dict[str, Any]],
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable
+
+from eidolon_v16.skills.registry import SkillRecord
+
+
+class KeywordAutomaton:
+    """Aho-Corasick automaton reporting which keywords occur in a text.
+
+    One pass over the text finds every keyword regardless of how many are
+    indexed, where the naive ``keyword in text`` loop costs one scan each.
+    """
+
+    def __init__(self, keywords: Iterable[str]) -> None:
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[list[str]] = [[]]
+        for keyword in keywords:
+            if keyword:
+                self._add(keyword)
+        self._build()
+
+    def _add(self, keyword: str) -> None:
+        state = 0
+        for char in keyword:
+            nxt = self._goto[state].get(char)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+                self._goto[state][char] = nxt
+            state = nxt
+        if keyword not in self._out[state]:
+            self._out[state].append(keyword)
+
+    def _build(self) -> None:
+        queue: deque[int] = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def find(self, text: str) -> set[str]:
+        found: set[str] = set()
+        goto = self._goto
+        fail = self._fail
+        out = self._out
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if out[state]:
+                found.update(out[state])
+        return found
+
+
+class SkillTriggerIndex:
+    """Trigger lookup over a skill registry, preserving name-ordered matching.
+
+    ``candidates`` returns exactly the records the linear scan would accept
+    (task family filter plus any ``task_contains`` keyword occurring in
+    ``"<spec name> <prompt>"``), in the same spec-name order.
+    """
+
+    def __init__(self, records: Iterable[SkillRecord]) -> None:
+        self._records = sorted(records, key=lambda record: record.spec.name)
+        self._by_keyword: dict[str, list[int]] = {}
+        self._family: list[str | None] = []
+        for position, record in enumerate(self._records):
+            trigger = record.spec.triggers
+            self._family.append(trigger.task_family or None)
+            for keyword in trigger.task_contains:
+                if not keyword:
+                    continue
+                positions = self._by_keyword.setdefault(keyword.lower(), [])
+                if not positions or positions[-1] != position:
+                    positions.append(position)
+        self._automaton = KeywordAutomaton(self._by_keyword)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def candidates(
+        self, spec_name: str, prompt: str, task_family: str | None
+    ) -> list[SkillRecord]:
+        haystack = f"{spec_name} {prompt}"
+        positions: set[int] = set()
+        for keyword in self._automaton.find(haystack):
+            positions.update(self._by_keyword[keyword])
+        return [
+            self._records[position]
+            for position in sorted(positions)
+            if self._family[position] is None or self._family[position] == task_family
+        ]
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import functools
+import json
+import os
+import threading
+import time
+import weakref
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> _NullSpan:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("_tracer", "_name", "_cat", "_args", "_start")
+
+    def __init__(self, tracer: Tracer, name: str, cat: str, args: dict[str, Any]) -> None:
+        self._tracer = tracer
+        self._name = name
+        self._cat = cat
+        self._args = args
+        self._start = 0.0
+
+    def __enter__(self) -> _Span:
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self._tracer.record(
+            self._name, self._start, time.perf_counter(), cat=self._cat, **self._args
+        )
+
+
+class TraceScope:
+    """An open export window: events recorded after ``mark``, optionally one thread's."""
+
+    __slots__ = ("mark", "tid", "__weakref__")
+
+    def __init__(self, mark: int, tid: int | None) -> None:
+        self.mark = mark
+        self.tid = tid
+
+
+class Tracer:
+    """Buffer of complete ("X") trace events in the Chrome trace-event format.
+
+    Spans are timed with ``time.perf_counter`` so callers that already keep
+    perf_counter timestamps can ``record`` a span after the fact instead of
+    wrapping code in a ``span`` block. Viewers (chrome://tracing, Perfetto)
+    nest spans of the same thread by time containment.
+
+    Marks are absolute positions in the event log. Events are kept only while
+    a ``TraceScope`` that can still export them is open: ``close_scope`` drops
+    everything older than the oldest open scope. Scopes are held weakly, so a
+    caller that fails before closing its scope does not pin the buffer.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._events: list[dict[str, Any]] = []
+        self._dropped = 0
+        self._scopes: weakref.WeakSet[TraceScope] = weakref.WeakSet()
+        self._pid = os.getpid()
+
+    def record(
+        self, name: str, start_s: float, end_s: float, *, cat: str = "", **args: Any
+    ) -> None:
+        event: dict[str, Any] = {
+            "name": name,
+            "cat": cat or "eidolon",
+            "ph": "X",
+            "ts": round(start_s * 1_000_000, 3),
+            "dur": round(max(0.0, end_s - start_s) * 1_000_000, 3),
+            "pid": self._pid,
+            "tid": threading.get_ident(),
+        }
+        if args:
+            event["args"] = args
+        with self._lock:
+            self._events.append(event)
+
+    def span(self, name: str, *, cat: str = "", **args: Any) -> _Span:
+        return _Span(self, name, cat, args)
+
+    def mark(self) -> int:
+        """Position to pass to ``events``/``write`` to select later spans only."""
+        with self._lock:
+            return self._dropped + len(self._events)
+
+    def open_scope(self, *, this_thread: bool = False) -> TraceScope:
+        """Keep later events until ``close_scope``; ``this_thread`` limits its export."""
+        with self._lock:
+            scope = TraceScope(
+                self._dropped + len(self._events),
+                threading.get_ident() if this_thread else None,
+            )
+            self._scopes.add(scope)
+            return scope
+
+    def close_scope(self, scope: TraceScope) -> None:
+        with self._lock:
+            self._scopes.discard(scope)
+            keep_from = min(
+                (open_scope.mark for open_scope in self._scopes),
+                default=self._dropped + len(self._events),
+            )
+            drop = keep_from - self._dropped
+            if drop > 0:
+                del self._events[:drop]
+                self._dropped += drop
+
+    def events(self, since: int = 0, *, tid: int | None = None) -> list[dict[str, Any]]:
+        with self._lock:
+            events = self._events[max(0, since - self._dropped) :]
+        if tid is not None:
+            return [event for event in events if event["tid"] == tid]
+        return list(events)
+
+    def write(self, path: Path, since: int | TraceScope = 0) -> Path:
+        if isinstance(since, TraceScope):
+            selected = self.events(since.mark, tid=since.tid)
+        else:
+            selected = self.events(since)
+        events = sorted(selected, key=lambda event: (event["ts"], -event["dur"]))
+        payload = {"traceEvents": events, "displayTimeUnit": "ms"}
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(payload, default=str))
+        return path
+
+    def clear(self) -> None:
+        with self._lock:
+            self._dropped += len(self._events)
+            self._events.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._events)
+
+
+_TRACER = Tracer()
+
+
+def tracer() -> Tracer | None:
+    """Process-wide tracer when ``EIDOLON_TRACE=1``, else ``None``."""
+    if os.getenv("EIDOLON_TRACE", "").strip() != "1":
+        return None
+    return _TRACER
+
+
+def span(name: str, *, cat: str = "", **args: Any) -> _Span | _NullSpan:
+    active = tracer()
+    if active is None:
+        return _NULL_SPAN
+    return active.span(name, cat=cat, **args)
+
+
+def record(name: str, start_s: float, end_s: float, *, cat: str = "", **args: Any) -> None:
+    active = tracer()
+    if active is not None:
+        active.record(name, start_s, end_s, cat=cat, **args)
+
+
+def traced(name: str, *, cat: str = "") -> Callable[[F], F]:
+    """Decorator recording a span per call while tracing is enabled."""
+
+    def decorate(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            active = tracer()
+            if active is None:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                active.record(name, start, time.perf_counter(), cat=cat)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
@@ -7,6 +7,7 @@ import random
 import time
 from typing import Any, Literal
 
+from eidolon_v16 import metrics, tracing
 from eidolon_v16.arith_types import canonicalize_number
 from eidolon_v16.artifacts.store import ArtifactStore
 from eidolon_v16.bvps import ast as bvps_ast
@@ -65,7 +66,10 @@ def run_lanes(
         start = time.perf_counter()
         verdict, duration_ms = func(*args, **kwargs)
         lane_exec_ms = _cost_ms(duration_ms)
-        elapsed_ms = int(round((time.perf_counter() - start) * 1000))
+        elapsed = time.perf_counter() - start
+        metrics.registry().record_ns(f"verify.{verdict.lane}", int(elapsed * 1e9))
+        tracing.record(f"lane.{verdict.lane}", start, start + elapsed, cat="verify")
+        elapsed_ms = int(round(elapsed * 1000))
         if elapsed_ms < 0:
             elapsed_ms = 0
         artifact_ms = max(0, elapsed_ms - lane_exec_ms)
@@ -549,7 +553,7 @@ def run_consequence(
             length = rng.randint(0, 5)
             sample = [rng.randint(-3, 6) for _ in range(length)]
             expected = spec_fn(sample)
-            output, _trace = interpreter.run(list_program, [sample])
+            output, _trace = interpreter.run(list_program, [sample], trace=False)
             if output != expected:
                 list_counterexample = {"input": sample, "expected": expected, "output": output}
                 break
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import pickle
+
+from eidolon_v16.bvps import ast as bvps_ast
+from eidolon_v16.bvps import enumerate as bvps_enumerate
+from eidolon_v16.bvps.ast import (
+    BinOp,
+    BoolConst,
+    ExprInterner,
+    IfThenElse,
+    IntConst,
+    MacroCall,
+    Var,
+)
+
+
+def test_interner_shares_structurally_equal_nodes() -> None:
+    interner = ExprInterner()
+    left = interner.binop("add", interner.var("x"), interner.int_const(1))
+    right = interner.binop("add", Var("x"), IntConst(1))
+    assert left is right
+    assert len(interner) == 3
+
+    plain = IfThenElse(
+        BinOp("lt", Var("x"), IntConst(0)),
+        BinOp("add", Var("x"), IntConst(1)),
+        Var("x"),
+    )
+    interned = interner.intern(plain)
+    assert interned == plain
+    assert hash(interned) == hash(plain)
+    assert interned.then_expr is left
+    assert interner.intern(interned) is interned
+    assert bvps_ast.expr_depth(interned) == bvps_ast.expr_depth(plain) == 2
+    assert bvps_ast.expr_size(interned) == bvps_ast.expr_size(plain) == 8
+
+    macro = interner.macro_call("incr", (Var("x"),))
+    assert macro == MacroCall("incr", (Var("x"),))
+    assert bvps_ast.expr_depth(macro) == 0
+    assert interner.int_const(1) != interner.bool_const(True)
+
+
+def test_interned_nodes_pickle_without_metadata() -> None:
+    interner = ExprInterner()
+    node = interner.if_then_else(BoolConst(True), IntConst(1), IntConst(2))
+    restored = pickle.loads(pickle.dumps(node))
+    assert restored == node
+    assert restored._meta is None
+    assert interner.intern(restored) is node
+
+
+def test_enumeration_yields_unique_interned_exprs() -> None:
+    exprs = list(bvps_enumerate.enumerate_exprs("Int", {"x": "Int", "y": "Int"}, 1, {}))
+    assert len({bvps_ast.expr_to_str(expr) for expr in exprs}) == len(exprs)
+    assert all(expr._meta is not None and expr._meta.depth == 1 for expr in exprs)
+    first_var = next(expr for expr in exprs if isinstance(expr, BinOp)).left
+    assert all(
+        expr.left is first_var
+        for expr in exprs
+        if isinstance(expr, BinOp) and expr.left == first_var
+    )
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from eidolon_v16.bvps import ast as bvps_ast
+from eidolon_v16.bvps import cegis as bvps_cegis
+from eidolon_v16.bvps import types as bvps_types
+from eidolon_v16.bvps.cex_bank import CounterexampleBank, counterexample_bank_key
+from eidolon_v16.bvps.types import Example
+
+
+def _even_spec(name: str = "even") -> bvps_types.Spec:
+    even_oracle = bvps_ast.BinOp(
+        "eq",
+        bvps_ast.BinOp("mod", bvps_ast.Var("x"), bvps_ast.IntConst(2)),
+        bvps_ast.IntConst(0),
+    ).to_dict()
+    return bvps_types.spec_from_dict(
+        {
+            "name": name,
+            "inputs": [["x", "Int"]],
+            "output": "Bool",
+            "examples": [{"in": {"x": 2}, "out": True}],
+            "bounds": {"max_depth": 3, "max_programs": 2000, "fuzz_trials": 5},
+            "oracle": even_oracle,
+        }
+    )
+
+
+def test_warm_run_is_seeded_with_banked_counterexamples(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("EIDOLON_BVPS_PERSIST_DIR", str(tmp_path))
+    monkeypatch.setenv("EIDOLON_BVPS_CEX_BANK", "1")
+    cold = bvps_cegis.synthesize(_even_spec(), seed=42)
+    assert cold.stats.counterexamples >= 1
+
+    # Another spec name and seed, same signature and oracle: same bank.
+    warm = bvps_cegis.synthesize(_even_spec("even_again"), seed=7)
+    assert warm.stats.counterexamples < cold.stats.counterexamples
+    assert warm.stats.candidates_tried <= cold.stats.candidates_tried
+    warm_inputs = [example.inputs for example in warm.examples]
+    for example in cold.counterexamples:
+        assert example.inputs in warm_inputs
+    checks = bvps_cegis.evaluate_examples(warm.program, _even_spec())
+    assert all(item["ok"] for item in checks)
+
+
+def test_bank_evicts_least_useful(tmp_path: Path) -> None:
+    key = counterexample_bank_key(_even_spec())
+    assert key is not None
+    bank = CounterexampleBank(tmp_path, capacity=2)
+    first = Example(inputs={"x": 1}, output=False)
+    second = Example(inputs={"x": 3}, output=False)
+    third = Example(inputs={"x": 5}, output=False)
+    bank.record(key, hits={}, found=[first, second])
+    bank.record(key, hits={b'{"x":3}': 4}, found=[])
+    bank.record(key, hits={}, found=[third])
+    assert bank.load(key) == [second, third]
+
+    other = CounterexampleBank(tmp_path / "other")
+    assert other.load(key) == []
+    no_oracle = bvps_types.spec_from_dict(
+        {"name": "no_oracle", "inputs": [["x", "Int"]], "output": "Int", "examples": []}
+    )
+    assert counterexample_bank_key(no_oracle) is None
+
+
+def _clamp_spec(int_min: int, int_max: int, max_depth: int) -> bvps_types.Spec:
+    # Equals ``x`` on [-3, 3] but not beyond 3.
+    oracle = bvps_ast.IfThenElse(
+        bvps_ast.BinOp("lt", bvps_ast.Var("x"), bvps_ast.IntConst(4)),
+        bvps_ast.Var("x"),
+        bvps_ast.IntConst(0),
+    ).to_dict()
+    return bvps_types.spec_from_dict(
+        {
+            "name": f"clamp_{int_min}_{int_max}",
+            "inputs": [["x", "Int"]],
+            "output": "Int",
+            "examples": [{"in": {"x": 1}, "out": 1}],
+            "bounds": {
+                "int_range": {"min": int_min, "max": int_max},
+                "max_depth": max_depth,
+                "max_programs": 2000,
+                "fuzz_trials": 60,
+            },
+            "oracle": oracle,
+        }
+    )
+
+
+def test_banked_inputs_outside_spec_bounds_are_skipped(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("EIDOLON_BVPS_PERSIST_DIR", str(tmp_path))
+    monkeypatch.setenv("EIDOLON_BVPS_PERSIST", "0")
+    monkeypatch.setenv("EIDOLON_BVPS_CEX_BANK", "1")
+    narrow = _clamp_spec(-3, 3, max_depth=1)
+    key = counterexample_bank_key(narrow)
+    assert key is not None
+    cold = bvps_cegis.synthesize(narrow, seed=0)
+    assert cold.program.body == bvps_ast.Var("x")
+
+    # Fuzzing the wider range rejects ``x`` and banks an input above 3.
+    with pytest.raises(RuntimeError):
+        bvps_cegis.synthesize(_clamp_spec(-10, 10, max_depth=1), seed=0)
+    banked = CounterexampleBank(tmp_path / "counterexamples").load(key)
+    assert any(int(example.inputs["x"]) > 3 for example in banked)
+
+    warm = bvps_cegis.synthesize(narrow, seed=0)
+    assert warm.program.body == bvps_ast.Var("x")
+    assert all(-3 <= int(example.inputs["x"]) <= 3 for example in warm.examples)
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from itertools import islice
+
+import pytest
+
+from eidolon_v16.bvps import ast as bvps_ast
+from eidolon_v16.bvps import cegis as bvps_cegis
+from eidolon_v16.bvps import enumerate as bvps_enumerate
+from eidolon_v16.bvps import types as bvps_types
+
+
+def _spec(max_depth: int, max_programs: int = 1000) -> bvps_types.Spec:
+    return bvps_types.spec_from_dict(
+        {
+            "name": "enum_order",
+            "inputs": [["x", "Int"], ["y", "Int"]],
+            "output": "Int",
+            "examples": [{"in": {"x": 1, "y": 2}, "out": 2}],
+            "bounds": {"max_depth": max_depth, "max_programs": max_programs},
+        }
+    )
+
+
+def test_depth_order_streams_and_matches_materialized_lists() -> None:
+    spec = _spec(max_depth=2)
+    var_types = {"x": "Int", "y": "Int"}
+    expected: list[str] = []
+    for depth in range(2):
+        exprs = bvps_enumerate.enumerate_exprs("Int", var_types, depth, {})
+        expected.extend(bvps_ast.expr_to_str(expr) for expr in exprs)
+    streamed = [
+        bvps_ast.expr_to_str(program.body)
+        for program in bvps_enumerate.enumerate_programs(spec, limit=len(expected))
+    ]
+    assert streamed == expected
+
+    limited = list(bvps_enumerate.enumerate_programs(_spec(max_depth=3), limit=25))
+    assert len(limited) == 25
+
+
+def test_size_order_is_smallest_first_and_unique() -> None:
+    spec = _spec(max_depth=2)
+    programs = list(islice(bvps_enumerate.enumerate_programs(spec, order="size"), 20000))
+    sizes = [bvps_ast.expr_size(program.body) for program in programs]
+    assert sizes == sorted(sizes)
+    texts = [bvps_ast.expr_to_str(program.body) for program in programs]
+    assert len(set(texts)) == len(texts)
+    assert all(bvps_ast.expr_depth(program.body) <= 2 for program in programs)
+    again = bvps_enumerate.enumerate_programs(spec, order="size", limit=len(texts))
+    assert [bvps_ast.expr_to_str(program.body) for program in again] == texts
+
+
+def test_size_order_synthesis_and_env_validation(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("EIDOLON_BVPS_ENUM_ORDER", "size")
+    result = bvps_cegis.synthesize(_spec(max_depth=3), seed=0)
+    checks = bvps_cegis.evaluate_examples(result.program, _spec(max_depth=3))
+    assert all(item["ok"] for item in checks)
+
+    monkeypatch.setenv("EIDOLON_BVPS_ENUM_ORDER", "breadth")
+    with pytest.raises(ValueError, match="EIDOLON_BVPS_ENUM_ORDER"):
+        bvps_enumerate.enum_order_from_env()
+
+
+def test_size_and_depth_order_enumerate_the_same_programs() -> None:
+    # At depth 2 the size-4 bucket holds only ifs; size order must still not
+    # admit them as conditions or branches, just as depth order does not.
+    spec = bvps_types.spec_from_dict(
+        {
+            "name": "same_space",
+            "inputs": [["b", "Bool"]],
+            "output": "Bool",
+            "examples": [],
+            "bounds": {"max_depth": 2},
+        }
+    )
+    by_depth = [program.body for program in bvps_enumerate.enumerate_programs(spec)]
+    by_size = [
+        program.body for program in bvps_enumerate.enumerate_programs(spec, order="size")
+    ]
+    assert len(by_size) == len(by_depth)
+    assert set(by_size) == set(by_depth)
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import pytest
+
+from eidolon_v16.bvps import ast as bvps_ast
+from eidolon_v16.bvps.interp import Interpreter
+
+
+def _program() -> bvps_ast.Program:
+    return bvps_ast.Program(
+        params=[("x", "Int")],
+        return_type="Int",
+        body=bvps_ast.IfThenElse(
+            cond=bvps_ast.BinOp("lt", bvps_ast.Var("x"), bvps_ast.IntConst(0)),
+            then_expr=bvps_ast.BoolConst(False),
+            else_expr=bvps_ast.BinOp("add", bvps_ast.Var("x"), bvps_ast.IntConst(1)),
+        ),
+    )
+
+
+def test_traced_events_materialize_on_access() -> None:
+    output, trace = Interpreter(step_budget=20).evaluate(_program(), {"x": 3}, trace=True)
+    assert output == 4
+    assert trace.steps == 7
+    assert len(trace) == 7
+    assert trace.events == [
+        {"step": 3, "event": "var", "payload": {"name": "x"}},
+        {"step": 4, "event": "int", "payload": {"value": 0}},
+        {"step": 4, "event": "binop", "payload": {"op": "lt"}},
+        {"step": 4, "event": "if", "payload": {"cond": False}},
+        {"step": 6, "event": "var", "payload": {"name": "x"}},
+        {"step": 7, "event": "int", "payload": {"value": 1}},
+        {"step": 7, "event": "binop", "payload": {"op": "add"}},
+    ]
+    assert trace.events is trace.events
+
+
+def test_untraced_run_matches_traced_steps() -> None:
+    interpreter = Interpreter(step_budget=20)
+    for x in (-2, 0, 5):
+        traced, traced_info = interpreter.evaluate(_program(), {"x": x}, trace=True)
+        fast, fast_info = interpreter.evaluate(_program(), {"x": x})
+        assert fast == traced
+        assert fast_info.steps == traced_info.steps
+        assert fast_info.events == []
+
+
+def test_step_budget_applies_to_both_paths() -> None:
+    interpreter = Interpreter(step_budget=6)
+    for trace in (True, False):
+        with pytest.raises(RuntimeError, match="step budget exceeded"):
+            interpreter.evaluate(_program(), {"x": 3}, trace=trace)
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import multiprocessing
+from pathlib import Path
+
+from eidolon_v16.artifacts.store import ArtifactStore
+from eidolon_v16.bvps import cache as bvps_cache
+from eidolon_v16.bvps.persist_index import PersistIndex
+
+
+def _payload(worker: int, item: int) -> dict[str, object]:
+    return {"spec_hash": f"spec-{worker}-{item}", "macros_hash": "m", "attempt": 1}
+
+
+def _write_entries(root: str, worker: int, count: int) -> None:
+    store = ArtifactStore(Path(root))
+    for item in range(count):
+        bvps_cache.write_persistent_payload(
+            store, _payload(worker, item), created_from=[f"spec-{worker}-{item}"]
+        )
+
+
+def test_concurrent_writers_lose_no_entries(tmp_path: Path) -> None:
+    root = tmp_path / "persist"
+    workers, count = 4, 10
+    ctx = multiprocessing.get_context("spawn")
+    procs = [
+        ctx.Process(target=_write_entries, args=(str(root), worker, count))
+        for worker in range(workers)
+    ]
+    for proc in procs:
+        proc.start()
+    for proc in procs:
+        proc.join(timeout=60)
+        assert proc.exitcode == 0
+
+    store = ArtifactStore(root)
+    entries = bvps_cache.iter_persistent_entries(store)
+    assert len(entries) == workers * count
+    spec_hashes = {
+        bvps_cache.read_persistent_payload(store, entry.hash)["spec_hash"] for entry in entries
+    }
+    assert spec_hashes == {f"spec-{w}-{i}" for w in range(workers) for i in range(count)}
+
+
+def test_refresh_reads_only_new_generations(tmp_path: Path) -> None:
+    root = tmp_path / "persist"
+    store = ArtifactStore(root)
+    reader = PersistIndex(root)
+    _write_entries(str(root), worker=0, count=3)
+    assert reader.refresh() == 3
+    generation = reader.generation
+
+    _write_entries(str(root), worker=1, count=2)
+    latest, fresh = reader.entries_since(generation)
+    assert len(fresh) == 2 and latest > generation
+    assert reader.refresh() == 2
+    assert reader.refresh() == 0
+    # Rewriting an existing payload is idempotent.
+    _write_entries(str(root), worker=1, count=2)
+    assert reader.refresh() == 0
+    assert len(bvps_cache.iter_persistent_entries(store)) == 5
+
+
+def test_legacy_manifest_entries_are_imported(tmp_path: Path) -> None:
+    root = tmp_path / "persist"
+    legacy = ArtifactStore(root)
+    legacy.put_json({"spec_hash": "old"}, artifact_type="bvps_program_cache", producer="bvps")
+    entries = bvps_cache.iter_persistent_entries(ArtifactStore(root))
+    assert [bvps_cache.read_persistent_payload(legacy, e.hash) for e in entries] == [
+        {"spec_hash": "old"}
+    ]
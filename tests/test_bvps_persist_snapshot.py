@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from eidolon_v16.artifacts.store import ArtifactStore
+from eidolon_v16.bvps import ast as bvps_ast
+from eidolon_v16.bvps import cache as bvps_cache
+
+
+def _write(store: ArtifactStore, spec_hash: str, value: int) -> tuple[str, str, int]:
+    program = bvps_ast.Program([("x", "Int")], bvps_ast.IntConst(value), "Int").to_dict()
+    cache_key = bvps_cache.bvps_cache_key_string(spec_hash, "macros", 1)
+    payload = {
+        "cache_key": cache_key,
+        "spec_hash": spec_hash,
+        "attempt": 1,
+        "macros_hash": "macros",
+        "program": program,
+        "program_pretty": str(value),
+    }
+    bvps_cache.write_persistent_payload(store, payload, created_from=[spec_hash, cache_key])
+    return (spec_hash, "macros", 1)
+
+
+def _count_reads(monkeypatch: pytest.MonkeyPatch) -> dict[str, int]:
+    calls = {"reads": 0}
+    original = bvps_cache.read_persistent_payload
+
+    def wrapped(*args: Any, **kwargs: Any) -> Any:
+        calls["reads"] += 1
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(bvps_cache, "read_persistent_payload", wrapped)
+    return calls
+
+
+def test_snapshot_preload_matches_sequential_read(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    store = ArtifactStore(tmp_path / "persist")
+    keys = [_write(store, f"spec-{i}", i) for i in range(6)]
+    calls = _count_reads(monkeypatch)
+
+    parallel, stats = bvps_cache.preload_persistent_cache(store, workers=4)
+    assert set(parallel) == set(keys)
+    assert (stats.entries, stats.snapshot_entries, calls["reads"]) == (6, 0, 6)
+    assert (store.root / bvps_cache.SNAPSHOT_FILENAME).exists()
+
+    warm, stats = bvps_cache.preload_persistent_cache(store)
+    assert warm == parallel
+    assert (stats.snapshot_entries, calls["reads"]) == (6, 6)
+
+    # A new entry is read on its own and folded into the snapshot.
+    new_key = _write(store, "spec-new", 9)
+    refreshed, stats = bvps_cache.preload_persistent_cache(store, workers=1)
+    assert refreshed[new_key]["program_pretty"] == "9"
+    assert (stats.snapshot_entries, calls["reads"]) == (6, 7)
+
+
+def test_lazy_preload_reads_on_first_access(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    store = ArtifactStore(tmp_path / "persist")
+    keys = [_write(store, f"spec-{i}", i) for i in range(3)]
+    calls = _count_reads(monkeypatch)
+
+    cache, stats = bvps_cache.preload_persistent_cache(store, lazy=True)
+    assert (stats.entries, stats.lazy_entries, calls["reads"]) == (3, 3, 0)
+    record = cache.get(keys[1])
+    assert record is not None and record["program_pretty"] == "1"
+    assert calls["reads"] == 1
+    assert cache.get(keys[1]) is record
+    assert cache.get(("spec-missing", "macros", 1)) is None
+    assert calls["reads"] == 1
+
+
+def test_lazy_preload_picks_the_same_winner_as_eager(tmp_path: Path) -> None:
+    store = ArtifactStore(tmp_path / "persist")
+    key = _write(store, "spec-dup", 0)
+    bvps_cache.preload_persistent_cache(store)
+    (snapshot_entry,) = bvps_cache.iter_persistent_entries(store)
+
+    # Same key again after the snapshot was written; some of these hash lower.
+    for value in range(1, 8):
+        _write(store, "spec-dup", value)
+    assert bvps_cache.iter_persistent_entries(store)[0].hash < snapshot_entry.hash
+
+    lazy, stats = bvps_cache.preload_persistent_cache(store, lazy=True)
+    assert (stats.entries, stats.snapshot_entries) == (1, 1)
+    eager, _ = bvps_cache.preload_persistent_cache(store)
+    assert lazy.get(key) == eager[key]
+
+
+def test_lazy_preload_folds_hydrated_entries_into_the_snapshot(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    store = ArtifactStore(tmp_path / "persist")
+    keys = [_write(store, f"spec-{i}", i) for i in range(3)]
+    calls = _count_reads(monkeypatch)
+
+    lazy, _stats = bvps_cache.preload_persistent_cache(store, lazy=True)
+    assert isinstance(lazy, bvps_cache.LazyPersistCache)
+    assert lazy.flush_snapshot() == 0
+    assert lazy.get(keys[0]) is not None
+    assert lazy.flush_snapshot() == 1
+    assert lazy.flush_snapshot() == 0
+
+    again, stats = bvps_cache.preload_persistent_cache(store, lazy=True)
+    assert (stats.snapshot_entries, stats.lazy_entries) == (1, 2)
+    assert again.get(keys[0]) == lazy.get(keys[0])
+    assert calls["reads"] == 1
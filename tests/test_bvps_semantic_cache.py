@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from eidolon_v16.artifacts.store import ArtifactStore
+from eidolon_v16.bvps import ast as bvps_ast
+from eidolon_v16.bvps import cegis as bvps_cegis
+from eidolon_v16.config import default_config
+from eidolon_v16.orchestrator.controller import EpisodeController
+from eidolon_v16.ucr.models import TaskInput
+
+
+def _spec(examples: list[dict[str, Any]], name: str = "x_plus_one") -> dict[str, Any]:
+    oracle = bvps_ast.BinOp("add", bvps_ast.Var("x"), bvps_ast.IntConst(1)).to_dict()
+    return {
+        "name": name,
+        "inputs": [["x", "Int"]],
+        "output": "Int",
+        "examples": examples,
+        "bounds": {"int_range": {"min": -3, "max": 3}, "fuzz_trials": 5},
+        "oracle": oracle,
+    }
+
+
+def _solve(
+    controller: EpisodeController, spec: dict[str, Any], store: ArtifactStore
+) -> dict[str, Any]:
+    task = TaskInput.from_raw(
+        {"task_id": "bvps-semantic", "kind": "bvps", "prompt": "BVPS", "data": {"bvps_spec": spec}}
+    )
+    _solution, _refs, summary = controller._solve_bvps(
+        task, spec, store, seed=0, episode_id="ep-semantic", macros={}
+    )
+    return summary
+
+
+def test_semantic_cache_reuses_revalidated_program(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("EIDOLON_BVPS_PERSIST", "0")
+    monkeypatch.setenv("EIDOLON_BVPS_FASTPATH", "0")
+    monkeypatch.setenv("EIDOLON_BVPS_SEMANTIC_CACHE", "1")
+    calls = {"count": 0}
+    original = bvps_cegis.synthesize
+
+    def wrapped(*args: Any, **kwargs: Any) -> Any:
+        calls["count"] += 1
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(bvps_cegis, "synthesize", wrapped)
+    controller = EpisodeController(config=default_config(root=tmp_path))
+    store = ArtifactStore(tmp_path / "artifacts")
+    examples = [{"in": {"x": 0}, "out": 1}, {"in": {"x": 2}, "out": 3}]
+
+    first = _solve(controller, _spec(examples), store)
+    assert first["bvps_cache_state"] == "miss:none"
+
+    # Shuffled examples and a new name change the spec hash, not its meaning.
+    shuffled = _solve(controller, _spec(examples[::-1], name="x_plus_one_mut"), store)
+    assert shuffled["bvps_cache_state"] == "hit:semantic"
+    assert shuffled["bvps_ids"]["program_hash"] == first["bvps_ids"]["program_hash"]
+    assert calls["count"] == 1
+
+    # A remembered program that fails the new spec's checks is never reused.
+    controller._bvps_semantic_cache = {
+        key: [bvps_ast.Program([("x", "Int")], bvps_ast.Var("x"), "Int").to_dict()]
+        for key in controller._bvps_semantic_cache
+    }
+    wrong = _solve(controller, _spec(examples + [{"in": {"x": 1}, "out": 2}]), store)
+    assert wrong["bvps_cache_state"] == "miss:none"
+    assert calls["count"] == 2
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from eidolon_v16.bvps import ast as bvps_ast
+from eidolon_v16.bvps import cegis as bvps_cegis
+from eidolon_v16.bvps import enumerate as bvps_enumerate
+from eidolon_v16.bvps import types as bvps_types
+from eidolon_v16.bvps.ast import BinOp, BoolConst, IfThenElse, IntConst, Var
+from eidolon_v16.bvps.interp import Interpreter
+from eidolon_v16.bvps.simplify import Simplifier, simplify_expr
+
+
+def _spec(max_depth: int) -> bvps_types.Spec:
+    return bvps_types.spec_from_dict(
+        {
+            "name": "simplify",
+            "inputs": [["x", "Int"], ["y", "Int"]],
+            "output": "Int",
+            "examples": [{"in": {"x": 1, "y": 2}, "out": 2}],
+            "bounds": {"max_depth": max_depth, "max_programs": 1000},
+        }
+    )
+
+
+def _text(expr: bvps_ast.Expr) -> str:
+    return bvps_ast.expr_to_str(simplify_expr(expr))
+
+
+def test_folds_constants_and_identities() -> None:
+    x = Var("x")
+    assert _text(BinOp("add", IntConst(0), IntConst(1))) == "1"
+    assert _text(BinOp("sub", x, x)) == "0"
+    assert _text(BinOp("mul", BinOp("add", x, IntConst(0)), IntConst(1))) == "x"
+    assert _text(BinOp("gt", x, IntConst(1))) == "(1 lt x)"
+    assert _text(BinOp("add", IntConst(1), x)) == _text(BinOp("add", x, IntConst(1)))
+    assert _text(IfThenElse(BinOp("lt", IntConst(1), IntConst(0)), x, IntConst(2))) == "2"
+    assert _text(IfThenElse(BinOp("lt", x, Var("y")), x, x)) == "x"
+    assert _text(IfThenElse(BinOp("eq", x, x), BoolConst(True), BoolConst(False))) == "true"
+
+
+def test_never_drops_a_failing_subexpression() -> None:
+    x = Var("x")
+    by_zero = BinOp("mod", x, BinOp("sub", x, x))
+    assert _text(by_zero) == "(x mod 0)"
+    assert _text(BinOp("mul", IntConst(0), BinOp("mod", x, Var("y")))) != "0"
+    assert _text(BinOp("sub", by_zero, by_zero)) == "((x mod 0) sub (x mod 0))"
+
+
+def test_normal_form_evaluates_like_the_original() -> None:
+    rng = random.Random(0)
+    interpreter = Interpreter(step_budget=500)
+    simplifier = Simplifier()
+
+    def run(program: bvps_ast.Program, inputs: dict[str, int]) -> object:
+        try:
+            return interpreter.evaluate(program, inputs)[0]
+        except ZeroDivisionError:
+            return "error"
+
+    for program in bvps_enumerate.enumerate_programs(_spec(max_depth=2), limit=4000):
+        normal = simplifier.simplify_program(program)
+        for _ in range(3):
+            inputs = {"x": rng.randint(-3, 3), "y": rng.randint(-3, 3)}
+            assert run(normal, inputs) == run(program, inputs)
+
+
+def test_normalized_enumeration_keeps_every_normal_form() -> None:
+    spec = _spec(max_depth=1)
+    simplifier = Simplifier()
+    full = list(bvps_enumerate.enumerate_programs(spec))
+    pruned = list(bvps_enumerate.enumerate_programs(spec, normalize=True))
+    assert len(pruned) < len(full) // 2
+    pruned_forms = [simplifier.simplify(program.body) for program in pruned]
+    assert len(set(pruned_forms)) == len(pruned_forms)
+    assert {simplifier.simplify(program.body) for program in full} == set(pruned_forms)
+
+
+def test_normalized_synthesis_still_passes(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("EIDOLON_BVPS_NORMALIZE", "1")
+    result = bvps_cegis.synthesize(_spec(max_depth=3), seed=0)
+    checks = bvps_cegis.evaluate_examples(result.program, _spec(max_depth=3))
+    assert all(item["ok"] for item in checks)
+
+
+def test_enumerator_shares_the_callers_simplifier() -> None:
+    simplifier = Simplifier()
+    programs = list(
+        bvps_enumerate.enumerate_programs(
+            _spec(max_depth=2), normalize=True, simplifier=simplifier
+        )
+    )
+    memoized = len(simplifier._memo)
+    assert memoized > 0
+    # Every candidate, or all of its operands, already has a memoized normal form.
+    for program in programs:
+        simplifier.simplify(program.body)
+    assert len(simplifier._memo) == memoized
+
+
+def test_normalized_synthesis_checks_budget_on_returned_program(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("EIDOLON_BVPS_NORMALIZE", "1")
+    spec = bvps_types.spec_from_dict(
+        {
+            "name": "budget",
+            "inputs": [["x", "Int"], ["y", "Int"]],
+            "output": "Int",
+            "examples": [{"in": {"x": 1, "y": 2}, "out": 2}],
+            "bounds": {"max_depth": 2, "max_programs": 10, "step_budget": 3},
+        }
+    )
+    params = [("x", "Int"), ("y", "Int")]
+    y = Var("y")
+    # Normalizes to ``y`` but takes five steps to evaluate as written.
+    padded = BinOp("add", BinOp("add", y, IntConst(0)), IntConst(0))
+
+    def candidates(*_args: object, **_kwargs: object) -> object:
+        for body in (padded, y):
+            yield bvps_ast.Program(params=params, body=body, return_type="Int")
+
+    monkeypatch.setattr(bvps_enumerate, "enumerate_programs", candidates)
+    result = bvps_cegis.synthesize(spec, seed=0)
+    assert result.program.body is y
+    assert result.stats.candidates_tried == 2
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from eidolon_v16.artifacts import store as artifact_store
+from eidolon_v16.artifacts.store import ArtifactStore
+from eidolon_v16.capsules import runner as capsule_runner
+from eidolon_v16.capsules.runner import read_capsule_task, replay_capsules
+from eidolon_v16.config import default_config
+from eidolon_v16.orchestrator.controller import EpisodeController
+from eidolon_v16.orchestrator.types import ModeConfig
+from eidolon_v16.ucr.canonical import sha256_bytes
+from eidolon_v16.ucr.models import TaskInput
+
+
+def _make_capsules(tmp_path: Path) -> list[Path]:
+    config = default_config(root=tmp_path)
+    controller = EpisodeController(config=config)
+    capsules: list[Path] = []
+    for index, expression in enumerate(["1 + 2", "3 * 4"]):
+        task = TaskInput.from_raw(
+            {
+                "task_id": f"arith_capsule_{index}",
+                "kind": "arith",
+                "prompt": f"Compute {expression}",
+                "data": {"expression": expression},
+            }
+        )
+        result = controller.run(task=task, mode=ModeConfig(seed=0, use_gpu=False))
+        capsules.extend(sorted(result.ucr_path.parent.glob("artifacts/capsule_*.tar")))
+    return capsules
+
+
+def test_read_capsule_task_without_extraction(tmp_path: Path) -> None:
+    capsules = _make_capsules(tmp_path)
+    task = read_capsule_task(capsules[0])
+    assert task is not None
+    assert task.raw["task_id"] == "arith_capsule_0"
+
+
+def test_replay_capsules_batch_summary(tmp_path: Path) -> None:
+    capsules = _make_capsules(tmp_path)
+    config = default_config(root=tmp_path)
+    summary = replay_capsules([tmp_path / "runs"], config=config, workers=1)
+    assert summary.total == len(capsules) == 2
+    assert summary.passed == 2
+    assert all(result.replayed_action == "answer" for result in summary.results)
+
+    parallel = replay_capsules(capsules, config=config, workers=2)
+    assert parallel.workers == 2
+    assert [result.path for result in parallel.results] == [str(path) for path in capsules]
+    assert parallel.failed == 0
+
+    manifest = ArtifactStore(config.paths.artifact_store).load_manifest()
+    manifest_hashes = {entry.hash for entry in manifest.entries}
+    # Each replayed UCR is stored as an artifact by a worker process; the
+    # parent must have merged those entries into the shared manifest.
+    ucr_artifacts: dict[str, str] = {}
+    for ucr_path in tmp_path.rglob("ucr.json"):
+        data = ucr_path.read_bytes()
+        ucr_artifacts[json.loads(data)["ucr_hash"]] = sha256_bytes(data)
+    for result in parallel.results:
+        assert result.ucr_hash is not None
+        assert ucr_artifacts[result.ucr_hash] in manifest_hashes
+    assert json.dumps(parallel.to_dict())
+
+
+def test_replay_capsules_reports_broken_capsule(tmp_path: Path) -> None:
+    broken = tmp_path / "capsule_failure-broken.tar"
+    broken.write_bytes(b"not a tar")
+    summary = replay_capsules([broken], config=default_config(root=tmp_path))
+    assert summary.failed == 1
+    assert summary.results[0].error
+
+
+def test_replay_workers_write_blobs_atomically(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    written: list[str] = []
+    original = artifact_store._atomic_write_bytes
+
+    def tracked(path: Path, data: bytes) -> None:
+        written.append(path.name)
+        original(path, data)
+
+    monkeypatch.setattr(artifact_store, "_atomic_write_bytes", tracked)
+    monkeypatch.setattr(capsule_runner, "_WORKER_STATE", {})
+    capsule_runner._init_worker(default_config(root=tmp_path), ModeConfig(seed=0, use_gpu=False))
+    store: ArtifactStore = capsule_runner._WORKER_STATE["store"]
+    ref = store.put_bytes(b"payload", artifact_type="test", media_type="text/plain", producer="t")
+    assert written == [f"{ref.hash}.bin", f"{ref.hash}.meta.json"]
+    assert store.read_bytes_by_hash(ref.hash) == b"payload"
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import tarfile
+from pathlib import Path
+
+import pytest
+
+from eidolon_v16.artifacts.store import ArtifactStore
+from eidolon_v16.capsules.bundle import build_capsule
+from eidolon_v16.ucr.models import Decision, Interpretation, LaneVerdict, TaskInput
+
+
+def _build(store: ArtifactStore) -> str:
+    task = TaskInput.from_raw(
+        {"task_id": "arith_capsule", "task": "ARITH: 2 + 3", "data": {"expression": "2 + 3"}}
+    )
+    ref = build_capsule(
+        store=store,
+        episode_id="ep-capsule",
+        task=task,
+        interpretation=Interpretation(interpretation_id="arith", description="arith"),
+        solution={"solution_kind": "arith_eval", "output": 5},
+        lanes=[LaneVerdict(lane="recompute", status="PASS")],
+        decision=Decision(action="answer", rationale="All required lanes passed"),
+    )
+    assert ref.type == "capsule_success"
+    return ref.hash
+
+
+def test_capsule_tar_is_deterministic_and_hash_matches(tmp_path: Path) -> None:
+    first_store = ArtifactStore(tmp_path / "first")
+    first_hash = _build(first_store)
+    second_hash = _build(ArtifactStore(tmp_path / "second"))
+    assert first_hash == second_hash
+
+    data = first_store.read_bytes_by_hash(first_hash)
+    assert hashlib.sha256(data).hexdigest() == first_hash
+    with tarfile.open(fileobj=io.BytesIO(data)) as tar:
+        members = tar.getmembers()
+        assert [member.name for member in members] == [
+            "decision.json",
+            "interpretation.json",
+            "lanes.json",
+            "repro.txt",
+            "solution.json",
+            "task.json",
+        ]
+        assert all(member.mtime == 0 and member.uid == 0 for member in members)
+        task_file = tar.extractfile("task.json")
+        assert task_file is not None
+        assert json.loads(task_file.read())["raw"]["task_id"] == "arith_capsule"
+
+
+def test_put_bytes_rejects_a_mismatched_content_hash(tmp_path: Path) -> None:
+    store = ArtifactStore(tmp_path / "store")
+    wrong = hashlib.sha256(b"other").hexdigest()
+    with pytest.raises(ValueError, match="does not match"):
+        store.put_bytes(
+            b"payload",
+            artifact_type="test",
+            media_type="text/plain",
+            producer="test",
+            content_hash=wrong,
+        )
+    assert not store.resolve_data_path(wrong).exists()
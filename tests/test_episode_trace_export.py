@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from eidolon_v16 import tracing
+from eidolon_v16.config import default_config
+from eidolon_v16.orchestrator.controller import EpisodeController
+from eidolon_v16.orchestrator.types import ModeConfig
+from eidolon_v16.ucr.models import TaskInput
+
+
+def _run(tmp_path: Path) -> Path:
+    raw = json.loads(Path("examples/tasks/bvps_abs_01.json").read_text())
+    controller = EpisodeController(config=default_config(root=tmp_path))
+    result = controller.run(task=TaskInput.from_raw(raw), mode=ModeConfig(seed=0, use_gpu=False))
+    return result.ucr_path.parent
+
+
+def test_episode_writes_nested_chrome_trace(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("EIDOLON_KERNEL", "stub")
+    monkeypatch.setenv("EIDOLON_RUNS_DIR", str(tmp_path / "runs"))
+    monkeypatch.setenv("EIDOLON_BVPS_FASTPATH", "0")
+    monkeypatch.setenv("EIDOLON_BVPS_PERSIST", "0")
+    monkeypatch.setenv("EIDOLON_TRACE", "1")
+
+    run_dir = _run(tmp_path)
+    payload = json.loads((run_dir / "trace.json").read_text())
+    events = payload["traceEvents"]
+    by_name = {event["name"]: event for event in events}
+    assert all(event["ph"] == "X" for event in events)
+    for name in ("episode", "solve", "verify", "bvps.synthesize", "lane.recompute"):
+        assert name in by_name
+    assert "store.put_bytes" in by_name
+
+    def within(inner: dict[str, float], outer: dict[str, float]) -> bool:
+        # Timestamps are rounded to the nanosecond; allow for it at the edges.
+        return (
+            inner["ts"] >= outer["ts"] - 0.01
+            and inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"] + 0.01
+        )
+
+    assert within(by_name["solve"], by_name["episode"])
+    assert within(by_name["bvps.synthesize"], by_name["solve"])
+    assert within(by_name["lane.recompute"], by_name["verify"])
+    assert by_name["bvps.synthesize"]["args"]["candidates"] > 0
+    active = tracing.tracer()
+    assert active is not None and len(active) == 0
+
+
+def test_tracing_disabled_writes_nothing(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("EIDOLON_KERNEL", "stub")
+    monkeypatch.setenv("EIDOLON_RUNS_DIR", str(tmp_path / "runs"))
+    monkeypatch.delenv("EIDOLON_TRACE", raising=False)
+    assert tracing.tracer() is None
+    with tracing.span("unused"):
+        pass
+    assert not (_run(tmp_path) / "trace.json").exists()
+
+
+def test_scopes_filter_by_thread_and_trim_the_buffer(tmp_path: Path) -> None:
+    tracer = tracing.Tracer()
+    outer = tracer.open_scope()
+    tracer.record("before", 0.0, 1.0)
+    inner = tracer.open_scope(this_thread=True)
+    start = time.perf_counter()
+    other = threading.Thread(target=lambda: tracer.record("other", start, start + 1.0))
+    other.start()
+    other.join()
+    tracer.record("mine", start, start + 1.0)
+
+    path = tracer.write(tmp_path / "inner.json", since=inner)
+    assert [event["name"] for event in json.loads(path.read_text())["traceEvents"]] == ["mine"]
+    tracer.close_scope(inner)
+    # The outer scope still exports everything it saw.
+    assert len(tracer) == 3
+    assert {event["name"] for event in tracer.events(outer.mark)} == {"before", "other", "mine"}
+    tracer.close_scope(outer)
+    assert len(tracer) == 0
+    assert tracer.mark() == 3
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import json
+import random
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Any
+
+import pytest
+
+from eidolon_v16 import json_canon
+from eidolon_v16.json_canon import CanonicalMemo, dumps_bytes
+from eidolon_v16.ucr.canonical import sha256_canonical
+
+
+def _reference(obj: Any) -> bytes:
+    return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode(
+        "utf-8"
+    )
+
+
+class _Level(IntEnum):
+    LOW = 1
+
+
+_CASES: list[Any] = [
+    None,
+    True,
+    0,
+    -7,
+    2**63,
+    -(2**63) - 1,
+    1.5,
+    -0.0,
+    1e-05,
+    1e16,
+    1e300,
+    float("nan"),
+    float("inf"),
+    "",
+    "plain",
+    "quote\" backslash\\ tab\t nl\n ctrl\x01 del\x7f",
+    "unicode é ✓ \U0001f600  ",
+    [],
+    {},
+    [None, 1, "a", [2, [3]]],
+    {"b": 1, "a": 2, "é": 3, "\U0001f600": 4, "Z": 5, "aa": 6},
+    {"op": "add", "left": {"op": "var", "name": "x"}, "right": {"op": "const", "value": 1}},
+    {"values": (1, 2, 3), "nested": {"tuple": ("x", None)}},
+    {"level": _Level.LOW, "label": "int-enum"},
+    {2: "two", 10: "ten"},
+    {"ratio": 0.25, "count": 3, "missing": None},
+    {"text": "a:1.5 and [null] inside strings"},
+]
+
+
+def _random_payload(rng: random.Random, depth: int = 0) -> Any:
+    roll = rng.random()
+    if depth >= 4 or roll < 0.3:
+        choice = rng.randrange(6)
+        if choice == 0:
+            return rng.randint(-(2**40), 2**40)
+        if choice == 1:
+            return rng.choice(["", "x", "κλειδί", "line\nbreak", "\U0001f600"])
+        if choice == 2:
+            return rng.choice([True, False, None])
+        if choice == 3:
+            return rng.uniform(-1e6, 1e6)
+        if choice == 4:
+            return rng.randint(0, 10) / 8
+        return "s" * rng.randint(0, 5)
+    if roll < 0.6:
+        return [_random_payload(rng, depth + 1) for _ in range(rng.randint(0, 4))]
+    keys = ["a", "b", "B", "_", "é", "k1", "k10", "k2", "\U0001f600"]
+    return {
+        rng.choice(keys) + str(index): _random_payload(rng, depth + 1)
+        for index in range(rng.randint(0, 4))
+    }
+
+
+@pytest.mark.parametrize("payload", _CASES)
+def test_dumps_bytes_matches_stdlib_reference(payload: Any) -> None:
+    assert dumps_bytes(payload) == _reference(payload)
+
+
+@pytest.mark.parametrize("payload", _CASES)
+def test_orjson_fast_path_is_byte_identical_or_declines(payload: Any) -> None:
+    pytest.importorskip("orjson")
+    if json_canon._orjson is None:
+        pytest.skip("orjson disabled via EIDOLON_JSON_BACKEND")
+    encoded = json_canon._dumps_bytes_orjson(payload)
+    if encoded is not None:
+        assert encoded == _reference(payload)
+
+
+def test_dumps_bytes_randomized_differential() -> None:
+    rng = random.Random(1601)
+    for _ in range(500):
+        payload = _random_payload(rng)
+        assert dumps_bytes(payload) == _reference(payload)
+
+
+def test_dumps_bytes_rejects_what_stdlib_rejects() -> None:
+    @dataclass
+    class Point:
+        x: int
+
+    with pytest.raises(TypeError):
+        dumps_bytes({"point": Point(1)})
+    with pytest.raises(TypeError):
+        dumps_bytes({"a": object()})
+
+
+def test_canonical_memo_reuses_encoding_by_identity() -> None:
+    memo = CanonicalMemo(max_entries=2)
+    program = {"body": {"op": "var", "name": "x"}, "params": ["x"]}
+    first = memo.dumps_bytes(program)
+    assert memo.dumps_bytes(program) is first
+    assert memo.sha256(program) == sha256_canonical(program)
+    assert memo.hits == 2
+    assert memo.misses == 1
+
+    equal_copy = dict(program)
+    assert memo.sha256(equal_copy) == sha256_canonical(program)
+    assert memo.misses == 2
+
+    memo.dumps_bytes({"other": 1})
+    assert len(memo) == 2
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from eidolon_v16.artifacts.store import ArtifactStore
+from eidolon_v16.config import default_config
+from eidolon_v16.kernel.base import (
+    propose_interpretations_batch,
+    propose_solution_batch,
+    supports_batch,
+)
+from eidolon_v16.kernel.http import HttpConnectionPool, HttpKernel
+from eidolon_v16.kernel.stub import StubKernel
+from eidolon_v16.orchestrator.controller import EpisodeController
+from eidolon_v16.orchestrator.types import ModeConfig
+from eidolon_v16.ucr.models import TaskInput
+
+
+class _SlowKernel(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    delay_s = 0.2
+    in_flight = 0
+    max_in_flight = 0
+    lock = threading.Lock()
+
+    def do_POST(self) -> None:  # noqa: N802
+        length = int(self.headers.get("Content-Length", "0"))
+        payload = json.loads(self.rfile.read(length))
+        with self.lock:
+            type(self).in_flight += 1
+            type(self).max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay_s)
+        with self.lock:
+            type(self).in_flight -= 1
+        task_id = payload["task"]["normalized"]["task_id"]
+        if self.path.strip("/") == "propose_interpretations":
+            body: dict[str, Any] = {
+                "interpretations": [
+                    {"interpretation_id": f"http-{task_id}", "description": "literal"}
+                ]
+            }
+        else:
+            body = {"solution_kind": "arith_result", "output": f"{task_id}:{payload['seed']}"}
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        return
+
+
+@pytest.fixture()
+def kernel_url() -> Iterator[str]:
+    _SlowKernel.in_flight = 0
+    _SlowKernel.max_in_flight = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _SlowKernel)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _tasks(count: int) -> list[TaskInput]:
+    return [
+        TaskInput.from_raw({"task_id": f"t{index}", "kind": "arith", "prompt": "ARITH: 1 + 1"})
+        for index in range(count)
+    ]
+
+
+def test_batch_helpers_fall_back_to_sequential_calls() -> None:
+    kernel = StubKernel()
+    tasks = _tasks(3)
+    assert not supports_batch(kernel)
+    batched = asyncio.run(propose_interpretations_batch(kernel, tasks, seeds=[0, 1, 2]))
+    expected = [kernel.propose_interpretations(task, seed=seed) for seed, task in enumerate(tasks)]
+    assert batched == expected
+    requests = [(task, items[0]) for task, items in zip(tasks, batched, strict=True)]
+    solutions = asyncio.run(propose_solution_batch(kernel, requests, seeds=[0, 1, 2]))
+    assert len(solutions) == 3
+
+
+def test_batch_helpers_reject_mismatched_seeds() -> None:
+    with pytest.raises(ValueError):
+        asyncio.run(propose_interpretations_batch(StubKernel(), _tasks(2), seeds=[0]))
+
+
+def test_http_kernel_batch_overlaps_requests_and_keeps_order(
+    kernel_url: str, tmp_path: Path
+) -> None:
+    kernel = HttpKernel(
+        kernel_url,
+        ArtifactStore(tmp_path / "store"),
+        pool=HttpConnectionPool(),
+        max_concurrency=4,
+    )
+    assert supports_batch(kernel)
+    tasks = _tasks(4)
+    start = time.perf_counter()
+    batched = asyncio.run(propose_interpretations_batch(kernel, tasks, seeds=[7] * 4))
+    elapsed = time.perf_counter() - start
+    assert [items[0].interpretation_id for items in batched] == [
+        "http-t0",
+        "http-t1",
+        "http-t2",
+        "http-t3",
+    ]
+    assert _SlowKernel.max_in_flight > 1
+    assert elapsed < 4 * _SlowKernel.delay_s
+
+    requests = [(task, items[0]) for task, items in zip(tasks, batched, strict=True)]
+    solutions = asyncio.run(propose_solution_batch(kernel, requests, seeds=[1, 2, 3, 4]))
+    assert [solution.output for solution in solutions] == ["t0:1", "t1:2", "t2:3", "t3:4"]
+
+
+def test_run_many_prefetches_interpretations_in_one_batch(
+    kernel_url: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("EIDOLON_KERNEL", "http")
+    monkeypatch.setenv("EIDOLON_KERNEL_URL", kernel_url)
+    config = default_config(root=tmp_path)
+    controller = EpisodeController(config=config)
+    store = ArtifactStore(config.paths.artifact_store)
+    results = controller.run_many(_tasks(3), ModeConfig(seed=0), store=store)
+    assert len(results) == 3
+    for result in results:
+        ucr = json.loads(result.ucr_path.read_text())
+        assert "batch_size" not in ucr["kernel"]
+        assert ucr["costs"]["kernel_batch"]["size"] == 3
+        # Each episode is charged its share of the batched kernel wall time.
+        share_ms = ucr["costs"]["kernel_batch"]["interpret_ms"]
+        assert share_ms >= int(_SlowKernel.delay_s * 1000) // 3 // 2
+        assert ucr["costs"]["phase_ms"]["interpret"] >= share_ms
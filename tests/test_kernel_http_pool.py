@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import json
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from eidolon_v16.artifacts.store import ArtifactStore
+from eidolon_v16.config import default_config
+from eidolon_v16.kernel.http import (
+    HttpConnectionPool,
+    HttpKernel,
+    KernelHttpError,
+    KernelReplayMissError,
+    RetryPolicy,
+)
+from eidolon_v16.kernel.pool import KernelPool
+from eidolon_v16.orchestrator.controller import EpisodeController
+from eidolon_v16.orchestrator.types import ModeConfig
+from eidolon_v16.ucr.models import TaskInput
+
+
+class _StandInKernel(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    peers: set[tuple[str, int]] = set()
+    failures: dict[str, int] = {}
+
+    def do_POST(self) -> None:  # noqa: N802
+        length = int(self.headers.get("Content-Length", "0"))
+        payload = json.loads(self.rfile.read(length))
+        self.peers.add(self.client_address)
+        method = self.path.strip("/")
+        remaining = self.failures.get(method, 0)
+        if remaining:
+            self.failures[method] = remaining - 1
+            self._reply(503, {"error": "busy"})
+            return
+        if method == "propose_interpretations":
+            body: dict[str, Any] = {
+                "interpretations": [
+                    {"interpretation_id": "http-literal", "description": "literal"}
+                ]
+            }
+        elif method == "propose_solution":
+            body = {"solution_kind": "arith_result", "output": payload["seed"]}
+        elif method == "critique":
+            body = {"critique": "ok"}
+        else:
+            self._reply(404, {"error": "unknown"})
+            return
+        self._reply(200, body)
+
+    def _reply(self, status: int, body: dict[str, Any]) -> None:
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        return
+
+
+@pytest.fixture()
+def kernel_url() -> Iterator[str]:
+    _StandInKernel.peers = set()
+    _StandInKernel.failures = {}
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StandInKernel)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _task() -> TaskInput:
+    return TaskInput.from_raw({"task_id": "http", "kind": "arith", "prompt": "ARITH: 1 + 1"})
+
+
+def test_http_kernel_reuses_keepalive_connection(kernel_url: str, tmp_path: Path) -> None:
+    pool = HttpConnectionPool()
+    kernel = HttpKernel(kernel_url, ArtifactStore(tmp_path / "store"), pool=pool)
+    task = _task()
+    for seed in range(3):
+        interpretations = kernel.propose_interpretations(task, seed=seed)
+        solution = kernel.propose_solution(task, interpretations[0], seed=seed)
+        assert solution.output == seed
+        assert kernel.critique(task, solution, seed=seed) == "ok"
+    assert pool.connections_opened == 1
+    assert len(_StandInKernel.peers) == 1
+    pool.close()
+
+
+def test_http_kernel_retries_transient_status(kernel_url: str, tmp_path: Path) -> None:
+    _StandInKernel.failures = {"propose_interpretations": 2}
+    store = ArtifactStore(tmp_path / "store")
+    kernel = HttpKernel(
+        kernel_url,
+        store,
+        pool=HttpConnectionPool(),
+        retry=RetryPolicy(max_attempts=3, backoff_s=0.0),
+    )
+    interpretations = kernel.propose_interpretations(_task(), seed=0)
+    assert interpretations[0].interpretation_id == "http-literal"
+    records = [
+        store.read_json_by_hash(entry.hash)
+        for entry in store.load_manifest().entries
+        if entry.type == "kernel_call"
+    ]
+    assert [record.get("attempts") for record in records] == [3]
+
+
+def test_http_kernel_gives_up_after_retry_budget(kernel_url: str, tmp_path: Path) -> None:
+    _StandInKernel.failures = {"critique": 5}
+    kernel = HttpKernel(
+        kernel_url,
+        ArtifactStore(tmp_path / "store"),
+        pool=HttpConnectionPool(),
+        retry=RetryPolicy(max_attempts=2, backoff_s=0.0),
+    )
+    task = _task()
+    solution = kernel.propose_solution(
+        task, kernel.propose_interpretations(task, seed=0)[0], seed=0
+    )
+    with pytest.raises(KernelHttpError) as excinfo:
+        kernel.critique(task, solution, seed=0)
+    assert excinfo.value.status == 503
+    assert _StandInKernel.failures["critique"] == 3
+
+
+def test_http_kernel_cache_serves_reruns_and_replay_fails_on_miss(
+    kernel_url: str, tmp_path: Path
+) -> None:
+    store = ArtifactStore(tmp_path / "store")
+    recorder = HttpKernel(kernel_url, store, pool=HttpConnectionPool(), cache_mode="on")
+    first = recorder.propose_interpretations(_task(), seed=3)
+
+    pool = HttpConnectionPool()
+    replayer = HttpKernel(kernel_url, store, pool=pool, cache_mode="replay")
+    assert replayer.propose_interpretations(_task(), seed=3) == first
+    with pytest.raises(KernelReplayMissError):
+        replayer.propose_interpretations(_task(), seed=4)
+    assert pool.connections_opened == 0
+
+
+def test_pooled_http_kernel_records_into_each_episodes_store(
+    kernel_url: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("EIDOLON_KERNEL", "http")
+    monkeypatch.setenv("EIDOLON_KERNEL_URL", kernel_url)
+    monkeypatch.setenv("EIDOLON_RUNS_DIR", str(tmp_path / "runs"))
+    # Persisted BVPS payloads live in their own index, not the manifest.
+    monkeypatch.setenv("EIDOLON_BVPS_PERSIST", "0")
+    config = default_config(root=tmp_path)
+    pool = KernelPool()
+    mode = ModeConfig(seed=0, use_gpu=False)
+    prompts = ("ARITH: 1 + 1", "ARITH: 2 + 3", "ARITH: 4 + 5")
+    for prompt in prompts:
+        # Each run builds a fresh ArtifactStore over the same root; a kernel
+        # still writing through the first one would drop the others' entries.
+        task = TaskInput.from_raw({"task_id": prompt, "kind": "arith", "prompt": prompt})
+        EpisodeController(config, kernel_pool=pool).run(task=task, mode=mode)
+
+    store = ArtifactStore(config.paths.artifact_store)
+    listed = {entry.hash for entry in store.load_manifest().entries}
+    blobs = {path.stem for path in (store.root / "sha256").rglob("*.bin")}
+    assert blobs and blobs <= listed
+    calls = [entry for entry in store.load_manifest().entries if entry.type == "kernel_call"]
+    assert len(calls) >= len(prompts)
@@ -6,6 +6,7 @@ import pytest
 
 from eidolon_v16.artifacts.store import ArtifactStore
 from eidolon_v16.config import default_config
+from eidolon_v16.kernel.pool import KernelPool
 from eidolon_v16.kernel.stub import StubKernel
 from eidolon_v16.kernels import resolve_kernel_name
 from eidolon_v16.kernels.llamacpp_kernel import from_env
@@ -72,3 +73,32 @@ def test_select_kernel_unknown_value(
     store = ArtifactStore(config.paths.artifact_store)
     kernel = controller._select_kernel(store)
     assert isinstance(kernel, StubKernel)
+
+
+def test_select_kernel_reuses_pooled_kernel(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setenv("EIDOLON_KERNEL", "llamacpp")
+    monkeypatch.setenv("EIDOLON_GGUF", str(tmp_path / "model.gguf"))
+    loads: list[object] = []
+
+    def fake_llamacpp_from_env() -> object:
+        loads.append(object())
+        return loads[-1]
+
+    monkeypatch.setattr(controller_module, "llamacpp_from_env", fake_llamacpp_from_env)
+
+    config = default_config(tmp_path)
+    pool = KernelPool()
+    store = ArtifactStore(config.paths.artifact_store)
+    first = EpisodeController(config, kernel_pool=pool)._select_kernel(store)
+    second = EpisodeController(config, kernel_pool=pool)._select_kernel(store)
+    assert first is second
+    assert len(loads) == 1
+    assert pool.loads == 1
+    assert pool.hits == 1
+
+    monkeypatch.setenv("EIDOLON_N_CTX", "4096")
+    third = EpisodeController(config, kernel_pool=pool)._select_kernel(store)
+    assert third is not first
+    assert len(loads) == 2
@@ -1,7 +1,14 @@
-from eidolon_v16.bvps.ast import MacroCall, Program, Var
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from eidolon_v16.bvps.ast import BinOp, ExprInterner, IntConst, MacroCall, Program, Var
 from eidolon_v16.bvps.interp import Interpreter
+from eidolon_v16.language import apply as language_apply
 from eidolon_v16.language.apply import (
+    compile_macros,
     expand_program,
+    macros_hash,
     program_hash,
     program_pretty,
 )
@@ -46,3 +53,92 @@ def test_macro_expansion_deterministic_hashes() -> None:
     assert program_pretty(expanded_a) == "(x add 1)"
     assert program_hash(expanded_a) == program_hash(expanded_b)
     assert program_hash(program) != program_hash(expanded_a)
+
+
+def test_compiled_macros_cached_and_subtrees_shared() -> None:
+    macros = {"incr": _sample_macro_template()}
+    compiled = compile_macros(macros)
+    assert compile_macros({"incr": _sample_macro_template()}) is compiled
+    assert compiled.macros_hash == macros_hash(macros)
+
+    plain = Program(
+        params=[("x", "Int")],
+        body=BinOp(op="add", left=Var("x"), right=IntConst(2)),
+        return_type="Int",
+    )
+    assert expand_program(plain, compiled) is plain
+    assert expand_program(plain, {}) is plain
+
+    call = MacroCall(name="incr", args=(Var("x"),))
+    shared_right = BinOp(op="mul", left=Var("x"), right=IntConst(3))
+    mixed = Program(
+        params=[("x", "Int")],
+        body=BinOp(op="add", left=call, right=shared_right),
+        return_type="Int",
+    )
+    expanded = expand_program(mixed, compiled)
+    assert expanded.body.right is shared_right
+    again = expand_program(_build_macro_program(), compiled)
+    assert expanded.body.left is again.body
+    value, _trace = Interpreter(step_budget=100).evaluate(expanded, {"x": 5})
+    assert value == 21
+
+
+def test_expand_program_rejects_unknown_macro() -> None:
+    with pytest.raises(ValueError, match="unknown macro incr"):
+        expand_program(_build_macro_program(), {})
+
+
+def test_interned_body_without_macros_skips_the_walk(monkeypatch: pytest.MonkeyPatch) -> None:
+    interner = ExprInterner()
+    call = interner.macro_call("incr", (interner.var("x"),))
+    plain_body = interner.binop("add", interner.var("x"), interner.int_const(2))
+    mixed_body = interner.binop("add", call, plain_body)
+    assert [body._meta.has_macro for body in (call, plain_body, mixed_body) if body._meta] == [
+        True,
+        False,
+        True,
+    ]
+
+    def walked(*_args: object) -> None:
+        raise AssertionError("macro-free interned body was walked")
+
+    plain = Program(params=[("x", "Int")], body=plain_body, return_type="Int")
+    with monkeypatch.context() as patch:
+        patch.setattr(language_apply, "_expand_expr", walked)
+        assert expand_program(plain, {"incr": _sample_macro_template()}) is plain
+    with pytest.raises(ValueError, match="unknown macro incr"):
+        expand_program(Program(params=[("x", "Int")], body=call, return_type="Int"), {})
+
+
+def test_macro_caches_are_shared_safely_across_threads(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # A tiny memo forces clears while other threads read and insert.
+    monkeypatch.setattr(language_apply, "_CALL_MEMO_SIZE", 4)
+    template = MacroTemplate(
+        params=["x"],
+        body={
+            "type": "binop",
+            "op": "mul",
+            "left": {"type": "var", "name": "x"},
+            "right": {"type": "int_const", "value": 3},
+        },
+    )
+
+    def expand(offset: int) -> tuple[int, object]:
+        compiled = compile_macros({"triple": template})
+        total = 0
+        for value in range(offset, offset + 50):
+            call = MacroCall(name="triple", args=(IntConst(value),))
+            program = Program(params=[], body=call, return_type="Int")
+            result, _trace = Interpreter(step_budget=100).evaluate(
+                expand_program(program, compiled), {}
+            )
+            total += int(result) - 3 * value
+        return total, compiled
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(expand, range(0, 800, 50)))
+    assert all(total == 0 for total, _compiled in results)
+    assert len({id(compiled) for _total, compiled in results}) == 1
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from eidolon_v16.bvps import synth
+from eidolon_v16.bvps.dsl import (
+    Assign,
+    BinOp,
+    ConstInt,
+    ConstList,
+    Let,
+    ListAppend,
+    Program,
+    Return,
+    Var,
+    While,
+)
+from eidolon_v16.bvps.interpreter import Interpreter, compile_program
+
+
+def _templates() -> list[Program]:
+    return [
+        synth._program_sum(),
+        synth._program_max(),
+        synth._program_reverse(),
+        synth._program_is_sorted(),
+    ]
+
+
+def test_compiled_run_matches_traced_run() -> None:
+    rng = random.Random(3)
+    interpreter = Interpreter(step_limit=2000)
+    for program in _templates():
+        for _ in range(30):
+            sample = [rng.randint(-3, 6) for _ in range(rng.randint(0, 6))]
+            traced, traced_info = interpreter.run(program, [list(sample)])
+            compiled, compiled_info = interpreter.run(program, [list(sample)], trace=False)
+            assert compiled == traced
+            assert compiled_info["steps"] == traced_info["steps"]
+            assert compiled_info["events"] == []
+            assert traced_info["events"]
+
+
+def test_compiled_run_keeps_step_limit() -> None:
+    interpreter = Interpreter(step_limit=10)
+    with pytest.raises(RuntimeError, match="step limit exceeded"):
+        interpreter.run(synth._program_sum(), [[1, 2, 3, 4, 5]])
+    with pytest.raises(RuntimeError, match="step limit exceeded"):
+        interpreter.run(synth._program_sum(), [[1, 2, 3, 4, 5]], trace=False)
+
+
+def test_in_place_append_never_touches_aliases() -> None:
+    xs = [4, 5]
+    aliased = Program(
+        params=["xs"],
+        return_type="list_int",
+        body=[
+            Let("acc", Var("xs")),
+            Assign("acc", ListAppend(Var("acc"), ConstInt(9))),
+            Return(Var("acc")),
+        ],
+    )
+    output, _info = Interpreter().run(aliased, [xs], trace=False)
+    assert output == [4, 5, 9]
+    assert xs == [4, 5]
+
+    copied = Program(
+        params=["xs"],
+        return_type="list_int",
+        body=[
+            Let("acc", ConstList([])),
+            Let("i", ConstInt(0)),
+            Let("snapshot", Var("acc")),
+            While(
+                cond=BinOp("lt", Var("i"), ConstInt(3)),
+                max_steps=10,
+                body=[
+                    Assign("acc", ListAppend(Var("acc"), Var("i"))),
+                    Assign("i", BinOp("add", Var("i"), ConstInt(1))),
+                ],
+            ),
+            Return(Var("snapshot")),
+        ],
+    )
+    output, _info = Interpreter().run(copied, [xs], trace=False)
+    assert output == []
+
+    reverse = compile_program(synth._program_reverse())
+    first, _steps = reverse.run([[1, 2, 3]], 2000)
+    second, _steps = reverse.run([[7]], 2000)
+    assert first == [3, 2, 1]
+    assert second == [7]
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import random
+from typing import Any
+
+import pytest
+
+from eidolon_v16.bvps.interpreter import Interpreter
+from eidolon_v16.bvps.list_synth import ListSynthBudget, synthesize_list_program
+from eidolon_v16.bvps.synth import spec_function, synthesize_program
+from eidolon_v16.ucr.models import TaskInput
+
+
+def _list_task(operation: str, **data: Any) -> TaskInput:
+    return TaskInput.from_raw(
+        {
+            "task_id": f"list-{operation}",
+            "kind": "list",
+            "prompt": f"LIST: {operation}",
+            "data": {"operation": operation, "input": [4, -2, 7, 0], **data},
+        }
+    )
+
+
+@pytest.mark.parametrize("operation", ["min", "length", "count_positive", "filter_positive"])
+def test_search_solves_operations_without_templates(operation: str) -> None:
+    result = synthesize_program(_list_task(operation), seed=0)
+    spec = spec_function(operation)
+    interpreter = Interpreter(step_limit=2000)
+    rng = random.Random(7)
+    for _ in range(100):
+        sample = [rng.randint(-3, 6) for _ in range(rng.randint(0, 5))]
+        output, _trace = interpreter.run(result.program, [sample])
+        assert output == spec(sample)
+    again = synthesize_program(_list_task(operation), seed=0)
+    assert again.program == result.program
+
+
+def test_search_uses_examples_when_operation_unknown() -> None:
+    examples = [
+        {"input": [1, 2, 3], "output": [2, 3, 4]},
+        {"input": [], "output": []},
+        {"input": [-1, 5], "output": [0, 6]},
+    ]
+    result = synthesize_program(_list_task("increment_all", examples=examples), seed=0)
+    output, _trace = Interpreter().run(result.program, [[10, 0, -4]])
+    assert output == [11, 1, -3]
+
+
+def test_search_gives_up_within_budget() -> None:
+    # Sorting needs nested loops, which no sketch provides.
+    examples = [
+        {"input": [5, 9, 7], "output": [5, 7, 9]},
+        {"input": [4, 1], "output": [1, 4]},
+        {"input": [8, 2, 3], "output": [2, 3, 8]},
+    ]
+    budget = ListSynthBudget(max_candidates=3000)
+    assert synthesize_list_program(examples, budget=budget) is None
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from eidolon_v16.kernels import llamacpp_kernel
+from eidolon_v16.kernels.llamacpp_kernel import LlamaCppConfig, LlamaCppKernel
+from eidolon_v16.ucr.models import TaskInput
+
+
+class _FakeLlama:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.seeds: list[int | None] = []
+
+    def create_chat_completion(self, **kwargs: Any) -> dict[str, Any]:
+        self.calls += 1
+        self.seeds.append(kwargs.get("seed"))
+        body = {"interpretations": [{"interpretation_id": "fake", "description": "literal"}]}
+        return {"choices": [{"message": {"content": json.dumps(body)}}]}
+
+
+def _kernel(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, *, temperature: float = 0.0
+) -> tuple[LlamaCppKernel, _FakeLlama]:
+    fake = _FakeLlama()
+    monkeypatch.setattr(
+        llamacpp_kernel, "_load_llama", lambda config: (fake, config.n_gpu_layers)
+    )
+    gguf = tmp_path / "model.gguf"
+    gguf.write_bytes(b"GGUF" + b"\0" * 64)
+    config = LlamaCppConfig(
+        gguf_path=str(gguf),
+        n_ctx=512,
+        n_gpu_layers=0,
+        n_threads=1,
+        n_batch=8,
+        temperature=temperature,
+        chat_format=None,
+    )
+    return LlamaCppKernel(config), fake
+
+
+def _task() -> TaskInput:
+    return TaskInput.from_raw({"task_id": "llama", "kind": "arith", "prompt": "ARITH: 1 + 1"})
+
+
+def test_response_cache_serves_reruns_from_disk(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.delenv("EIDOLON_LLAMA_CACHE", raising=False)
+    monkeypatch.setenv("EIDOLON_LLAMA_CACHE_DIR", str(tmp_path / "cache"))
+    kernel, fake = _kernel(monkeypatch, tmp_path)
+    first = kernel.propose_interpretations(_task(), seed=0)
+    assert fake.calls == 1
+
+    rerun, rerun_fake = _kernel(monkeypatch, tmp_path)
+    assert rerun.propose_interpretations(_task(), seed=0) == first
+    assert rerun_fake.calls == 0
+
+    rerun.propose_interpretations(_task(), seed=1)
+    assert rerun_fake.calls == 1
+    # The seed in the cache key is the one llama.cpp sampled with.
+    assert fake.seeds == [0]
+    assert rerun_fake.seeds == [1]
+
+
+def test_response_cache_off_for_sampling_unless_requested(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.delenv("EIDOLON_LLAMA_CACHE", raising=False)
+    monkeypatch.setenv("EIDOLON_LLAMA_CACHE_DIR", str(tmp_path / "cache"))
+    kernel, fake = _kernel(monkeypatch, tmp_path, temperature=0.7)
+    kernel.propose_interpretations(_task(), seed=0)
+    kernel.propose_interpretations(_task(), seed=0)
+    assert fake.calls == 2
+
+    monkeypatch.setenv("EIDOLON_LLAMA_CACHE", "1")
+    kernel, fake = _kernel(monkeypatch, tmp_path, temperature=0.7)
+    kernel.propose_interpretations(_task(), seed=0)
+    kernel.propose_interpretations(_task(), seed=0)
+    assert fake.calls == 1
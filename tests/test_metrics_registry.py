@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from eidolon_v16 import metrics
+from eidolon_v16.artifacts.store import ArtifactStore
+from eidolon_v16.config import default_config
+from eidolon_v16.metrics import MetricsRegistry
+from eidolon_v16.orchestrator.controller import EpisodeController
+from eidolon_v16.orchestrator.types import ModeConfig
+from eidolon_v16.ucr.models import TaskInput
+
+
+def test_registry_records_and_exports_deltas() -> None:
+    registry = MetricsRegistry()
+    registry.incr("hits")
+    registry.record_ns("step", 2_500)
+    start = registry.snapshot()
+
+    registry.incr("hits", 2)
+    with registry.timer("step"):
+        pass
+    for value in (1, 3, 100):
+        registry.observe("size", value)
+
+    @registry.timed("call")
+    def call() -> int:
+        return 7
+
+    assert call() == 7
+    exported = registry.export(registry.delta(start))
+    assert exported["counters"] == {"hits": 2}
+    assert exported["timers_us"]["step"]["count"] == 1
+    assert exported["timers_us"]["call"]["count"] == 1
+    assert exported["histograms"]["size"] == {
+        "count": 3,
+        "sum": 104,
+        "p50": 3,
+        "p90": 100,
+        "max": 100,
+    }
+    assert registry.timer_stat("step").count == 2
+
+
+def test_disabled_registry_is_a_no_op() -> None:
+    registry = MetricsRegistry(enabled=False)
+    registry.incr("hits")
+    registry.observe("size", 4)
+    with registry.timer("step"):
+        pass
+    assert registry.timer("step") is registry.timer("other")
+    assert registry.export() == {"counters": {}, "timers_us": {}, "histograms": {}}
+
+
+def test_episode_costs_export_probes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("EIDOLON_KERNEL", "stub")
+    monkeypatch.setenv("EIDOLON_RUNS_DIR", str(tmp_path / "runs"))
+    monkeypatch.setenv("EIDOLON_BVPS_FASTPATH", "0")
+    controller = EpisodeController(config=default_config(root=tmp_path))
+    raw = json.loads(Path("examples/tasks/bvps_abs_01.json").read_text())
+    task = TaskInput.from_raw(raw)
+    mode = ModeConfig(seed=0, use_gpu=False)
+
+    monkeypatch.setenv("EIDOLON_METRICS", "0")
+    off = json.loads(controller.run(task=task, mode=mode).ucr_path.read_text())
+    assert "metrics" not in off["costs"]
+
+    monkeypatch.setenv("EIDOLON_METRICS", "1")
+    on = json.loads(controller.run(task=task, mode=mode).ucr_path.read_text())
+    probes = on["costs"]["metrics"]
+    assert probes["counters"]["bvps.cache.mem"] == 1
+    assert {"verify.recompute", "verify.translation"} <= set(probes["timers_us"])
+    assert metrics.registry().enabled
+
+
+def test_store_timers_record_ns_and_report_ms(tmp_path: Path) -> None:
+    store = ArtifactStore(tmp_path / "store")
+    store.put_json({"value": 1}, artifact_type="probe", producer="test")
+    # Timers are named for what they time; only the reports carry units.
+    assert store._metrics.timer_stat("blob_write").count == 1
+    assert store._metrics.timer_stat("manifest.write").count == 1
+    assert store._metrics.timer_stat("blob_write_ms").count == 0
+    assert set(store.store_costs_snapshot()) == {"hash_ms", "blob_write_ms", "manifest_ms"}
+    assert set(store.manifest_detail_snapshot()) == {
+        "prepare_ms",
+        "hash_ms",
+        "serialize_ms",
+        "write_ms",
+        "fsync_ms",
+        "misc_ms",
+    }
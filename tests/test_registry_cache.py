@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from eidolon_v16.language.registry import LanguageRegistry
+from eidolon_v16.language.spec import MacroTemplate, PatchSpec
+from eidolon_v16.orchestrator.registry_cache import RegistryCache
+from eidolon_v16.skills.bundle import SkillBundle, bundle_identity
+from eidolon_v16.skills.registry import register_skill
+from eidolon_v16.skills.spec import SkillImpl, SkillSpec, TriggerSpec
+from eidolon_v16.skills.store import save_bundle
+
+
+def _macro(value: int) -> MacroTemplate:
+    return MacroTemplate(
+        params=["x"],
+        body={
+            "type": "binop",
+            "op": "add",
+            "left": {"type": "var", "name": "x"},
+            "right": {"type": "int_const", "value": value},
+        },
+    )
+
+
+def _patch(name: str, scope: str, value: int) -> PatchSpec:
+    return PatchSpec(
+        name=name,
+        version="1.0",
+        created_ts_utc="2024-01-01T00:00:00Z",
+        scope=scope,
+        macros={"bump": _macro(value)},
+    )
+
+
+def _skill_spec() -> SkillSpec:
+    return SkillSpec(
+        name="x_plus_one",
+        version="v0",
+        created_ts_utc="2024-01-01T00:00:00Z",
+        origin_episode_id="ep-1",
+        triggers=TriggerSpec(task_contains=["x_plus_one"], task_family="bvps"),
+        io_schema={"inputs": [{"name": "x", "type": "Int"}], "output": "Int"},
+        preconditions={},
+        verifier_profile={"lanes": ["translation"], "require_all": True},
+        cost_profile={"cpu_ms": 0, "steps": 10},
+        impl=SkillImpl(kind="bvps_ast", program={"type": "var", "name": "x"}),
+        artifacts=[],
+    )
+
+
+def test_scope_macros_indexed_and_revalidated(tmp_path: Path) -> None:
+    registry_path = tmp_path / "language" / "registry.json"
+    registry = LanguageRegistry()
+    registry.register(_patch("first", "inc", 1), tmp_path / "a")
+    registry.register(_patch("other", "dec", -1), tmp_path / "b")
+    registry.register(_patch("second", "inc", 2), tmp_path / "c")
+    registry.save(registry_path)
+
+    cache = RegistryCache()
+    scoped = cache.scope_macros(registry_path, "inc")
+    assert scoped.macros["bump"].body["right"]["value"] == 2
+    assert [patch["name"] for patch in scoped.patches] == ["first", "second"]
+    assert cache.scope_macros(registry_path, "missing").macros == {}
+    assert cache.stats.registry_loads == 1
+    assert cache.stats.registry_hits == 1
+
+    registry.patches = registry.patches[:2]
+    registry.save(registry_path)
+    assert cache.scope_macros(registry_path, "inc").macros["bump"].body["right"]["value"] == 1
+    assert cache.stats.registry_loads == 2
+
+
+def test_bundle_identity_cached_until_files_change(tmp_path: Path) -> None:
+    spec = _skill_spec()
+    bundle = SkillBundle(
+        spec=spec,
+        program={"type": "var", "name": "x"},
+        tests={"cases": []},
+        verify_profile={"lanes": ["translation"]},
+        artifact_refs=[],
+        bundle_name=spec.name,
+    )
+    bundle_dir = save_bundle(bundle, tmp_path / "skills")
+    registry_path = tmp_path / "skills" / "registry.json"
+    register_skill(registry_path, spec, bundle_dir)
+
+    cache = RegistryCache()
+    assert cache.skill_registry(registry_path) is cache.skill_registry(registry_path)
+    first = cache.bundle(bundle_dir)
+    assert cache.bundle(bundle_dir) is first
+    assert first.identity == bundle_identity(first.bundle)
+    assert cache.stats.bundle_loads == 1
+
+    bundle.tests = {"cases": [{"inputs": {"x": 1}, "output": 1}]}
+    save_bundle(bundle, tmp_path / "skills")
+    refreshed = cache.bundle(bundle_dir)
+    assert refreshed is not first
+    assert refreshed.identity["bundle_hash"] != first.identity["bundle_hash"]
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from eidolon_v16.artifacts.store import ArtifactStore
+from eidolon_v16.bvps import ast as bvps_ast
+from eidolon_v16.skills import admission
+from eidolon_v16.skills.admission import AdmissionCache, admit_skill
+from eidolon_v16.skills.bundle import SkillBundle
+from eidolon_v16.skills.spec import SkillImpl, SkillSpec, TriggerSpec
+
+
+def _bundle(expected: int, *, episode_id: str) -> SkillBundle:
+    program = bvps_ast.Program(
+        params=[("x", "Int")],
+        body=bvps_ast.BinOp("add", bvps_ast.Var("x"), bvps_ast.IntConst(1)),
+        return_type="Int",
+    )
+    spec = SkillSpec(
+        name="x_plus_one",
+        version="v0",
+        created_ts_utc=f"2024-01-01T00:00:0{len(episode_id) % 10}Z",
+        origin_episode_id=episode_id,
+        triggers=TriggerSpec(task_contains=["x_plus_one"], task_family="bvps"),
+        io_schema={"inputs": [{"name": "x", "type": "Int"}], "output": "Int"},
+        preconditions={"bounds": {"int_range": {"min": -2, "max": 2}, "step_budget": 50}},
+        verifier_profile={"lanes": ["translation"], "require_all": True},
+        impl=SkillImpl(kind="bvps_ast", program=program.to_dict(), dsl_version="bvps/v1"),
+    )
+    return SkillBundle(
+        spec=spec,
+        program=program.to_dict(),
+        tests={"fuzz_seed": 0, "fuzz_trials": 1, "cases": [{"in": {"x": 1}, "out": expected}]},
+        verify_profile={"lanes": ["translation"], "require_all": True},
+        artifact_refs=[],
+        bundle_name=spec.name,
+    )
+
+
+@pytest.mark.parametrize("expected", [2, 5])
+def test_admission_cache_reuses_verdicts_across_episodes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, expected: int
+) -> None:
+    cache = AdmissionCache(tmp_path / "admission_cache")
+    store = ArtifactStore(tmp_path / "store")
+    first = admit_skill(
+        bundle=_bundle(expected, episode_id="ep-1"), store=store, seed=0, cache=cache
+    )
+    assert first.cached is False
+
+    def _fail(*args: object, **kwargs: object) -> dict[str, object]:
+        raise AssertionError("gate re-ran despite cached verdict")
+
+    monkeypatch.setattr(admission, "run_regression_gate", _fail)
+    monkeypatch.setattr(admission, "run_sealed_lite_gate", _fail)
+    second = admit_skill(
+        bundle=_bundle(expected, episode_id="ep-22"), store=store, seed=0, cache=cache
+    )
+    assert second.cached is True
+    assert second.admitted is first.admitted
+    assert second.admitted is (expected == 2)
+    assert first.evidence_ref is not None and second.evidence_ref is not None
+    first_payload = store.read_json_by_hash(first.evidence_ref.hash)
+    second_payload = store.read_json_by_hash(second.evidence_ref.hash)
+    assert second_payload["regression"] == first_payload["regression"]
+    assert second_payload["sealed_lite"] == first_payload["sealed_lite"]
+
+    with pytest.raises(AssertionError):
+        admit_skill(bundle=_bundle(expected, episode_id="ep-1"), store=store, seed=1, cache=cache)
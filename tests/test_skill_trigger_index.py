@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import random
+
+from eidolon_v16.skills.registry import SkillRecord
+from eidolon_v16.skills.spec import SkillImpl, SkillSpec, TriggerSpec
+from eidolon_v16.skills.trigger_index import KeywordAutomaton, SkillTriggerIndex
+
+
+def _record(name: str, keywords: list[str], family: str | None) -> SkillRecord:
+    spec = SkillSpec(
+        name=name,
+        version="v0",
+        created_ts_utc="2024-01-01T00:00:00Z",
+        origin_episode_id="ep",
+        triggers=TriggerSpec(task_contains=keywords, task_family=family),
+        impl=SkillImpl(kind="bvps_ast", program={"type": "var", "name": "x"}),
+    )
+    return SkillRecord(spec=spec, bundle_dir=f"/skills/{name}")
+
+
+def _linear_matches(
+    records: list[SkillRecord], spec_name: str, prompt: str, task_family: str | None
+) -> list[SkillRecord]:
+    matched = []
+    haystack = f"{spec_name} {prompt}"
+    for record in sorted(records, key=lambda item: item.spec.name):
+        trigger = record.spec.triggers
+        if trigger.task_family and trigger.task_family != task_family:
+            continue
+        if any(keyword and keyword.lower() in haystack for keyword in trigger.task_contains):
+            matched.append(record)
+    return matched
+
+
+def test_keyword_automaton_finds_overlapping_keywords() -> None:
+    automaton = KeywordAutomaton(["he", "she", "his", "hers", ""])
+    assert automaton.find("ushers") == {"she", "he", "hers"}
+    assert automaton.find("") == set()
+
+
+def test_trigger_index_matches_linear_scan() -> None:
+    rng = random.Random(35)
+    alphabet = "abcx_"
+    words = ["".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4))) for _ in range(40)]
+    records = [
+        _record(
+            f"skill_{index:03d}",
+            [
+                rng.choice(words).upper() if rng.random() < 0.2 else rng.choice(words)
+                for _ in range(rng.randint(0, 3))
+            ],
+            rng.choice([None, "", "bvps", "arith"]),
+        )
+        for index in range(200)
+    ]
+    index = SkillTriggerIndex(records)
+    for _ in range(300):
+        spec_name = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 8)))
+        prompt = " ".join(rng.choice(words) for _ in range(rng.randint(0, 5)))
+        family = rng.choice([None, "bvps", "arith"])
+        assert index.candidates(spec_name, prompt, family) == _linear_matches(
+            records, spec_name, prompt, family
+        )